@@ -2,23 +2,27 @@
   AIS parse log to DB.
 """
 # import os
-import sys
+import argparse
 import sqlite3
+from collections import defaultdict
+from itertools import islice
 from pathlib import Path
 from sqlite3 import Error as SQL_Error, Connection
 
-from pyais import decode
+from pyais import decode, NMEAMessage
 #  from pyais import messages
 
 # , IterMessages
 
-from pyais.exceptions import MissingMultipartMessageException
+from pyais.exceptions import InvalidNMEAMessageException, MissingMultipartMessageException, \
+    UnknownMessageException, UnknownPartNoException
 
 # fom pyais.exceptions import TooManyMessagesException, MissingMultipartMessageException
 # from pyais.messages import NMEAMessage, ANY_MESSAGE
 
 
 DEFAULT_DB_FILE = 'ais-data.db'
+DEFAULT_BATCH_SIZE = 10000
 
 
 def get_db_connection(db_file):
@@ -30,23 +34,30 @@ def get_db_connection(db_file):
     return conn
 
 
+RAW_FIELDS_SQL = '''
+    insert into rawFields(sentence_id, field1, field2, field3, field4, field5, field6, field7)
+    values(:sentence_id, :field1, :field2, :field3, :field4, :field5, :field6, :field7)
+'''
+
+
+def raw_fields_args(sentence_id, fields):
+    """ Parameters of a row in the rawFields table. """
+    return {
+        'sentence_id': sentence_id, 'field1': fields[0], 'field2': fields[1], 'field3': fields[2],
+        'field4': fields[3], 'field5': fields[4], 'field6': fields[5], 'field7': fields[6]
+    }
+
+
 def add_field_data(con, s_data):
     """ Add a row to the nemaTable with the sentence fields. """
-    sql = '''
-        insert into rawFields(sentence_id, field1, field2, field3, field4, field5, field6, field7)
-        values(:sentence_id, :field1, :field2, :field3, :field4, :field5, :field6, :field7)
-    '''
     s_id = get_last_sentence_id(con)
     fields = s_data.split(",")
 
     if len(fields) == 7:
         try:
-            sql_args = {
-                'sentence_id': s_id, 'field1': fields[0], 'field2': fields[1], 'field3': fields[2],
-                'field4': fields[3], 'field5': fields[4], 'field6': fields[5], 'field7': fields[6]
-            }
+            sql_args = raw_fields_args(s_id, fields)
             cur = con.cursor()
-            cur.execute(sql, sql_args)
+            cur.execute(RAW_FIELDS_SQL, sql_args)
             con.commit()
         except SQL_Error as error:
             raise SystemExit(
@@ -56,17 +67,19 @@ def add_field_data(con, s_data):
         print("Unable to split sentence data. This should not happen.")
 
 
+RAW_DATA_SQL = '''
+    insert into rawData(s_type, s_data, location_id, hasError)
+    values(:s_type, :s_data, :location_id, :hasError)
+'''
+
+
 def add_raw_data(con, s_type, s_data, has_error):
     """ Add a new sentence to the database raw table. """
-    sql = '''
-        insert into rawData(s_type, s_data, location_id, hasError)
-        values(:s_type, :s_data, :location_id, :hasError)
-    '''
     #  s_row_id = 0
     try:
         sql_args = {'s_type': s_type, 's_data': s_data, 'location_id': 1, 'hasError': has_error}
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(RAW_DATA_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -93,34 +106,40 @@ def get_last_sentence_id(con):
     return sentence_id
 
 
+CLASS_A_POSITION_REPORT_SQL = '''
+    insert into classAPositionReport(
+        sentence_id, msg_type, repeat, mmsi, status, turn, speed,
+        accuracy, lon, lat, course, heading, second, maneuver, raim, radio, 
+        syncState, slotTimeout, subMessage 
+    )
+    values(
+        :sentence_id, :msg_type, :repeat, :mmsi, :status, :turn, :speed,
+        :accuracy, :lon, :lat, :course, :heading, :second, :maneuver, :raim, :radio,
+        :syncState, :slotTimeout, :subMessage
+    )
+'''
+
+
+def class_a_position_report_args(sentence_id, data):
+    """ Parameters of a row in the classAPositionReport table. """
+    return {
+        'sentence_id': sentence_id, 'msg_type': data.msg_type,
+        'repeat': data.repeat, 'mmsi': data.mmsi, 'status': data.status,
+        'turn': data.turn, 'speed': data.speed, 'accuracy': data.accuracy,
+        'lon': data.lon, 'lat': data.lat, 'course': data.course, 'heading': data.heading,
+        'second': data.second, 'maneuver': data.maneuver, 'raim': data.raim,
+        'radio': data.radio, 'syncState': data.sync_state, 'slotTimeout': data.slot_timeout,
+        'subMessage': data.sub_message
+    }
+
+
 def add_class_a_position_report(con, data):
     """ Add the decoded data to an A position report. Types 1, 2, and 3. """
-    sql = '''
-        insert into classAPositionReport(
-            sentence_id, msg_type, repeat, mmsi, status, turn, speed,
-            accuracy, lon, lat, course, heading, second, maneuver, raim, radio, 
-            syncState, slotTimeout, subMessage 
-        )
-        values(
-            :sentence_id, :msg_type, :repeat, :mmsi, :status, :turn, :speed,
-            :accuracy, :lon, :lat, :course, :heading, :second, :maneuver, :raim, :radio,
-            :syncState, :slotTimeout, :subMessage
-        )
-    '''
-
     sentence_id = get_last_sentence_id(con)
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'msg_type': data.msg_type,
-            'repeat': data.repeat, 'mmsi': data.mmsi, 'status': data.status,
-            'turn': data.turn, 'speed': data.speed, 'accuracy': data.accuracy,
-            'lon': data.lon, 'lat': data.lat, 'course': data.course, 'heading': data.heading,
-            'second': data.second, 'maneuver': data.maneuver, 'raim': data.raim,
-            'radio': data.radio, 'syncState': data.sync_state, 'slotTimeout': data.slot_timeout,
-            'subMessage': data.sub_message
-        }
+        sql_args = class_a_position_report_args(sentence_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(CLASS_A_POSITION_REPORT_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -128,27 +147,34 @@ def add_class_a_position_report(con, data):
         )
 
 
+BASE_STATION_REPORT_SQL = '''
+    insert into baseStationReport(
+        sentence_id, msg_type, repeat, mmsi, year, month, day, hour, minute, second, accuracy,
+        lon, lat, epfd, spare_1, raim, radio
+    ) VALUES (
+        :sentence_id, :msg_type, :repeat, :mmsi, :year, :month, :day, :hour, :minute, :second, :accuracy, 
+        :lon, :lat, :epfd, :spare_1, :raim, :radio
+    )
+'''
+
+
+def base_station_report_args(sentence_id, data):
+    """ Parameters of a row in the baseStationReport table. """
+    return {
+        'sentence_id': sentence_id, 'msg_type': data.msg_type, 'repeat': data.repeat, 'mmsi': data.mmsi,
+        'year': data.year, 'month': data.month, 'day': data.day, 'hour': data.hour, 'minute': data.minute,
+        'second': data.second, 'accuracy': data.accuracy, 'lon': data.lon, 'lat': data.lat,
+        'epfd': data.epfd, 'spare_1': data.spare_1, 'raim': data.raim, 'radio': data.radio
+    }
+
+
 def add_base_station_report(con, data):
     """ Add the decoded data to a base_station_report.  Type 4. """
-    sql = '''
-        insert into baseStationReport(
-            sentence_id, msg_type, repeat, mmsi, year, month, day, hour, minute, second, accuracy,
-            lon, lat, epfd, spare_1, raim, radio
-        ) VALUES (
-            :sentence_id, :msg_type, :repeat, :mmsi, :year, :month, :day, :hour, :minute, :second, :accuracy, 
-            :lon, :lat, :epfd, :spare_1, :raim, :radio
-        )
-    '''
     sentence_id = get_last_sentence_id(con)
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'msg_type': data.msg_type, 'repeat': data.repeat, 'mmsi': data.mmsi,
-            'year': data.year, 'month': data.month, 'day': data.day, 'hour': data.hour, 'minute': data.minute,
-            'second': data.second, 'accuracy': data.accuracy, 'lon': data.lon, 'lat': data.lat,
-            'epfd': data.epfd, 'spare_1': data.spare_1, 'raim': data.raim, 'radio': data.radio
-        }
+        sql_args = base_station_report_args(sentence_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(BASE_STATION_REPORT_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -156,35 +182,42 @@ def add_base_station_report(con, data):
         )
 
 
+CLASS_B_POSITION_REPORT_SQL = '''
+    insert into classBPositionReport(
+        sentence_id, msg_type, repeat, mmsi, speed, accuracy, lon, lat, 
+        course, heading, second, cs, display, dsc, band, msg22, assigned,
+        raim, radio
+    )
+    values(
+        :sentence_id, :msg_type, :repeat, :mmsi, :speed, :accuracy, :lon, :lat, 
+        :course, :heading, :second, :cs, :display, :dsc, :band, :msg22, :assigned,  
+        :raim, :radio
+    )
+'''
+
+
+def class_b_position_report_args(sentence_id, data):
+    """ Parameters of a row in the classBPositionReport table. """
+    return {
+        'sentence_id': sentence_id, 'msg_type': data.msg_type,
+        'repeat': data.repeat, 'mmsi': data.mmsi,
+        'speed': data.speed, 'accuracy': data.accuracy,
+        'lon': data.lon, 'lat': data.lat, 'course': data.course,
+        'heading': data.heading, 'second': data.second,
+        'cs': data.cs, 'display': data.display, 'dsc': data.dsc,
+        'band': data.band, 'msg22': data.msg22,
+        'assigned': data.assigned,
+        'raim': data.raim, 'radio': data.radio
+    }
+
+
 def add_class_b_position_report(con, data):
     """ Add the decoded data to an B position report. Type 18. """
-    sql = '''
-        insert into classBPositionReport(
-            sentence_id, msg_type, repeat, mmsi, speed, accuracy, lon, lat, 
-            course, heading, second, cs, display, dsc, band, msg22, assigned,
-            raim, radio
-        )
-        values(
-            :sentence_id, :msg_type, :repeat, :mmsi, :speed, :accuracy, :lon, :lat, 
-            :course, :heading, :second, :cs, :display, :dsc, :band, :msg22, :assigned,  
-            :raim, :radio
-        )
-    '''
     sentence_id = get_last_sentence_id(con)
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'msg_type': data.msg_type,
-            'repeat': data.repeat, 'mmsi': data.mmsi,
-            'speed': data.speed, 'accuracy': data.accuracy,
-            'lon': data.lon, 'lat': data.lat, 'course': data.course,
-            'heading': data.heading, 'second': data.second,
-            'cs': data.cs, 'display': data.display, 'dsc': data.dsc,
-            'band': data.band, 'msg22': data.msg22,
-            'assigned': data.assigned,
-            'raim': data.raim, 'radio': data.radio
-        }
+        sql_args = class_b_position_report_args(sentence_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(CLASS_B_POSITION_REPORT_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -192,36 +225,43 @@ def add_class_b_position_report(con, data):
         )
 
 
+EXTENDED_CLASS_B_POSITION_REPORT_SQL = '''
+    insert into extendedClassBPositionReport(
+        sentence_id, msg_type, repeat, reserved_1, speed, accuracy, lon, lat, course, heading, 
+        second, reserved_2, shipname, ship_type, to_bow, to_stern, to_port, to_starboard, epfd, 
+        raim, dte, assigned, spare_1
+    )
+    values (
+        :sentence_id, :msg_type, :repeat, :reserved_1, :speed, :accuracy, :lon, :lat, :course, :heading, 
+        :second, :reserved_2, :shipname, :ship_type, :to_bow, :to_stern, :to_port, :to_starboard, :epfd, 
+        :raim, :dte, :assigned, :spare_1
+    )
+'''
+
+
+def extended_class_b_position_report_args(sentence_id, data):
+    """ Parameters of a row in the extendedClassBPositionReport table. """
+    return {
+        'sentence_id': sentence_id, 'msg_type': data.msg_type,
+        'repeat': data.repeat, 'reserved_1': data.reserved_1,
+        'speed': data.speed, 'accuracy': data.accuracy,
+        'lon': data.lon, 'lat': data.lat, 'course': data.course,
+        'heading': data.heading, 'second': data.second,
+        'reserved_2': data.reserved_2, 'shipname': data.shipname,
+        'ship_type': data.ship_type, 'to_bow': data.to_bow, 'to_stern': data.to_stern,
+        'to_port': data.to_port, 'to_starboard': data.to_starboard,
+        'epfd': data.epfd, 'raim': data.raim, 'dte': data.dte,
+        'assigned': data.assigned, 'spare_1': data.spare_1
+    }
+
+
 def add_extended_class_b_position_report(con, data):
     """ Add extended class b position report. Type 19. """
-    sql = '''
-        insert into extendedClassBPositionReport(
-            sentence_id, msg_type, repeat, reserved_1, speed, accuracy, lon, lat, course, heading, 
-            second, reserved_2, shipname, ship_type, to_bow, to_stern, to_port, to_starboard, epfd, 
-            raim, dte, assigned, spare_1
-        )
-        values (
-            :sentence_id, :msg_type, :repeat, :reserved_1, :speed, :accuracy, :lon, :lat, :course, :heading, 
-            :second, :reserved_2, :shipname, :ship_type, :to_bow, :to_stern, :to_port, :to_starboard, :epfd, 
-            :raim, :dte, :assigned, :spare_1
-        )
-    '''
     sentence_id = get_last_sentence_id(con)
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'msg_type': data.msg_type,
-            'repeat': data.repeat, 'reserved_1': data.reserved_1,
-            'speed': data.speed, 'accuracy': data.accuracy,
-            'lon': data.lon, 'lat': data.lat, 'course': data.course,
-            'heading': data.heading, 'second': data.second,
-            'reserved_2': data.reserved_2, 'shipname': data.shipname,
-            'ship_type': data.ship_type, 'to_bow': data.to_bow, 'to_stern': data.to_stern,
-            'to_port': data.to_port, 'to_starboard': data.to_starboard,
-            'epfd': data.epfd, 'raim': data.raim, 'dte': data.dte,
-            'assigned': data.assigned, 'spare_1': data.spare_1
-        }
+        sql_args = extended_class_b_position_report_args(sentence_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(EXTENDED_CLASS_B_POSITION_REPORT_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -265,16 +305,18 @@ def get_last_row_id(con, table_name):
     return row_id
 
 
+UPDATE_STATIC_DATA_REPORT_CHILD_SQL = '''
+    update staticDataReport set child_id = :child_id
+    where report_id = :parent_id
+'''
+
+
 def update_static_data_report_child(con, parent_id, child_id):
     """ Update the child id in the staticDataReport table after the child was inserted. """
-    sql = '''
-        update staticDataReport set child_id = :child_id
-        where report_id = :parent_id
-    '''
     try:
         sql_args = {'child_id': child_id, 'parent_id': parent_id}
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(UPDATE_STATIC_DATA_REPORT_CHILD_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -282,25 +324,32 @@ def update_static_data_report_child(con, parent_id, child_id):
         )
 
 
+STATIC_DATA_REPORT_SQL = '''
+    insert into staticDataReport(
+        sentence_id, msg_type, repeat, mmsi, partno, child_id
+    )
+    values(
+        :sentence_id, :msg_type, :repeat, :mmsi, :partno, :child_id
+    )
+'''
+
+
+def static_data_report_args(sentence_id, data, child_id):
+    """ Parameters of a row in the staticDataReport table. """
+    return {
+        'sentence_id': sentence_id, 'msg_type': data.msg_type, 'repeat': data.repeat,
+        'mmsi': data.mmsi, 'partno': data.partno, 'child_id': child_id
+    }
+
+
 def add_static_data_report(con, data):
     """ Add a static data report that is split based on the part number. Type: 24X """
-    sql = '''
-        insert into staticDataReport(
-            sentence_id, msg_type, repeat, mmsi, partno, child_id
-        )
-        values(
-            :sentence_id, :msg_type, :repeat, :mmsi, :partno, :child_id
-        )
-    '''
     sentence_id = get_last_sentence_id(con)
     child_id = 0
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'msg_type': data.msg_type, 'repeat': data.repeat,
-            'mmsi': data.mmsi, 'partno': data.partno, 'child_id': child_id
-        }
+        sql_args = static_data_report_args(sentence_id, data, child_id)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(STATIC_DATA_REPORT_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -321,23 +370,30 @@ def add_static_data_report(con, data):
         print("WARNING invalid partno in data - {}".format(data.partno))
 
 
+STATIC_DATA_REPORT_A_SQL = '''
+    insert into staticDataReportA(
+        sentence_id, parent_id, mmsi, shipname, spare_1
+    )
+    values(
+        :sentence_id, :parent_id, :mmsi, :shipname, :spare_1
+    ) 
+'''
+
+
+def static_data_report_a_args(sentence_id, parent_id, data):
+    """ Parameters of a row in the staticDataReportA table. """
+    return {
+        'sentence_id': sentence_id,  'parent_id': parent_id, 'mmsi': data.mmsi,
+        'shipname': data.shipname, 'spare_1': data.spare_1
+    }
+
+
 def add_static_data_report_a(con, sentence_id, parent_id, data):
     """ Add the static data report. Type: 24A. """
-    sql = '''
-        insert into staticDataReportA(
-            sentence_id, parent_id, mmsi, shipname, spare_1
-        )
-        values(
-            :sentence_id, :parent_id, :mmsi, :shipname, :spare_1
-        ) 
-    '''
     try:
-        sql_args = {
-            'sentence_id': sentence_id,  'parent_id': parent_id, 'mmsi': data.mmsi,
-            'shipname': data.shipname, 'spare_1': data.spare_1
-        }
+        sql_args = static_data_report_a_args(sentence_id, parent_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(STATIC_DATA_REPORT_A_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -345,27 +401,34 @@ def add_static_data_report_a(con, sentence_id, parent_id, data):
         )
 
 
+STATIC_DATA_REPORT_B_SQL = '''
+    insert into staticDataReportB(
+        sentence_id, parent_id, mmsi, ship_type, vendorid, model, serial, callsign, 
+        to_bow, to_stern, to_port, to_starboard, spare_1
+    )
+    values(
+        :sentence_id, :parent_id, :mmsi, :ship_type, :vendorid, :model, :serial, :callsign, 
+        :to_bow, :to_stern, :to_port, :to_starboard, :spare_1
+    ) 
+'''
+
+
+def static_data_report_b_args(sentence_id, parent_id, data):
+    """ Parameters of a row in the staticDataReportB table. """
+    return {
+        'sentence_id': sentence_id, 'parent_id': parent_id, 'mmsi': data.mmsi, 'ship_type': data.ship_type,
+        'vendorid': data.vendorid, 'model': data.model, 'serial': data.serial,
+        'callsign': data.callsign, 'to_bow': data.to_bow, 'to_stern': data.to_stern,
+        'to_port': data.to_port, 'to_starboard': data.to_starboard, 'spare_1': data.spare_1
+    }
+
+
 def add_static_data_report_b(con, sentence_id, parent_id, data):
     """ Add the static data report. Type: 24B. """
-    sql = '''
-        insert into staticDataReportB(
-            sentence_id, parent_id, mmsi, ship_type, vendorid, model, serial, callsign, 
-            to_bow, to_stern, to_port, to_starboard, spare_1
-        )
-        values(
-            :sentence_id, :parent_id, :mmsi, :ship_type, :vendorid, :model, :serial, :callsign, 
-            :to_bow, :to_stern, :to_port, :to_starboard, :spare_1
-        ) 
-    '''
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'parent_id': parent_id, 'mmsi': data.mmsi, 'ship_type': data.ship_type,
-            'vendorid': data.vendorid, 'model': data.model, 'serial': data.serial,
-            'callsign': data.callsign, 'to_bow': data.to_bow, 'to_stern': data.to_stern,
-            'to_port': data.to_port, 'to_starboard': data.to_starboard, 'spare_1': data.spare_1
-        }
+        sql_args = static_data_report_b_args(sentence_id, parent_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(STATIC_DATA_REPORT_B_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -373,32 +436,39 @@ def add_static_data_report_b(con, sentence_id, parent_id, data):
         )
 
 
+CLASS_A_STATIC_VOYAGE_DATA_SQL = '''
+    insert into classAStaticVoyageData(
+        sentence_id, msg_type, mmsi, ais_version, imo, callsign, shipname, 
+        ship_type, to_bow, to_stern, to_port, to_starboard, epfd, 
+        month, day, hour, minute, draught, destination, dte, spare_1
+    )
+    values(
+        :sentence_id, :msg_type, :mmsi, :ais_version, :imo, :callsign, :shipname, 
+        :ship_type, :to_bow, :to_stern, :to_port, :to_starboard, :epfd, 
+        :month, :day, :hour, :minute, :draught, :destination, :dte, :spare_1
+    )
+'''
+
+
+def class_a_static_voyage_data_args(sentence_id, data):
+    """ Parameters of a row in the classAStaticVoyageData table. """
+    return {
+        'sentence_id': sentence_id, 'msg_type': data.msg_type, 'mmsi': data.mmsi, 'ais_version': data.ais_version,
+        'imo': data.imo, 'callsign': data.callsign, 'shipname': data.shipname, 'ship_type': data.ship_type,
+        'to_bow': data.to_bow, 'to_stern': data.to_stern, 'to_port': data.to_port,
+        'to_starboard': data.to_starboard, 'epfd': data.epfd, 'month': data.month, 'day': data.day,
+        'hour': data.hour, 'minute': data.minute, 'draught': data.draught, 'destination': data.destination,
+        'dte': data.dte, 'spare_1': data.spare_1
+    }
+
+
 def add_class_a_static_voyage_data(con, data):
     """ Add the class a static voyage data report. Type: 5"""
-    sql = '''
-        insert into classAStaticVoyageData(
-            sentence_id, msg_type, mmsi, ais_version, imo, callsign, shipname, 
-            ship_type, to_bow, to_stern, to_port, to_starboard, epfd, 
-            month, day, hour, minute, draught, destination, dte, spare_1
-        )
-        values(
-            :sentence_id, :msg_type, :mmsi, :ais_version, :imo, :callsign, :shipname, 
-            :ship_type, :to_bow, :to_stern, :to_port, :to_starboard, :epfd, 
-            :month, :day, :hour, :minute, :draught, :destination, :dte, :spare_1
-        )
-    '''
     sentence_id = get_last_sentence_id(con)
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'msg_type': data.msg_type, 'mmsi': data.mmsi, 'ais_version': data.ais_version,
-            'imo': data.imo, 'callsign': data.callsign, 'shipname': data.shipname, 'ship_type': data.ship_type,
-            'to_bow': data.to_bow, 'to_stern': data.to_stern, 'to_port': data.to_port,
-            'to_starboard': data.to_starboard, 'epfd': data.epfd, 'month': data.month, 'day': data.day,
-            'hour': data.hour, 'minute': data.minute, 'draught': data.draught, 'destination': data.destination,
-            'dte': data.dte, 'spare_1': data.spare_1
-        }
+        sql_args = class_a_static_voyage_data_args(sentence_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(CLASS_A_STATIC_VOYAGE_DATA_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -406,33 +476,40 @@ def add_class_a_static_voyage_data(con, data):
         )
 
 
+AID_TO_NAVIGATION_REPORT_SQL = '''
+    insert into aidToNavigationReport(
+        sentence_id, msg_type, repeat, mmsi, aid_type, name, accuracy, lon, lat, 
+        to_bow, to_stern, to_port, to_starboard, epfd, second, off_position, 
+        reserved_1, raim, virtual_aid, assigned, spare_1, name_ext
+    )
+    values(
+        :sentence_id, :msg_type, :repeat, :mmsi, :aid_type, :name, :accuracy, :lon, :lat, 
+        :to_bow, :to_stern, :to_port, :to_starboard, :epfd, :second, :off_position, 
+        :reserved_1, :raim, :virtual_aid, :assigned, :spare_1, :name_ext
+    ) 
+'''
+
+
+def aid_to_navigation_report_args(sentence_id, data):
+    """ Parameters of a row in the aidToNavigationReport table. """
+    return {
+        'sentence_id': sentence_id, 'msg_type': data.msg_type, 'repeat': data.repeat,
+        'mmsi': data.mmsi, 'aid_type': data.aid_type, 'name': data.name, 'accuracy': data.accuracy,
+        'lon': data.lon, 'lat': data.lat, 'to_bow': data.to_bow, 'to_stern': data.to_stern,
+        'to_port': data.to_port, 'to_starboard': data.to_starboard, 'epfd': data.epfd,
+        'second': data.second, 'off_position': data.off_position, 'reserved_1': data.reserved_1,
+        'raim': data.raim, 'virtual_aid': data.virtual_aid, 'assigned': data.assigned,
+        'spare_1': data.spare_1, 'name_ext': data.name_ext
+    }
+
+
 def add_aid_to_navigation_report(con, data):
     """ Add the aid to navigation report. Type: 21 """
-    sql = '''
-        insert into aidToNavigationReport(
-            sentence_id, msg_type, repeat, mmsi, aid_type, name, accuracy, lon, lat, 
-            to_bow, to_stern, to_port, to_starboard, epfd, second, off_position, 
-            reserved_1, raim, virtual_aid, assigned, spare_1, name_ext
-        )
-        values(
-            :sentence_id, :msg_type, :repeat, :mmsi, :aid_type, :name, :accuracy, :lon, :lat, 
-            :to_bow, :to_stern, :to_port, :to_starboard, :epfd, :second, :off_position, 
-            :reserved_1, :raim, :virtual_aid, :assigned, :spare_1, :name_ext
-        ) 
-    '''
     sentence_id = get_last_sentence_id(con)
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'msg_type': data.msg_type, 'repeat': data.repeat,
-            'mmsi': data.mmsi, 'aid_type': data.aid_type, 'name': data.name, 'accuracy': data.accuracy,
-            'lon': data.lon, 'lat': data.lat, 'to_bow': data.to_bow, 'to_stern': data.to_stern,
-            'to_port': data.to_port, 'to_starboard': data.to_starboard, 'epfd': data.epfd,
-            'second': data.second, 'off_position': data.off_position, 'reserved_1': data.reserved_1,
-            'raim': data.raim, 'virtual_aid': data.virtual_aid, 'assigned': data.assigned,
-            'spare_1': data.spare_1, 'name_ext': data.name_ext
-        }
+        sql_args = aid_to_navigation_report_args(sentence_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(AID_TO_NAVIGATION_REPORT_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -440,31 +517,38 @@ def add_aid_to_navigation_report(con, data):
         )
 
 
+STANDARD_SAR_AIRCRAFT_POSITION_REPORT_SQL = '''
+    insert into standardSARAircraftPositionReport(
+        sentence_id, msg_type, repeat, mmsi, alt, speed, accuracy, 
+        lon, lat, course, second, reserved_1, dte, spare_1, 
+        assigned, raim, radio
+    )
+    values (
+        :sentence_id, :msg_type, :repeat, :mmsi, :alt, :speed, :accuracy, 
+        :lon, :lat, :course, :second, :reserved_1, :dte, :spare_1, 
+        :assigned, :raim, :radio      
+    ) 
+'''
+
+
+def standard_sar_aircraft_position_report_args(sentence_id, data):
+    """ Parameters of a row in the standardSARAircraftPositionReport table. """
+    return {
+        'sentence_id': sentence_id, 'msg_type': data.msg_type, 'repeat': data.repeat,
+        'mmsi': data.mmsi, 'alt': data.alt, 'speed': data.speed, 'accuracy': data.accuracy,
+        'lon': data.lon, 'lat': data.lat, 'course': data.course, 'second': data.second,
+        'reserved_1': data.reserved_1, 'dte': data.dte, 'spare_1': data.spare_1,
+        'assigned': data.assigned, 'raim': data.raim, 'radio': data.radio
+    }
+
+
 def add_standard_sar_aircraft_position_report(con, data):
     """ Add standard SAR aircraft position report. Type: 9 """
-    sql = '''
-        insert into standardSARAircraftPositionReport(
-            sentence_id, msg_type, repeat, mmsi, alt, speed, accuracy, 
-            lon, lat, course, second, reserved_1, dte, spare_1, 
-            assigned, raim, radio
-        )
-        values (
-            :sentence_id, :msg_type, :repeat, :mmsi, :alt, :speed, :accuracy, 
-            :lon, :lat, :course, :second, :reserved_1, :dte, :spare_1, 
-            :assigned, :raim, :radio      
-        ) 
-    '''
     sentence_id = get_last_sentence_id(con)
     try:
-        sql_args = {
-            'sentence_id': sentence_id, 'msg_type': data.msg_type, 'repeat': data.repeat,
-            'mmsi': data.mmsi, 'alt': data.alt, 'speed': data.speed, 'accuracy': data.accuracy,
-            'lon': data.lon, 'lat': data.lat, 'course': data.course, 'second': data.second,
-            'reserved_1': data.reserved_1, 'dte': data.dte, 'spare_1': data.spare_1,
-            'assigned': data.assigned, 'raim': data.raim, 'radio': data.radio
-        }
+        sql_args = standard_sar_aircraft_position_report_args(sentence_id, data)
         cur = con.cursor()
-        cur.execute(sql, sql_args)
+        cur.execute(STANDARD_SAR_AIRCRAFT_POSITION_REPORT_SQL, sql_args)
         con.commit()
     except SQL_Error as error:
         raise SystemExit(
@@ -518,23 +602,168 @@ def parse_ais_file(con, ais_file_name):
             for line in file_in:
                 count += 1
                 if line.startswith("!AI"):
-                    try:
-                        decoded = decode(line)
-                        add_raw_data(con, decoded.msg_type, line, 0)
+                    s_type, has_error, decoded = decode_line(line)
+                    add_raw_data(con, s_type, line, has_error)
+                    if decoded is not None:
                         add_decoded_data(con, decoded)
-                    except MissingMultipartMessageException as warning:
-                        # print("WARNING! {}".format(warning))
-                        # Warning during decode so set error flag.
-                        add_raw_data(con, decoded.msg_type, line, 1)
-                    # print(decoded)
-                    # print(line, end='')
                 if count % 100 == 0:
                     print(".", end='')
         except IOError as error:
             raise SystemExit('ERROR while reading file = {}'.format(error))
 
 
-def main(ais_file_name, db_file):
+def set_bulk_load_pragmas(con):
+    """
+    Configure the connection for bulk loads.
+    With a write ahead log and synchronous=NORMAL commits do not wait for an fsync.
+    The database stays consistent, but the last transactions may be lost after a power failure.
+    """
+    pragmas = [
+        'pragma journal_mode = WAL',
+        'pragma synchronous = NORMAL',
+        'pragma temp_store = MEMORY',
+        'pragma cache_size = -65536',
+    ]
+    try:
+        cur = con.cursor()
+        for sql in pragmas:
+            cur.execute(sql)
+    except SQL_Error as error:
+        raise SystemExit('\n\nERROR while setting pragmas - {}\n\n'.format(error))
+
+
+# Message types that are stored as a single row: msg_type -> (sql, function that returns the parameters)
+BULK_REPORTS = {
+    1: (CLASS_A_POSITION_REPORT_SQL, class_a_position_report_args),
+    2: (CLASS_A_POSITION_REPORT_SQL, class_a_position_report_args),
+    3: (CLASS_A_POSITION_REPORT_SQL, class_a_position_report_args),
+    4: (BASE_STATION_REPORT_SQL, base_station_report_args),
+    5: (CLASS_A_STATIC_VOYAGE_DATA_SQL, class_a_static_voyage_data_args),
+    9: (STANDARD_SAR_AIRCRAFT_POSITION_REPORT_SQL, standard_sar_aircraft_position_report_args),
+    18: (CLASS_B_POSITION_REPORT_SQL, class_b_position_report_args),
+    19: (EXTENDED_CLASS_B_POSITION_REPORT_SQL, extended_class_b_position_report_args),
+    21: (AID_TO_NAVIGATION_REPORT_SQL, aid_to_navigation_report_args),
+}
+
+
+class BulkLoader:
+    """
+    Writes the same rows as add_raw_data and add_decoded_data, but without a commit per row.
+    Rows are collected per table and written with executemany() when flush() is called.
+    Every flush is a single transaction.
+    Sentence and report ids are taken from cursor.lastrowid instead of querying the max id.
+    """
+
+    def __init__(self, con):
+        self.con = con
+        self.cur = con.cursor()
+        self.rows = defaultdict(list)
+
+    def _insert(self, sql, sql_args):
+        """ Insert a single row right away and return its rowid. """
+        self.cur.execute(sql, sql_args)
+        return self.cur.lastrowid
+
+    def add(self, s_type, s_data, has_error, data=None):
+        """ Add a sentence and - if it could be decoded - its decoded data. """
+        sentence_id = self._insert(
+            RAW_DATA_SQL, {'s_type': s_type, 's_data': s_data, 'location_id': 1, 'hasError': has_error}
+        )
+
+        fields = s_data.split(",")
+        if len(fields) == 7:
+            self.rows[RAW_FIELDS_SQL].append(raw_fields_args(sentence_id, fields))
+        else:
+            print("Unable to split sentence data. This should not happen.")
+
+        if data is not None:
+            self.add_decoded_data(sentence_id, data)
+
+    def add_decoded_data(self, sentence_id, data):
+        """ Store appropriate record based on type. See add_decoded_data(). """
+        msg_type = data.msg_type
+        if msg_type in BULK_REPORTS:
+            sql, args = BULK_REPORTS[msg_type]
+            self.rows[sql].append(args(sentence_id, data))
+        elif msg_type == 24:
+            parent_id = self._insert(STATIC_DATA_REPORT_SQL, static_data_report_args(sentence_id, data, 0))
+            if data.partno == 0:
+                child_id = self._insert(STATIC_DATA_REPORT_A_SQL, static_data_report_a_args(sentence_id, parent_id, data))
+            elif data.partno == 1:
+                child_id = self._insert(STATIC_DATA_REPORT_B_SQL, static_data_report_b_args(sentence_id, parent_id, data))
+            else:
+                print("WARNING invalid partno in data - {}".format(data.partno))
+                return
+            self.rows[UPDATE_STATIC_DATA_REPORT_CHILD_SQL].append({'child_id': child_id, 'parent_id': parent_id})
+
+    def flush(self):
+        """ Write all collected rows and commit the transaction. """
+        try:
+            for sql, rows in self.rows.items():
+                self.cur.executemany(sql, rows)
+            self.con.commit()
+        except SQL_Error as error:
+            raise SystemExit(
+                '\n\nERROR during bulk insert = {}\n\n'.format(error)
+            )
+        self.rows.clear()
+
+
+# Errors of lines that can not be decoded on their own. These lines are stored with the error flag set.
+DECODE_ERRORS = (
+    MissingMultipartMessageException, InvalidNMEAMessageException, UnknownMessageException,
+    UnknownPartNoException, ValueError
+)
+
+
+def sentence_type(line):
+    """
+    The message type of a line that could not be decoded. 0 if the line is malformed or a later fragment
+    of a multipart message, because only the first fragment starts with the message type.
+    """
+    try:
+        msg = NMEAMessage(line.encode())
+        return msg.ais_id if msg.frag_num == 1 else 0
+    except (InvalidNMEAMessageException, ValueError):
+        return 0
+
+
+def decode_line(line):
+    """ Decode a single line. Returns the message type, the error flag and the decoded data (or None). """
+    try:
+        decoded = decode(line)
+    except DECODE_ERRORS:
+        # Multipart fragments and malformed lines can not be decoded, so set error flag.
+        return sentence_type(line), 1, None
+    return decoded.msg_type, 0, decoded
+
+
+def parse_ais_file_bulk(con, ais_file_name, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Same as parse_ais_file, but decodes and stores the file in batches of `batch_size` lines.
+    Each batch is written in a single transaction. The rows of a partial batch are written as well,
+    if reading the file fails.
+    """
+    set_bulk_load_pragmas(con)
+    loader = BulkLoader(con)
+    with open(ais_file_name) as file_in:
+        try:
+            while True:
+                lines = list(islice(file_in, batch_size))
+                if not lines:
+                    break
+                decoded = [(line, decode_line(line)) for line in lines if line.startswith("!AI")]
+                for line, (s_type, has_error, data) in decoded:
+                    loader.add(s_type, line, has_error, data)
+                loader.flush()
+                print(".", end='', flush=True)
+        except IOError as error:
+            # Keep the rows of the partial batch that was read before the error
+            loader.flush()
+            raise SystemExit('ERROR while reading file = {}'.format(error))
+
+
+def main(ais_file_name, db_file, bulk=False, batch_size=DEFAULT_BATCH_SIZE):
     """ Run as a program. """
     conn = get_db_connection(db_file)
     if conn is not None:
@@ -542,7 +771,10 @@ def main(ais_file_name, db_file):
         if file_path.is_file():
             print("is a file: {}".format(file_path))
         if file_path.exists():
-            parse_ais_file(conn, file_path)
+            if bulk:
+                parse_ais_file_bulk(conn, file_path, batch_size)
+            else:
+                parse_ais_file(conn, file_path)
         else:
             raise SystemExit(
                 'Unable to read from file: {}'.format(ais_file_name)
@@ -559,11 +791,10 @@ def main(ais_file_name, db_file):
 
 
 if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print("Usage: {} {} {}", sys.argv[0], "/path/to/ais_log_file", "/path/to/ais.db")
-        sys.exit(1)
-    if len(sys.argv) == 3:
-        database_file = sys.argv[2]
-    else:
-        database_file = DEFAULT_DB_FILE
-    main(sys.argv[1], database_file)
+    parser = argparse.ArgumentParser(description="Parse an AIS log file into a database.")
+    parser.add_argument('ais_log_file', help="/path/to/ais_log_file")
+    parser.add_argument('database_file', nargs='?', default=DEFAULT_DB_FILE, help="/path/to/ais.db")
+    parser.add_argument('--bulk', action='store_true', help="Insert in batches with one transaction per batch")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="Number of lines per batch")
+    args = parser.parse_args()
+    main(args.ais_log_file, args.database_file, args.bulk, args.batch_size)
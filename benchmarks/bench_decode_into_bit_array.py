@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for `pyais.util.decode_into_bit_array`.
+
+Compares the previous per-character implementation with the current table driven one.
+The payloads are taken from `tests/nmea_data_sample.txt`.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_decode_into_bit_array.py
+"""
+import pathlib
+import timeit
+import typing
+
+from bitarray import bitarray
+
+from pyais.util import decode_into_bit_array
+
+SAMPLE_FILE = pathlib.Path(__file__).parent.parent.joinpath('tests', 'nmea_data_sample.txt')
+
+
+def legacy_decode_into_bit_array(data: bytes, fill_bits: int = 0) -> bitarray:
+    """The implementation prior to the table driven decoder. Kept here as a reference."""
+    bit_arr = bitarray()
+    length = len(data)
+    for i, c in enumerate(data):
+        if c < 0x30 or c > 0x77 or 0x57 < c < 0x6:
+            raise ValueError(f"Invalid character: {chr(c)}")
+
+        # Convert 8 bit binary to 6 bit binary
+        c -= 0x30 if (c < 0x60) else 0x38
+        c &= 0x3F
+
+        if i == length - 1 and fill_bits:
+            # The last part be shorter than 6 bits and contain fill bits
+            c = c >> fill_bits
+            bit_arr += bitarray(f'{c:b}'.zfill(6 - fill_bits))
+        else:
+            bit_arr += bitarray(f'{c:06b}')
+
+    return bit_arr
+
+
+def load_payloads() -> typing.List[typing.Tuple[bytes, int]]:
+    """Extract (payload, fill_bits) tuples from every valid line of the sample file."""
+    payloads = []
+    with open(SAMPLE_FILE, 'rb') as fd:
+        for line in fd:
+            parts = line.strip().split(b',')
+            if len(parts) != 7 or not parts[5]:
+                continue
+            payloads.append((parts[5], int(chr(parts[6][0]))))
+    return payloads
+
+
+def run(number: int = 50) -> None:
+    payloads = load_payloads()
+
+    # Both implementations must yield the same result
+    for payload, fill_bits in payloads:
+        assert legacy_decode_into_bit_array(payload, fill_bits) == decode_into_bit_array(payload, fill_bits)
+
+    for name, func in (('legacy', legacy_decode_into_bit_array), ('table', decode_into_bit_array)):
+        elapsed = timeit.timeit(lambda: [func(p, f) for p, f in payloads], number=number)
+        per_call = elapsed / (number * len(payloads)) * 1e6
+        print(f"{name:>8}: {per_call:8.3f} us/payload ({len(payloads)} payloads x {number} rounds)")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,90 @@
+"""
+Micro-benchmark for `pyais.messages.Payload.encode`.
+
+Compares the previous bitarray based encoder, which built a bitarray per field and
+armored it chunk by chunk, with the compiled encoders that pack all fields into a single
+integer and armor it with a lookup table.
+The messages are decoded from `tests/nmea_data_sample.txt`.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_encode.py
+"""
+import pathlib
+import timeit
+import typing
+
+from pyais.messages import ANY_MESSAGE, Payload
+from pyais.stream import FileReaderStream
+from pyais.util import PAYLOAD_ARMOR, bitarray, bytes2bits, chunks, from_bytes, int_to_bin, to_six_bit
+
+SAMPLE_FILE = pathlib.Path(__file__).parent.parent.joinpath('tests', 'nmea_data_sample.txt')
+
+
+def legacy_str_to_bin(val: str, width: int) -> bitarray:
+    out = bitarray(endian='big')
+    num_chars = int(width / 6)
+    for _ in range(num_chars - len(val)):
+        val += "@"
+    for char in val[:num_chars]:
+        out += bitarray(to_six_bit(char))
+    return out
+
+
+def legacy_encode(payload: Payload) -> typing.Tuple[str, int]:
+    """The encoder prior to the compiled encoders. Kept here as a reference."""
+    out = bitarray()
+    for field in payload.fields():
+        width = field.metadata['width']
+        d_type = field.metadata['d_type']
+        converter = field.metadata['from_converter']
+        signed = field.metadata['signed']
+
+        val = getattr(payload, field.name)
+        if val is None:
+            continue
+        val = converter(val) if converter is not None else val
+
+        if d_type in (bool, int):
+            bits = int_to_bin(val, width, signed=signed)
+        elif d_type == float:
+            bits = int_to_bin(int(val), width, signed=signed)
+        elif d_type == str:
+            bits = legacy_str_to_bin(val, width)
+        else:
+            bits = bytes2bits(val, default=bitarray('0' * width))
+        out += bits[:width]
+
+    armored = ""
+    padding = 0
+    for chunk in chunks(out, 6):
+        padding = 6 - len(chunk)
+        armored += PAYLOAD_ARMOR[from_bytes(chunk.tobytes()) >> 2]  # type: ignore
+    return armored, padding
+
+
+def load_messages() -> typing.List[ANY_MESSAGE]:
+    """Decode every message of the sample file."""
+    messages = []
+    for msg in FileReaderStream(str(SAMPLE_FILE)):
+        try:
+            messages.append(msg.decode())
+        except Exception:
+            continue
+    return messages
+
+
+def run(number: int = 20) -> None:
+    messages = load_messages()
+
+    # Both implementations must yield the same result
+    for msg in messages:
+        assert legacy_encode(msg) == msg.encode()
+
+    for name, func in (('legacy', legacy_encode), ('compiled', Payload.encode)):
+        elapsed = timeit.timeit(lambda: [func(m) for m in messages], number=number)
+        per_call = elapsed / (number * len(messages)) * 1e6
+        print(f"{name:>8}: {per_call:8.3f} us/message ({len(messages)} messages x {number} rounds)")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,94 @@
+"""
+Memory benchmark for `pyais.stream.FileReaderStream`.
+
+Generates a synthetic file of the given size by repeating `tests/nmea_data_sample.txt`
+and iterates over it once with the previous `readlines()` based reader and once with
+the lazy reader. Every run happens in a fresh subprocess, so that the reported peak
+resident set size (RSS) is not distorted by the other run.
+
+Besides the peak RSS the time until the first message was yielded and the total time
+are reported. Be aware that the legacy reader needs several times the file size in memory.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_file_stream_memory.py --size-mb 2048
+    PYTHONPATH=. python benchmarks/bench_file_stream_memory.py --size-mb 256 --only lazy
+"""
+import argparse
+import os
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+from pyais.stream import FileReaderStream
+
+SAMPLE_FILE = pathlib.Path(__file__).parent.parent.joinpath('tests', 'nmea_data_sample.txt')
+READERS = ('legacy', 'lazy')
+
+
+class LegacyFileReaderStream(FileReaderStream):
+    """The reader prior to lazy reading. Kept here as a reference."""
+
+    def read(self) -> typing.Generator[bytes, None, None]:
+        yield from self._fobj.readlines()
+
+
+def generate_file(path: str, size_mb: int) -> None:
+    """Write the sample file repeatedly until the target size is reached."""
+    with open(SAMPLE_FILE, 'rb') as fd:
+        sample = fd.read()
+    # Write in blocks of roughly 8 MB to speed things up
+    block = sample * max(1, (8 << 20) // len(sample))
+    target = size_mb << 20
+    written = 0
+    with open(path, 'wb') as fd:
+        while written < target:
+            fd.write(block)
+            written += len(block)
+
+
+def measure(reader: str, path: str) -> None:
+    """Iterate over the whole file. Runs inside the subprocess."""
+    cls = LegacyFileReaderStream if reader == 'legacy' else FileReaderStream
+    start = time.perf_counter()
+    first = None
+    count = 0
+    with cls(path) as stream:
+        for _ in stream:
+            if first is None:
+                first = time.perf_counter() - start
+            count += 1
+    total = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1 << 20) if sys.platform == 'darwin' else peak / (1 << 10)
+    print(
+        f"{reader:>8}: peak RSS {peak_mb:9.1f} MB, first message after {first or 0.0:8.3f} s, "
+        f"total {total:8.1f} s ({count} messages)"
+    )
+
+
+def run(size_mb: int, readers: typing.Sequence[str]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'synthetic.nmea')
+        generate_file(path, size_mb)
+        print(f"Synthetic file: {os.path.getsize(path) / (1 << 20):.0f} MB")
+        for reader in readers:
+            subprocess.run([sys.executable, __file__, '--measure', reader, path], check=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=int, default=2048, help="Size of the synthetic file in MB")
+    parser.add_argument('--only', choices=READERS, help="Only measure a single reader")
+    parser.add_argument('--measure', nargs=2, metavar=('READER', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(*args.measure)
+    else:
+        run(args.size_mb, [args.only] if args.only else READERS)
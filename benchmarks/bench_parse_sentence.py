@@ -0,0 +1,106 @@
+"""
+Micro-benchmark for `pyais.messages.parse_sentence`.
+
+Compares the previous approach (`validate_message` followed by a second split and
+conversion of every part) with the single pass tokenizer.
+The sentences are taken from `tests/nmea_data_sample.txt`.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_parse_sentence.py
+"""
+import pathlib
+import timeit
+import typing
+
+from pyais.constants import TalkerID
+from pyais.exceptions import InvalidNMEAMessageException
+from pyais.messages import parse_sentence
+from pyais.util import chk_to_int
+
+SAMPLE_FILE = pathlib.Path(__file__).parent.parent.joinpath('tests', 'nmea_data_sample.txt')
+
+
+def legacy_validate_message(msg: bytes) -> None:
+    """The validation prior to the single pass tokenizer. Kept here as a reference."""
+    values = msg.split(b",")
+    if len(values) != 7:
+        raise InvalidNMEAMessageException("A NMEA message needs to have exactly 7 comma separated entries.")
+    if not values[0]:
+        raise InvalidNMEAMessageException("The NMEA message type is empty!")
+    if not values[1]:
+        raise InvalidNMEAMessageException("Number of sentences is empty!")
+    if not values[2]:
+        raise InvalidNMEAMessageException("Sentence number is empty!")
+    if not values[5]:
+        raise InvalidNMEAMessageException("The NMEA message body (payload) is empty.")
+    if not values[6]:
+        raise InvalidNMEAMessageException("NMEA checksum (NMEA 0183 Standard CRC16) is empty.")
+    try:
+        if int(values[1]) > 0xff:
+            raise InvalidNMEAMessageException("Number of sentences exceeds limit of 9 total sentences.")
+    except ValueError:
+        raise InvalidNMEAMessageException("Invalid sentence number. No Number.")
+    if values[2]:
+        try:
+            if int(values[2]) > 0xff:
+                raise InvalidNMEAMessageException(" Sentence number exceeds limit of 9 total sentences.")
+        except ValueError:
+            raise InvalidNMEAMessageException("Invalid Sentence number. No Number.")
+    if values[3]:
+        try:
+            if int(values[3]) > 0xff:
+                raise InvalidNMEAMessageException(
+                    "Number of sequential message ID exceeds limit of 9 total sentences.")
+        except ValueError:
+            raise InvalidNMEAMessageException("Invalid  sequential message ID. No Number.")
+    if len(values[5]) > 82:
+        raise InvalidNMEAMessageException(f"{msg.decode('utf-8')} has more than 82 characters of payload.")
+
+
+def legacy_parse(raw: bytes) -> typing.Tuple[typing.Any, ...]:
+    """Validate and then split the sentence a second time - like NMEAMessage did before."""
+    legacy_validate_message(raw)
+    head, message_fragments, fragment_number, message_id, channel, payload, checksum = raw.split(b",")
+    fill, check = chk_to_int(checksum)
+    return (
+        TalkerID(head[1:3].decode('ascii')),
+        head[3:].decode('ascii'),
+        int(message_fragments),
+        int(fragment_number),
+        int(message_id) if message_id else None,
+        channel.decode('ascii'),
+        payload,
+        fill,
+        check,
+    )
+
+
+def load_sentences() -> typing.List[bytes]:
+    """Load every valid sentence of the sample file."""
+    sentences = []
+    with open(SAMPLE_FILE, 'rb') as fd:
+        for line in fd:
+            line = line.strip()
+            try:
+                parse_sentence(line)
+            except (InvalidNMEAMessageException, ValueError):
+                continue
+            sentences.append(line)
+    return sentences
+
+
+def run(number: int = 50) -> None:
+    sentences = load_sentences()
+
+    # Both implementations must yield the same result
+    for sentence in sentences:
+        assert legacy_parse(sentence) == tuple(parse_sentence(sentence))
+
+    for name, func in (('legacy', legacy_parse), ('single', parse_sentence)):
+        elapsed = timeit.timeit(lambda: [func(s) for s in sentences], number=number)
+        per_call = elapsed / (number * len(sentences)) * 1e6
+        print(f"{name:>8}: {per_call:8.3f} us/sentence ({len(sentences)} sentences x {number} rounds)")
+
+
+if __name__ == '__main__':
+    run()
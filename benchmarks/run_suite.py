@@ -0,0 +1,217 @@
+"""
+Benchmark suite for decoding, encoding, streams and the CLI.
+
+All inputs are synthetic and deterministic: the messages are built from a seeded random
+generator and encoded with `encode_dict`. The file for the stream and CLI benchmarks holds
+realistic traffic of `pyais.generator.CorpusGenerator`. Thus the results of two runs with
+the same seed and the same message count are comparable, e.g. across releases.
+
+Every benchmark is repeated and the fastest round is reported, like `timeit` does.
+The results are printed as a table and can be written as JSON.
+
+Usage:
+    PYTHONPATH=. python benchmarks/run_suite.py
+    PYTHONPATH=. python benchmarks/run_suite.py --json results.json
+    PYTHONPATH=. python benchmarks/run_suite.py --filter decode --repeat 10
+    PYTHONPATH=. python benchmarks/run_suite.py --count 200 --file-mb 1 --repeat 1
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+import pyais
+from pyais.encode import encode_dict, encode_msg
+from pyais.generator import CorpusGenerator
+from pyais.messages import MSG_CLASS, NMEAMessage
+from pyais.stream import FileReaderStream, IterMessages
+from pyais.util import decode_into_bit_array
+
+# Characters that can be encoded in AIS strings
+TEXT_CHARS = string.ascii_uppercase + string.digits + ' '
+
+# Message types and the partno of type 24
+MESSAGE_KINDS = ('1', '2', '3', '4', '5', '9', '18', '19', '21', '24A', '24B', '27')
+
+BENCHMARK = typing.Callable[[], int]
+
+
+def random_text(rnd: random.Random, max_len: int) -> str:
+    return ''.join(rnd.choice(TEXT_CHARS) for _ in range(rnd.randint(1, max_len))).strip() or 'X'
+
+
+def random_message(rnd: random.Random, kind: str) -> typing.Dict[str, typing.Any]:
+    """A plausible message of the given kind as a dictionary for `encode_dict`."""
+    msg_type = int(kind.rstrip('AB'))
+    data: typing.Dict[str, typing.Any] = {
+        'type': msg_type,
+        'mmsi': rnd.randint(200_000_000, 799_999_999),
+        'lat': round(rnd.uniform(-80, 80), 5),
+        'lon': round(rnd.uniform(-179, 179), 5),
+        'course': round(rnd.uniform(0, 359), 1),
+        'heading': rnd.randint(0, 359),
+        'speed': round(rnd.uniform(0, 25), 1),
+        'second': rnd.randint(0, 59),
+        'accuracy': rnd.random() < 0.5,
+    }
+    if msg_type in (1, 2, 3, 27):
+        data['status'] = rnd.randint(0, 8)
+    if msg_type in (4, 5):
+        data.update(month=rnd.randint(1, 12), day=rnd.randint(1, 28), hour=rnd.randint(0, 23),
+                    minute=rnd.randint(0, 59))
+    if msg_type == 4:
+        data['year'] = 2024
+    if msg_type in (5, 19, 21, 24):
+        data.update(to_bow=rnd.randint(1, 200), to_stern=rnd.randint(1, 100),
+                    to_port=rnd.randint(1, 30), to_starboard=rnd.randint(1, 30))
+    if msg_type in (5, 19) or kind == '24A':
+        data['shipname'] = random_text(rnd, 20)
+    if msg_type in (5, 19) or kind == '24B':
+        data['ship_type'] = rnd.randint(20, 99)
+    if msg_type == 5 or kind == '24B':
+        data['callsign'] = random_text(rnd, 7)
+    if msg_type == 5:
+        data.update(imo=rnd.randint(1_000_000, 9_999_999), draught=round(rnd.uniform(1, 20), 1),
+                    destination=random_text(rnd, 20))
+    if msg_type == 9:
+        data.update(alt=rnd.randint(0, 4000), speed=rnd.randint(0, 300))
+    if msg_type == 21:
+        data.update(aid_type=rnd.randint(1, 31), name=random_text(rnd, 20))
+    if msg_type == 24:
+        data['partno'] = 0 if kind == '24A' else 1
+        data['vendorid'] = random_text(rnd, 3)
+    if msg_type == 27:
+        data.update(speed=rnd.randint(0, 60), course=rnd.randint(0, 359))
+    return data
+
+
+def build_corpus(seed: int, count: int) -> typing.Dict[str, typing.List[typing.Dict[str, typing.Any]]]:
+    """`count` messages of every kind."""
+    rnd = random.Random(seed)
+    return {kind: [random_message(rnd, kind) for _ in range(count)] for kind in MESSAGE_KINDS}
+
+
+def sentences_of(messages: typing.Iterable[typing.Dict[str, typing.Any]]) -> typing.List[bytes]:
+    return [s.encode() for data in messages for s in encode_dict(data, talker_id='AIVDM')]
+
+
+def write_file(path: str, lines: typing.List[bytes], size_mb: float) -> int:
+    """Write the lines repeatedly until the file has the target size. Returns the number of repetitions."""
+    block = b'\n'.join(lines) + b'\n'
+    repeats = max(1, int(size_mb * (1 << 20)) // len(block))
+    with open(path, 'wb') as fd:
+        for _ in range(repeats):
+            fd.write(block)
+    return repeats
+
+
+def measure(func: BENCHMARK, repeat: int) -> typing.Tuple[int, typing.List[float]]:
+    """Call `func` `repeat` times. Returns the number of operations and the time of every round."""
+    times = []
+    ops = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ops = func()
+        times.append(time.perf_counter() - start)
+    return ops, times
+
+
+def benchmarks(corpus: typing.Dict[str, typing.List[typing.Dict[str, typing.Any]]], seed: int,
+               tmp: str, file_mb: float) -> typing.Iterator[typing.Tuple[str, BENCHMARK]]:
+    """Yields (name, benchmark) pairs. A benchmark returns the number of processed messages."""
+    everything = [data for messages in corpus.values() for data in messages]
+    all_sentences = sentences_of(everything)
+    single = [msg for msg in map(NMEAMessage, all_sentences) if msg.is_single]
+
+    yield 'parse.sentence', lambda: len([NMEAMessage(line) for line in all_sentences])
+    yield 'decode.bit_array', lambda: len([decode_into_bit_array(msg.payload, msg.fill_bits) for msg in single])
+
+    for kind, messages in corpus.items():
+        nmea = list(IterMessages(sentences_of(messages)))
+        cls = MSG_CLASS[nmea[0].ais_id]
+        bit_arrays = [decode_into_bit_array(msg.payload, msg.fill_bits) for msg in nmea]
+        payloads = [msg.decode() for msg in nmea]
+
+        yield f'decode.type_{kind}', lambda n=nmea: len([msg.decode() for msg in n])
+        yield f'from_bitarray.type_{kind}', lambda c=cls, b=bit_arrays: len([c.from_bitarray(bits) for bits in b])
+        yield f'encode.type_{kind}', lambda p=payloads: len([encode_msg(payload) for payload in p])
+
+    yield 'encode.dict', lambda: len([encode_dict(data) for data in everything])
+
+    multipart = sentences_of(corpus['5'])
+    yield 'assemble.multipart', lambda: len(list(IterMessages(multipart)))
+
+    path = os.path.join(tmp, 'corpus.nmea')
+    traffic = [s.encode() for s in CorpusGenerator(seed=seed, duplicates=0.05, corruption=0.001).sentences(len(everything))]
+    messages = write_file(path, traffic, file_mb) * len(list(IterMessages(traffic)))
+
+    def file_stream() -> int:
+        with FileReaderStream(path) as stream:
+            return sum(1 for _ in stream)
+
+    def cli() -> int:
+        cmd = [sys.executable, '-m', 'pyais.main', '-f', path, '-o', os.devnull]
+        subprocess.run(cmd, check=True, env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        return messages
+
+    yield 'stream.file', file_stream
+    yield 'cli.file', cli
+
+
+def run(seed: int, count: int, repeat: int, file_mb: float, name_filter: typing.Optional[str],
+        json_path: typing.Optional[str]) -> None:
+    corpus = build_corpus(seed, count)
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, func in benchmarks(corpus, seed, tmp, file_mb):
+            if name_filter and name_filter not in name:
+                continue
+            ops, times = measure(func, repeat)
+            best = min(times)
+            results.append({
+                'name': name,
+                'ops': ops,
+                'best': best,
+                'mean': sum(times) / len(times),
+                'repeat': repeat,
+                'ops_per_sec': ops / best if best else 0.0,
+                'us_per_op': best / ops * 1e6 if ops else 0.0,
+            })
+            print(f"{name:>26}: {results[-1]['us_per_op']:9.3f} us/message {results[-1]['ops_per_sec']:12.0f} messages/s")
+
+    if json_path:
+        report = {
+            'meta': {
+                'pyais': pyais.__version__,
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'seed': seed,
+                'count': count,
+                'file_mb': file_mb,
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            },
+            'results': results,
+        }
+        with open(json_path, 'w') as fd:
+            json.dump(report, fd, indent=2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the synthetic corpus")
+    parser.add_argument('--count', type=int, default=1000, help="Number of messages per message type")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of rounds per benchmark")
+    parser.add_argument('--file-mb', type=float, default=16.0, help="Size of the file for the stream and CLI benchmarks")
+    parser.add_argument('--filter', dest='name_filter', default=None, help="Only run benchmarks whose name contains this")
+    parser.add_argument('--json', dest='json_path', default=None, help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    run(args.seed, args.count, args.repeat, args.file_mb, args.name_filter, args.json_path)
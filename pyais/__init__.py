@@ -1,7 +1,10 @@
-from pyais.messages import NMEAMessage, ANY_MESSAGE
+from pyais.messages import NMEAMessage, NMEASentence, ANY_MESSAGE, parse_sentence
 from pyais.stream import TCPConnection, FileReaderStream, IterMessages
-from pyais.encode import encode_dict, encode_msg, ais_to_nmea_0183
+from pyais.encode import encode_dict, encode_msg, encode_many, ais_to_nmea_0183
 from pyais.decode import decode
+from pyais.batch import decode_batch, DecodedBatch
+from pyais.cache import PayloadCache
+from pyais.tracker import VesselTracker
 
 __license__ = 'MIT'
 __version__ = '2.1.2'
@@ -10,11 +13,18 @@ __author__ = 'Leon Morten Richter'
 __all__ = (
     'encode_dict',
     'encode_msg',
+    'encode_many',
     'ais_to_nmea_0183',
     'NMEAMessage',
+    'NMEASentence',
+    'parse_sentence',
     'ANY_MESSAGE',
     'TCPConnection',
     'IterMessages',
     'FileReaderStream',
     'decode',
+    'decode_batch',
+    'DecodedBatch',
+    'PayloadCache',
+    'VesselTracker',
 )
@@ -0,0 +1,180 @@
+import typing
+from array import array
+
+from pyais.exceptions import InvalidNMEAMessageException
+from pyais.messages import COLUMN_EXTRACTOR, MSG_CLASS, MessageType22Addressed, MessageType22Broadcast, \
+    MessageType24PartA, MessageType24PartB, MessageType25AddressedStructured, MessageType25AddressedUnstructured, \
+    MessageType25BroadcastStructured, MessageType25BroadcastUnstructured, MessageType26AddressedStructured, \
+    MessageType26AddressedUnstructured, MessageType26BroadcastStructured, MessageType26BroadcastUnstructured, Payload
+from pyais.stream import IterMessages
+from pyais.util import slice_int
+
+DEFAULT_MSG_TYPES = (1, 2, 3, 18)
+DEFAULT_FIELDS = ('mmsi', 'lat', 'lon', 'speed', 'course', 'heading')
+
+# array typecode and fill value for missing values per data type
+COLUMN_TYPES: typing.Dict[typing.Type[typing.Any], typing.Tuple[str, typing.Any]] = {
+    bool: ('B', 0),
+    int: ('q', 0),
+    float: ('d', float('nan')),
+}
+
+
+def _fill_values(typecodes: str) -> typing.List[typing.Any]:
+    return [COLUMN_TYPES[float][1] if code == 'd' else 0 for code in typecodes]
+
+
+# Message types whose layout depends on some bits of the payload:
+# msg_type -> (first bit, last bit, value of the bits -> class). The same as from_int() of MessageType22 etc.
+MSG_VARIANTS: typing.Dict[int, typing.Tuple[int, int, typing.Dict[int, typing.Type[Payload]]]] = {
+    22: (139, 140, {0: MessageType22Broadcast, 1: MessageType22Addressed}),
+    24: (38, 40, {0: MessageType24PartA, 1: MessageType24PartB}),
+    25: (38, 40, {
+        0b00: MessageType25BroadcastUnstructured, 0b01: MessageType25BroadcastStructured,
+        0b10: MessageType25AddressedUnstructured, 0b11: MessageType25AddressedStructured,
+    }),
+    26: (38, 40, {
+        0b00: MessageType26BroadcastUnstructured, 0b01: MessageType26AddressedUnstructured,
+        0b10: MessageType26BroadcastStructured, 0b11: MessageType26AddressedStructured,
+    }),
+}
+
+# (msg_type, variant) -> class
+PAYLOAD_CLASSES = typing.Dict[typing.Tuple[int, int], typing.Type[Payload]]
+
+
+def payload_classes(msg_types: typing.Iterable[int]) -> PAYLOAD_CLASSES:
+    """
+    The classes that hold the fields of the given message types keyed by (msg_type, variant).
+    The variant is the value of the bits in MSG_VARIANTS, e.g. the partno of type 24, or 0 for other types.
+    """
+    classes = {}
+    for msg_type in msg_types:
+        if msg_type in MSG_VARIANTS:
+            for variant, cls in MSG_VARIANTS[msg_type][2].items():
+                classes[(msg_type, variant)] = cls
+        elif msg_type in MSG_CLASS and MSG_CLASS[msg_type].fields():
+            classes[(msg_type, 0)] = MSG_CLASS[msg_type]
+        else:
+            raise ValueError(f"Message type {msg_type} is not supported")
+    return classes
+
+
+_EXTRACTORS: typing.Dict[typing.Tuple[typing.Type[Payload], typing.Tuple[str, ...], str], COLUMN_EXTRACTOR] = {}
+
+
+class DecodedBatch:
+    """
+    Column oriented result of `decode_batch`.
+
+    columns:    One typed array per field. The column `msg_type` is always present.
+    valid:      One array of 0 and 1 per field. 0 means, that the value is missing (None)
+                or that the message type has no such field. Missing values are 0 or NaN.
+    """
+    __slots__ = ('columns', 'valid')
+
+    def __init__(self, columns: typing.Dict[str, "array[typing.Any]"], valid: typing.Dict[str, "array[int]"]) -> None:
+        self.columns = columns
+        self.valid = valid
+
+    def __len__(self) -> int:
+        return len(self.columns['msg_type'])
+
+    def __getitem__(self, name: str) -> "array[typing.Any]":
+        return self.columns[name]
+
+    def to_numpy(self) -> typing.Dict[str, typing.Any]:
+        """
+        Convert the columns into NumPy masked arrays without copying the data.
+        Requires NumPy: pip install numpy
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("This feature requires the numpy package: pip install numpy") from e
+
+        out = {}
+        for name, column in self.columns.items():
+            data = np.frombuffer(column, dtype=column.typecode)
+            mask = np.frombuffer(self.valid[name], dtype=np.uint8) == 0
+            out[name] = np.ma.MaskedArray(data, mask=mask)
+        return out
+
+
+def column_types(classes: typing.Sequence[typing.Type[Payload]], names: typing.Sequence[str]) -> typing.List[str]:
+    """Find the array typecode of every field. Float wins, if the data type differs between message types."""
+    typecodes = []
+    for name in names:
+        d_types = {field.metadata['d_type'] for cls in classes for field in cls.fields() if field.name == name}
+        if not d_types:
+            raise ValueError(f"None of the message types has a field named '{name}'")
+        if not d_types.issubset(COLUMN_TYPES):
+            raise ValueError(f"Field '{name}' is not numeric and can not be stored in a column")
+        for d_type in (float, int, bool):
+            if d_type in d_types:
+                typecodes.append(COLUMN_TYPES[d_type][0])
+                break
+    return typecodes
+
+
+def _get_extractor(cls: typing.Type[Payload], names: typing.Tuple[str, ...], typecodes: str) -> COLUMN_EXTRACTOR:
+    key = (cls, names, typecodes)
+    try:
+        return _EXTRACTORS[key]
+    except KeyError:
+        extractor = _EXTRACTORS[key] = cls._compile_column_extractor(names, _fill_values(typecodes))
+        return extractor
+
+
+def decode_batch(sentences: typing.Iterable[typing.Union[str, bytes]],
+                 msg_types: typing.Iterable[int] = DEFAULT_MSG_TYPES,
+                 fields: typing.Sequence[str] = DEFAULT_FIELDS) -> DecodedBatch:
+    """
+    Decode many NMEA sentences into columns instead of one object per message.
+    Multipart messages are assembled. Sentences of other message types and invalid sentences are skipped.
+
+    >>> batch = decode_batch(sentences, msg_types=(1, 2, 3), fields=('mmsi', 'lat', 'lon'))
+    >>> batch['mmsi'], batch.valid['lat']
+
+    @param sentences:   NMEA sentences as str or bytes
+    @param msg_types:   Only messages of these types are decoded
+    @param fields:      Names of numeric fields. The values are the same as in `asdict(enum_as_int=True)`.
+    @return:            A DecodedBatch with one array per field
+    """
+    names = ('msg_type',) + tuple(name for name in fields if name != 'msg_type')
+    classes = payload_classes(msg_types)
+    typecodes = ''.join(column_types(list(classes.values()), names))
+
+    columns: typing.Dict[str, "array[typing.Any]"] = {name: array(code) for name, code in zip(names, typecodes)}
+    valid = {name: array('B') for name in names}
+    appends = [column.append for column in columns.values()]
+    mask_appends = [mask.append for mask in valid.values()]
+    fills = _fill_values(typecodes)
+    extractors = {key: _get_extractor(cls, names, typecodes) for key, cls in classes.items()}
+
+    messages = IterMessages(s.encode() if isinstance(s, str) else s for s in sentences)
+    for msg in messages:
+        try:
+            msg_type = msg.ais_id
+            val, length = msg.payload_int, msg.bit_length
+            variant = MSG_VARIANTS.get(msg_type)
+            key = (msg_type, 0 if variant is None else slice_int(val, length, variant[0], variant[1]))
+            extractor = extractors[key]
+        except (KeyError, InvalidNMEAMessageException, ValueError):
+            # Other message type, unknown variant (e.g. partno 2 of type 24), empty payload
+            # or a character outside of the six bit alphabet
+            continue
+
+        if not extractor(val, length, appends, mask_appends):
+            # The message is shorter than expected. Decode it the usual way.
+            values = classes[key].from_int(val, length).asdict(enum_as_int=True)
+            for col, name in enumerate(names):
+                value = values.get(name)
+                if value is None:
+                    appends[col](fills[col])
+                    mask_appends[col](0)
+                else:
+                    appends[col](value)
+                    mask_appends[col](1)
+
+    return DecodedBatch(columns, valid)
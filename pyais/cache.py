@@ -0,0 +1,76 @@
+import typing
+from collections import OrderedDict
+
+import attr
+
+from pyais.messages import ANY_MESSAGE, NMEAMessage, Payload
+
+# Type of a cached payload and its field values
+CACHE_ENTRY = typing.Tuple[typing.Type[Payload], typing.Tuple[typing.Any, ...]]
+
+
+class PayloadCache:
+    """
+    Bounded LRU cache of decoded payloads keyed by `(payload, fill_bits)`.
+
+    Redundant receivers deliver the same payload many times and static reports repeat with
+    identical content. For these messages the decoding is skipped.
+
+    >>> cache = PayloadCache(maxsize=10_000)
+    >>> for msg in stream:
+    ...     decoded = cache.decode(msg)
+
+    Only the field values are cached. Every call returns a new instance, so that changing a
+    decoded message never changes the cache or the result of another call.
+
+    Counters:
+        hits:   Number of messages that were taken from the cache
+        misses: Number of messages that were decoded
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """
+        @param maxsize: Maximum number of cached payloads. The least recently used payload is evicted first.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: typing.OrderedDict[typing.Tuple[bytes, int], CACHE_ENTRY] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of messages that were taken from the cache. 0.0 if nothing was decoded yet."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        """Remove all cached payloads and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def decode(self, msg: NMEAMessage) -> ANY_MESSAGE:
+        """
+        Decode a message like `NMEAMessage.decode`, but take the result from the cache, if possible.
+        Messages that can not be decoded are not cached.
+        """
+        key = (msg.payload, msg.fill_bits)
+        entries = self._entries
+        try:
+            cls, values = entries[key]
+        except KeyError:
+            self.misses += 1
+            decoded = msg.decode()
+            entries[key] = (type(decoded), attr.astuple(decoded, recurse=False))
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+            return decoded
+
+        self.hits += 1
+        entries.move_to_end(key)
+        return typing.cast(ANY_MESSAGE, cls(*values))
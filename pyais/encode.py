@@ -2,12 +2,15 @@ import math
 import typing
 
 from pyais.messages import Payload, MSG_CLASS
-from pyais.util import chunks, compute_checksum
+from pyais.util import chunks, xor_checksum
 
 # Types
 DATA_DICT = typing.Dict[str, typing.Union[str, int, float, bytes, bool]]
 AIS_SENTENCES = typing.List[str]
 
+# Maximum number of payload characters per sentence
+MAX_PAYLOAD_LEN = 61
+
 
 def get_ais_type(data: DATA_DICT) -> int:
     """
@@ -33,7 +36,8 @@ def data_to_payload(ais_type: int, data: DATA_DICT) -> Payload:
         raise ValueError(f"AIS message type {ais_type} is not supported") from err
 
 
-def ais_to_nmea_0183(payload: str, ais_talker_id: str, radio_channel: str, fill_bits: int) -> AIS_SENTENCES:
+def ais_to_nmea_0183(payload: str, ais_talker_id: str, radio_channel: str, fill_bits: int,
+                     seq_id: int = 0) -> AIS_SENTENCES:
     """
     Splits the AIS payload into sentences, ASCII encodes the payload, creates
     and sends the relevant NMEA 0183 sentences.
@@ -48,28 +52,39 @@ def ais_to_nmea_0183(payload: str, ais_talker_id: str, radio_channel: str, fill_
     @param ais_talker_id:   AIS talker ID (AIVDO or AIVDM)
     @param radio_channel:   Radio channel (either A or B)
     @param fill_bits:       The number of fill bits requires to pad the data payload to a 6 bit boundary.
+    @param seq_id:          Sequential message id (0 to 9) of multipart messages. Ignored for single sentences.
     @return:                A list of relevant AIS sentences.
     """
-    messages = []
-    max_len = 61
-    frag_cnt = math.ceil(len(payload) / max_len)
-    seq_id = '0' if frag_cnt > 1 else ''
-
     if len(ais_talker_id) != 5:
         raise ValueError("AIS talker is must have exactly 6 characters. E.g. AIVDO")
 
     if len(radio_channel) != 1:
         raise ValueError("Radio channel must be a single character")
 
-    for frag_num, chunk in enumerate(chunks(payload, max_len), start=1):
-        tpl = "!{},{},{},{},{},{},{}*{:02X}"
-        fill_bits_frag = fill_bits if frag_num == frag_cnt else 0  # Make sure we set fill bits only for last fragment
-        dummy_message = tpl.format(ais_talker_id, frag_cnt, frag_num, seq_id, radio_channel, chunk, fill_bits_frag, 0)
-        checksum = compute_checksum(dummy_message)
-        msg = tpl.format(ais_talker_id, frag_cnt, frag_num, seq_id, radio_channel, chunk, fill_bits_frag, checksum)
-        messages.append(msg)
+    head = f"!{ais_talker_id},"
+    return list(_iter_sentences(payload, fill_bits, head, _head_checksum(head), radio_channel, seq_id))
+
 
-    return messages
+def _head_checksum(head: str) -> int:
+    """Checksum of the constant start of every sentence, e.g. `!AIVDO,`. The leading `!` is not included."""
+    return xor_checksum(head[1:].encode('ascii'))
+
+
+def _iter_sentences(payload: str, fill_bits: int, head: str, head_checksum: int,
+                    radio_channel: str, seq_id: int = 0) -> typing.Generator[str, None, None]:
+    """
+    Split an armored payload into sentences. Every sentence is formatted once:
+    the checksum of the variable part is XORed with the precomputed checksum of `head`.
+    The sequential message id `seq_id` is only set for multipart messages.
+    """
+    frag_cnt = math.ceil(len(payload) / MAX_PAYLOAD_LEN)
+    seq = str(seq_id) if frag_cnt > 1 else ''
+
+    for frag_num, chunk in enumerate(chunks(payload, MAX_PAYLOAD_LEN), start=1):
+        fill_bits_frag = fill_bits if frag_num == frag_cnt else 0  # Make sure we set fill bits only for last fragment
+        body = f"{frag_cnt},{frag_num},{seq},{radio_channel},{chunk},{fill_bits_frag}"
+        checksum = xor_checksum(body.encode('ascii')) ^ head_checksum
+        yield f"{head}{body}*{checksum:02X}"
 
 
 def encode_dict(data: DATA_DICT, talker_id: str = "AIVDO", radio_channel: str = "A") -> AIS_SENTENCES:
@@ -109,3 +124,42 @@ def encode_msg(msg: Payload, talker_id: str = "AIVDO", radio_channel: str = "A")
 
     armored_payload, fill_bits = msg.encode()
     return ais_to_nmea_0183(armored_payload, talker_id, radio_channel, fill_bits)
+
+
+def encode_many(data: typing.Iterable[typing.Union[DATA_DICT, Payload]], talker_id: str = "AIVDO",
+                radio_channel: str = "A") -> typing.Generator[str, None, None]:
+    """
+    Encode many messages at once and lazily yield the resulting NMEA 0183 sentences.
+
+    The arguments are validated and the constant start of the sentences is prepared only once.
+    This makes it well suited to encode large amounts of data, e.g. when replaying historical data.
+    The sentences are the same as those returned by `encode_dict` and `encode_msg`.
+    The sentences of multipart messages are yielded one after another.
+
+    >>> for sentence in encode_many([{'type': 1, 'mmsi': 123}, {'type': 5, 'mmsi': 456}]):
+    ...     print(sentence)
+
+    @param data: The messages. Either dictionaries like for `encode_dict` or payload instances.
+    @param talker_id: AIS packets have the introducer "AIVDM" or "AIVDO";
+                      AIVDM packets are reports from other ships and AIVDO packets are reports from your own ship.
+    @param radio_channel: The radio channel. Can be either 'A' (default) or 'B'.
+    @return: A generator of NMEA 0183 encoded AIS sentences.
+    """
+    if talker_id not in ("AIVDM", "AIVDO"):
+        raise ValueError("talker_id must be any of ['AIVDM', 'AIVDO']")
+
+    if radio_channel not in ('A', 'B'):
+        raise ValueError("radio_channel must be any of ['A', 'B']")
+
+    return _encode_many(data, talker_id, radio_channel)
+
+
+def _encode_many(data: typing.Iterable[typing.Union[DATA_DICT, Payload]], talker_id: str,
+                 radio_channel: str) -> typing.Generator[str, None, None]:
+    head = f"!{talker_id},"
+    head_checksum = _head_checksum(head)
+
+    for item in data:
+        payload = item if isinstance(item, Payload) else data_to_payload(get_ais_type(item), item)
+        armored_payload, fill_bits = payload.encode()
+        yield from _iter_sentences(armored_payload, fill_bits, head, head_checksum, radio_channel)
@@ -0,0 +1,268 @@
+"""
+Deterministic generator of synthetic AIS traffic, e.g. to load test a pipeline or as input of benchmarks.
+"""
+import math
+import random
+import string
+import typing
+from collections import deque
+from socket import AF_INET, SOCK_DGRAM, SOCK_STREAM, socket
+
+from pyais.encode import ais_to_nmea_0183
+from pyais.messages import MSG_CLASS, MessageType24PartA, MessageType24PartB, Payload
+
+# Relative frequency of the message types. 24 covers both parts.
+DEFAULT_MIX: typing.Dict[int, float] = {1: 50, 3: 10, 18: 20, 5: 8, 24: 6, 21: 6}
+
+# Message types of class A transceivers, class B transceivers and aids to navigation
+CLASS_A_TYPES = frozenset((1, 2, 3, 5))
+CLASS_B_TYPES = frozenset((18, 24))
+AID_TYPES = frozenset((21,))
+SUPPORTED_TYPES = CLASS_A_TYPES | CLASS_B_TYPES | AID_TYPES
+
+# Characters that can be encoded in AIS strings
+TEXT_CHARS = string.ascii_uppercase + string.digits
+
+# Characters of armored payloads: the values 0 to 63 of the six bit alphabet
+ARMOR_CHARS = ''.join(chr(c) for c in range(0x30, 0x78) if not 0x58 <= c < 0x60)
+
+# Maximum size of the data of a single UDP datagram
+MAX_DATAGRAM = 1400
+
+
+class _Vessel:
+    """A moving vessel and its static data, that is encoded only once"""
+    __slots__ = ('mmsi', 'lat', 'lon', 'speed', 'course', 'static')
+
+    def __init__(self, mmsi: int, lat: float, lon: float, speed: float, course: float) -> None:
+        self.mmsi = mmsi
+        self.lat = lat
+        self.lon = lon
+        self.speed = speed
+        self.course = course
+        # Message type (24 for both parts) -> armored payloads and fill bits
+        self.static: typing.Dict[int, typing.List[typing.Tuple[str, int]]] = {}
+
+    def move(self, rnd: random.Random, seconds: float) -> None:
+        """Dead reckoning with a slowly changing course and speed."""
+        distance = self.speed * seconds / 3600
+        self.lat += distance * math.cos(math.radians(self.course)) / 60
+        self.lon += distance * math.sin(math.radians(self.course)) / (60 * max(0.01, math.cos(math.radians(self.lat))))
+        self.lon = (self.lon + 180) % 360 - 180
+        if abs(self.lat) > 80:
+            # Turn around before reaching the polar regions
+            self.lat = math.copysign(80, self.lat)
+            self.course = 180 - self.course
+        self.course = (self.course + rnd.gauss(0, 2)) % 360
+        self.speed = min(30.0, max(0.0, self.speed + rnd.gauss(0, 0.2)))
+
+
+class CorpusGenerator:
+    """
+    Generates realistic AIS traffic: vessels move along tracks and report their positions
+    and static data in a configurable mix of message types. The output is deterministic for a seed.
+
+    >>> for sentence in CorpusGenerator(vessels=5000, seed=42).sentences(1_000_000):
+    ...     print(sentence)
+
+    Class A vessels send types 1, 2, 3 and 5. Class B vessels send types 18 and 24.
+    Aids to navigation send type 21. Multipart messages use rotating sequential message ids
+    and the channels alternate randomly. Optionally recently sent messages are repeated,
+    as if they were received by several stations, and sentences are corrupted.
+    """
+
+    def __init__(self, vessels: int = 1000, seed: int = 0, mix: typing.Optional[typing.Dict[int, float]] = None,
+                 duplicates: float = 0.0, corruption: float = 0.0, talker_id: str = "AIVDM") -> None:
+        """
+        @param vessels:     Number of vessels. Additionally one aid to navigation per 20 vessels is created.
+        @param seed:        Seed of the random number generator
+        @param mix:         Relative frequency of every message type. Defaults to DEFAULT_MIX.
+        @param duplicates:  Probability that a recently sent message is sent again
+        @param corruption:  Probability that a sentence is corrupted. Either its checksum is invalid or it is truncated.
+        @param talker_id:   AIVDM or AIVDO
+        """
+        mix = DEFAULT_MIX if mix is None else mix
+        unsupported = set(mix) - SUPPORTED_TYPES
+        if unsupported:
+            raise ValueError(f"Message types {sorted(unsupported)} are not supported")
+        if vessels < 1:
+            raise ValueError("vessels must be at least 1")
+        if not 0 <= duplicates < 1 or not 0 <= corruption <= 1:
+            raise ValueError("duplicates and corruption must be probabilities")
+        if talker_id not in ("AIVDM", "AIVDO"):
+            raise ValueError("talker_id must be any of ['AIVDM', 'AIVDO']")
+
+        self.seed: int = seed
+        self.duplicates: float = duplicates
+        self.corruption: float = corruption
+        self.talker_id: str = talker_id
+
+        rnd = self._rnd = random.Random(seed)
+        class_a = max(1, round(vessels * 0.7)) if vessels > 1 else 1
+        mmsis = rnd.sample(range(200_000_000, 800_000_000), vessels)
+        self._class_a = [self._new_vessel(mmsi) for mmsi in mmsis[:class_a]]
+        self._class_b = [self._new_vessel(mmsi) for mmsi in mmsis[class_a:]]
+        self._aids = [self._new_vessel(mmsi) for mmsi in rnd.sample(range(992_000_000, 993_000_000), max(1, vessels // 20))]
+
+        # Types without senders are never generated
+        pools = {t: self._pool(t) for t in mix}
+        self._types = [t for t in mix if pools[t] and mix[t] > 0]
+        if not self._types:
+            raise ValueError("None of the message types can be generated")
+        weights = [mix[t] for t in self._types]
+        total = sum(weights)
+        self._cum_weights = [sum(weights[:i + 1]) / total for i in range(len(weights))]
+        self._seq_id = 0
+
+    def _new_vessel(self, mmsi: int) -> _Vessel:
+        rnd = self._rnd
+        return _Vessel(mmsi, rnd.uniform(-60, 70), rnd.uniform(-180, 180), rnd.uniform(0, 20), rnd.uniform(0, 360))
+
+    def _pool(self, msg_type: int) -> typing.List[_Vessel]:
+        if msg_type in CLASS_A_TYPES:
+            return self._class_a
+        if msg_type in CLASS_B_TYPES:
+            return self._class_b
+        return self._aids
+
+    def _text(self, length: int) -> str:
+        return ''.join(self._rnd.choices(TEXT_CHARS, k=length))
+
+    def _static(self, vessel: _Vessel, msg_type: int) -> typing.List[typing.Tuple[str, int]]:
+        """The armored static payloads of a vessel. They are created and encoded on first use."""
+        try:
+            return vessel.static[msg_type]
+        except KeyError:
+            pass
+
+        rnd = self._rnd
+        dimensions = dict(to_bow=rnd.randint(5, 200), to_stern=rnd.randint(5, 100),
+                          to_port=rnd.randint(2, 25), to_starboard=rnd.randint(2, 25))
+        payloads: typing.List[Payload]
+        if msg_type == 5:
+            payloads = [MSG_CLASS[5].create(
+                mmsi=vessel.mmsi, imo=rnd.randint(1_000_000, 9_999_999), callsign=self._text(7),
+                shipname=self._text(rnd.randint(4, 20)), ship_type=rnd.randint(60, 89), epfd=1,
+                month=rnd.randint(1, 12), day=rnd.randint(1, 28), hour=rnd.randint(0, 23), minute=rnd.randint(0, 59),
+                draught=round(rnd.uniform(2, 15), 1), destination=self._text(rnd.randint(4, 20)), **dimensions,
+            )]
+        elif msg_type == 24:
+            payloads = [
+                MessageType24PartA.create(mmsi=vessel.mmsi, partno=0, shipname=self._text(rnd.randint(4, 20))),
+                MessageType24PartB.create(mmsi=vessel.mmsi, partno=1, ship_type=rnd.randint(30, 37),
+                                          vendorid=self._text(3), callsign=self._text(7), **dimensions),
+            ]
+        else:
+            payloads = [MSG_CLASS[21].create(
+                mmsi=vessel.mmsi, aid_type=rnd.randint(1, 31), name=self._text(rnd.randint(4, 20)),
+                lon=round(vessel.lon, 5), lat=round(vessel.lat, 5), epfd=1, second=60, **dimensions,
+            )]
+        encoded = vessel.static[msg_type] = [payload.encode() for payload in payloads]
+        return encoded
+
+    def _position(self, vessel: _Vessel, msg_type: int) -> typing.Tuple[str, int]:
+        rnd = self._rnd
+        vessel.move(rnd, rnd.uniform(2, 10))
+        fields = dict(
+            mmsi=vessel.mmsi, speed=round(vessel.speed, 1), lon=round(vessel.lon, 5), lat=round(vessel.lat, 5),
+            course=round(vessel.course, 1), heading=int(vessel.course) % 360, second=rnd.randint(0, 59),
+        )
+        if msg_type == 18:
+            return MSG_CLASS[18].create(cs=True, **fields).encode()
+        return MSG_CLASS[msg_type].create(msg_type=msg_type, status=0 if vessel.speed > 0.5 else 5, **fields).encode()
+
+    def payloads(self) -> typing.Generator[typing.Tuple[str, int], None, None]:
+        """Endless stream of armored payloads and their fill bits."""
+        rnd = self._rnd
+        types, cum_weights = self._types, self._cum_weights
+        while True:
+            msg_type = rnd.choices(types, cum_weights=cum_weights)[0]
+            vessel = rnd.choice(self._pool(msg_type))
+            if msg_type in (5, 24, 21):
+                yield rnd.choice(self._static(vessel, msg_type))
+            else:
+                yield self._position(vessel, msg_type)
+
+    def _corrupt(self, sentence: str) -> str:
+        rnd = self._rnd
+        if rnd.random() < 0.5:
+            return sentence[:rnd.randint(1, len(sentence) - 1)]
+        # Replace a payload character, so that the checksum is invalid
+        parts = sentence.split(',')
+        start = len(','.join(parts[:5])) + 1
+        pos = rnd.randrange(start, start + len(parts[5]))
+        char = rnd.choice(ARMOR_CHARS.replace(sentence[pos], ''))
+        return sentence[:pos] + char + sentence[pos + 1:]
+
+    def messages(self, count: int) -> typing.Generator[typing.List[str], None, None]:
+        """
+        Yields the sentences of `count` messages. Every item holds the sentences of a single message.
+        Duplicates are yielded in addition to the `count` messages.
+        """
+        rnd = self._rnd
+        recent: typing.Deque[typing.List[str]] = deque(maxlen=32)
+        payloads = self.payloads()
+
+        for _ in range(count):
+            payload, fill_bits = next(payloads)
+            self._seq_id = (self._seq_id + 1) % 10
+            channel = 'A' if rnd.random() < 0.5 else 'B'
+            sentences = ais_to_nmea_0183(payload, self.talker_id, channel, fill_bits, self._seq_id)
+            recent.append(sentences)
+
+            if self.corruption and rnd.random() < self.corruption:
+                i = rnd.randrange(len(sentences))
+                sentences = sentences[:i] + [self._corrupt(sentences[i])] + sentences[i + 1:]
+            yield sentences
+
+            if self.duplicates and rnd.random() < self.duplicates:
+                yield rnd.choice(recent)
+
+    def sentences(self, count: int) -> typing.Generator[str, None, None]:
+        """Yields the sentences of `count` messages one by one."""
+        for sentences in self.messages(count):
+            yield from sentences
+
+
+def _batches(sentences: typing.Iterable[str], size: int) -> typing.Generator[str, None, None]:
+    """Join sentences into blocks of about `size` characters. Every sentence is terminated by \\r\\n."""
+    batch: typing.List[str] = []
+    length = 0
+    for sentence in sentences:
+        if length + len(sentence) + 2 > size and batch:
+            yield ''.join(batch)
+            batch.clear()
+            length = 0
+        batch.append(sentence + '\r\n')
+        length += len(sentence) + 2
+    if batch:
+        yield ''.join(batch)
+
+
+def write_file(sentences: typing.Iterable[str], fobj: typing.TextIO) -> int:
+    """Write sentences to a text file. Returns the number of written characters."""
+    written = 0
+    for block in _batches(sentences, 1 << 16):
+        written += fobj.write(block)
+    return written
+
+
+def send_tcp(sentences: typing.Iterable[str], host: str, port: int) -> int:
+    """Connect to a TCP server and send the sentences. Returns the number of sent bytes."""
+    sent = 0
+    with socket(AF_INET, SOCK_STREAM) as sock:
+        sock.connect((host, port))
+        for block in _batches(sentences, 1 << 16):
+            data = block.encode('ascii')
+            sock.sendall(data)
+            sent += len(data)
+    return sent
+
+
+def send_udp(sentences: typing.Iterable[str], host: str, port: int) -> int:
+    """Send the sentences as UDP datagrams of complete lines. Returns the number of sent bytes."""
+    sent = 0
+    with socket(AF_INET, SOCK_DGRAM) as sock:
+        for block in _batches(sentences, MAX_DATAGRAM):
+            sent += sock.sendto(block.encode('ascii'), (host, port))
+    return sent
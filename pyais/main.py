@@ -1,7 +1,9 @@
 import argparse
 import sys
-from typing import List, Tuple, Type, Any, Union
+from typing import Any, Dict, FrozenSet, List, Tuple, Type, Union
 
+from pyais.generator import CorpusGenerator, send_tcp, send_udp, write_file
+from pyais.parallel import ParallelFileDecoder
 from pyais.stream import ByteStream, TCPConnection, UDPReceiver, BinaryIOStream
 
 SOCKET_OPTIONS: Tuple[str, str] = ('udp', 'tcp')
@@ -10,6 +12,23 @@ SOCKET_OPTIONS: Tuple[str, str] = ('udp', 'tcp')
 INVALID_CHECKSUM_ERROR = 21
 
 
+def msg_types_arg(value: str) -> FrozenSet[int]:
+    """Parse a comma separated list of message types, e.g. `1,2,3,18`."""
+    try:
+        return frozenset(int(msg_type) for msg_type in value.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid list of message types: '{value}'")
+
+
+def stream_kwargs(args: argparse.Namespace) -> Dict[str, Any]:
+    """Keyword arguments of the streams derived from the commandline options."""
+    kwargs: Dict[str, Any] = {}
+    msg_types = getattr(args, 'msg_types', None)
+    if msg_types is not None:
+        kwargs['msg_types'] = msg_types
+    return kwargs
+
+
 def arg_parser() -> argparse.ArgumentParser:
     """Create a new ArgumentParser instance that serves as a entry point to the pyais application.
     All possible commandline options and parameters must be defined here.
@@ -36,6 +55,26 @@ def arg_parser() -> argparse.ArgumentParser:
         default=None
     )
 
+    # Files can be decoded by multiple worker processes
+    main_parser.add_argument(
+        '-j',
+        '--jobs',
+        dest="jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to decode a file. Has no effect on STDIN."
+    )
+
+    # Only decode some message types, e.g. 1,2,3,18
+    main_parser.add_argument(
+        '-m',
+        '--msg-types',
+        dest="msg_types",
+        type=msg_types_arg,
+        default=None,
+        help="Comma separated list of message types to decode. All other messages are skipped."
+    )
+
     main_parser.set_defaults(func=decode_from_file)
 
     socket_parser = sub_parsers.add_parser('socket')
@@ -67,6 +106,29 @@ def arg_parser() -> argparse.ArgumentParser:
     )
     single_msg_parser.set_defaults(func=decode_single)
 
+    # Synthetic traffic can be generated, e.g. to load test a pipeline
+    generate_parser = sub_parsers.add_parser('generate')
+    generate_parser.add_argument('-n', '--count', type=int, default=10000, help="Number of messages")
+    generate_parser.add_argument('--vessels', type=int, default=1000, help="Number of vessels")
+    generate_parser.add_argument('--seed', type=int, default=0, help="Seed of the random number generator")
+    generate_parser.add_argument('--duplicates', type=float, default=0.0, help="Probability of duplicate messages")
+    generate_parser.add_argument('--corruption', type=float, default=0.0, help="Probability of corrupted sentences")
+    generate_parser.add_argument(
+        '--destination',
+        type=str,
+        default=None,
+        help="Send the messages to this host instead of writing them to the output file"
+    )
+    generate_parser.add_argument('--port', type=int, default=None)
+    generate_parser.add_argument(
+        '-t',
+        '--type',
+        default='udp',
+        nargs='?',
+        choices=SOCKET_OPTIONS
+    )
+    generate_parser.set_defaults(func=generate)
+
     # Output
     # By default the application writes it output to STDOUT - but this can be any file
     main_parser.add_argument(
@@ -96,7 +158,7 @@ def decode_from_socket(args: argparse.Namespace) -> int:
     else:
         raise ValueError("args.type must be either TCP or UDP.")
 
-    with stream_cls(args.destination, args.port) as s:
+    with stream_cls(args.destination, args.port, **stream_kwargs(args)) as s:
         try:
             for msg in s:
                 decoded_message = msg.decode()
@@ -111,13 +173,35 @@ def decode_single(args: argparse.Namespace) -> int:
     """Decode a list of messages."""
     messages: List[str] = args.messages
     messages_as_bytes: List[bytes] = [msg.encode() for msg in messages if isinstance(msg, str)]
-    for msg in ByteStream(messages_as_bytes):
+    for msg in ByteStream(messages_as_bytes, **stream_kwargs(args)):
         print(msg.decode(), file=args.out_file)
         if not msg.is_valid:
             print_error("WARNING: Checksum invalid")
     return 0
 
 
+def generate(args: argparse.Namespace) -> int:
+    """Generate synthetic messages and write them to the output file or send them to a socket."""
+    try:
+        generator = CorpusGenerator(vessels=args.vessels, seed=args.seed, duplicates=args.duplicates,
+                                    corruption=args.corruption)
+    except ValueError as e:
+        print_error(f"ERROR: {e}")
+        return 1
+
+    sentences = generator.sentences(args.count)
+    if args.destination is None:
+        write_file(sentences, args.out_file)
+        return 0
+
+    if args.port is None:
+        print_error("ERROR: --port is required together with --destination")
+        return 1
+    send = send_tcp if args.type == 'tcp' else send_udp
+    send(sentences, args.destination, args.port)
+    return 0
+
+
 def decode_from_file(args: argparse.Namespace) -> int:
     """Decode messages from a file-like object."""
     if not args.in_file:
@@ -128,7 +212,22 @@ def decode_from_file(args: argparse.Namespace) -> int:
         # If the file is not None, then it was opened during argument parsing
         file = args.in_file
 
-    with BinaryIOStream(file) as s:
+        jobs: int = getattr(args, 'jobs', 1)
+        if jobs > 1:
+            # Every worker opens the file on its own
+            file.close()
+            decoder = ParallelFileDecoder(file.name, jobs=jobs, **stream_kwargs(args))
+            try:
+                for decoded_message in decoder:
+                    print(decoded_message, file=args.out_file)
+                for raw, error in decoder.errors:
+                    print_error(f"WARNING: Could not decode {raw!r}: {error}")
+            except KeyboardInterrupt:
+                # The workers are terminated when the pool is closed
+                pass
+            return 0
+
+    with BinaryIOStream(file, **stream_kwargs(args)) as s:
         try:
             for msg in s:
                 decoded_message = msg.decode()
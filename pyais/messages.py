@@ -5,29 +5,59 @@ import typing
 from typing import Any, Dict, Optional, Sequence, Union
 
 import attr
-from bitarray import bitarray
 
 from pyais.constants import TalkerID, NavigationStatus, ManeuverIndicator, EpfdType, ShipType, NavAid, StationType, \
     TransmitMode, StationIntervals
 from pyais.exceptions import InvalidNMEAMessageException, UnknownMessageException, UnknownPartNoException, \
     InvalidDataTypeException
-from pyais.util import decode_into_bit_array, compute_checksum, get_itdma_comm_state, get_sotdma_comm_state, int_to_bin, str_to_bin, \
-    encode_ascii_6, from_bytes, from_bytes_signed, decode_bin_as_ascii6, get_int, chk_to_int, coerce_val, \
-    bits2bytes, bytes2bits, b64encode_str
+from pyais.util import decode_into_int, compute_checksum, get_itdma_comm_state, get_sotdma_comm_state, int_to_bin, str_to_int, \
+    armor, from_bytes, decode_int_as_ascii6, slice_int, chk_to_int, decode_armor_char, DECIMALS, coerce_val, b64encode_str, \
+    bitarray, int_to_bitarray, decode_mmsi
 
 NMEA_VALUE = typing.Union[str, float, int, bool, bytes]
+DECODER = typing.Callable[[int, int], "ANY_MESSAGE"]
+# (payload) -> (val, length)
+ENCODER = typing.Callable[["Payload"], typing.Tuple[int, int]]
+# (val, length, appends, mask_appends) -> False if the message is too short
+COLUMN_EXTRACTOR = typing.Callable[
+    [int, int, Sequence[typing.Callable[[Any], None]], Sequence[typing.Callable[[int], None]]], bool
+]
 
 
-def validate_message(msg: bytes) -> None:
+# Lookup table for talker ids. Unknown talkers are mapped to TalkerID.UNDEFINED.
+_TALKER_IDS: Dict[str, TalkerID] = {talker.value: talker for talker in TalkerID}
+
+# Cache of already parsed sentence heads, e.g. b'!AIVDM' -> (TalkerID.Mobile_Station, 'VDM').
+# A feed only uses a handful of different heads. The size limit protects against garbage input.
+_HEADS: Dict[bytes, typing.Tuple[TalkerID, str]] = {}
+_MAX_HEADS = 1024
+
+
+class NMEASentence(typing.NamedTuple):
+    """The parts of a NMEA 0183 sentence as returned by `parse_sentence`"""
+    talker: TalkerID
+    type: str
+    frag_cnt: int
+    frag_num: int
+    seq_id: Optional[int]
+    channel: str
+    payload: bytes
+    fill_bits: int
+    checksum: int
+
+
+def parse_sentence(msg: bytes) -> NMEASentence:
     """
-    Validates a given message.
+    Validates and splits a given message in a single pass.
     It checks if the messages complies with the AIS standard.
     It is based on:
         1. https://en.wikipedia.org/wiki/Automatic_identification_system
         2. https://en.wikipedia.org/wiki/NMEA_0183
 
-    If not errors are found, nothing is returned.
-    Otherwise an InvalidNMEAMessageException is raised.
+    If errors are found an InvalidNMEAMessageException is raised.
+
+    >>> parse_sentence(b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C")
+    NMEASentence(talker=<TalkerID.Mobile_Station: 'AI'>, type='VDM', frag_cnt=1, frag_num=1, seq_id=None, ...)
     """
     values = msg.split(b",")
 
@@ -37,73 +67,110 @@ def validate_message(msg: bytes) -> None:
             "A NMEA message needs to have exactly 7 comma separated entries."
         )
 
+    head, message_fragments, fragment_number, message_id, channel, payload, checksum = values
+
     # The only allowed blank value may be the message ID
-    if not values[0]:
+    if not head:
         raise InvalidNMEAMessageException(
             "The NMEA message type is empty!"
         )
 
-    if not values[1]:
+    if not message_fragments:
         raise InvalidNMEAMessageException(
             "Number of sentences is empty!"
         )
 
-    if not values[2]:
+    if not fragment_number:
         raise InvalidNMEAMessageException(
             "Sentence number is empty!"
         )
 
-    if not values[5]:
+    if not payload:
         raise InvalidNMEAMessageException(
             "The NMEA message body (payload) is empty."
         )
 
-    if not values[6]:
+    if not checksum:
         raise InvalidNMEAMessageException(
             "NMEA checksum (NMEA 0183 Standard CRC16) is empty."
         )
 
-    try:
-        sentence_num = int(values[1])
-        if sentence_num > 0xff:
+    frag_cnt = DECIMALS.get(message_fragments, -1)
+    if frag_cnt < 0:
+        try:
+            frag_cnt = int(message_fragments)
+        except ValueError:
             raise InvalidNMEAMessageException(
-                "Number of sentences exceeds limit of 9 total sentences."
+                "Invalid sentence number. No Number."
             )
-    except ValueError:
+    if frag_cnt > 0xff:
         raise InvalidNMEAMessageException(
-            "Invalid sentence number. No Number."
+            "Number of sentences exceeds limit of 9 total sentences."
         )
 
-    if values[2]:
+    frag_num = DECIMALS.get(fragment_number, -1)
+    if frag_num < 0:
         try:
-            sentence_num = int(values[2])
-            if sentence_num > 0xff:
-                raise InvalidNMEAMessageException(
-                    " Sentence number exceeds limit of 9 total sentences."
-                )
+            frag_num = int(fragment_number)
         except ValueError:
             raise InvalidNMEAMessageException(
                 "Invalid Sentence number. No Number."
             )
+    if frag_num > 0xff:
+        raise InvalidNMEAMessageException(
+            " Sentence number exceeds limit of 9 total sentences."
+        )
 
-    if values[3]:
-        try:
-            sentence_num = int(values[3])
-            if sentence_num > 0xff:
+    seq_id: Optional[int] = None
+    if message_id:
+        seq_id = DECIMALS.get(message_id)
+        if seq_id is None:
+            try:
+                seq_id = int(message_id)
+            except ValueError:
                 raise InvalidNMEAMessageException(
-                    "Number of sequential message ID exceeds limit of 9 total sentences."
+                    "Invalid  sequential message ID. No Number."
                 )
-        except ValueError:
+        if seq_id > 0xff:
             raise InvalidNMEAMessageException(
-                "Invalid  sequential message ID. No Number."
+                "Number of sequential message ID exceeds limit of 9 total sentences."
             )
 
     # It should not have more than 82 chars of payload
-    if len(values[5]) > 82:
+    if len(payload) > 82:
         raise InvalidNMEAMessageException(
             f"{msg.decode('utf-8')} has more than 82 characters of payload."
         )
 
+    try:
+        talker, sentence_type = _HEADS[head]
+    except KeyError:
+        # The talker is identified by the next 2 characters and the type of message by the next 3 characters
+        talker = _TALKER_IDS.get(head[1:3].decode('ascii'), TalkerID.UNDEFINED)
+        sentence_type = head[3:].decode('ascii')
+        if len(_HEADS) < _MAX_HEADS:
+            _HEADS[head] = (talker, sentence_type)
+
+    fill_bits, check = chk_to_int(checksum)
+
+    return NMEASentence(
+        talker, sentence_type, frag_cnt, frag_num, seq_id, channel.decode('ascii'), payload, fill_bits, check
+    )
+
+
+def validate_message(msg: bytes) -> None:
+    """
+    Validates a given message.
+    It checks if the messages complies with the AIS standard.
+    It is based on:
+        1. https://en.wikipedia.org/wiki/Automatic_identification_system
+        2. https://en.wikipedia.org/wiki/NMEA_0183
+
+    If not errors are found, nothing is returned.
+    Otherwise an InvalidNMEAMessageException is raised.
+    """
+    parse_sentence(msg)
+
 
 def bit_field(width: int, d_type: typing.Type[typing.Any],
               from_converter: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None,
@@ -149,7 +216,6 @@ class JSONEncoder(json.JSONEncoder):
 
 class NMEAMessage(object):
     __slots__ = (
-        'ais_id',
         'raw',
         'talker',
         'type',
@@ -160,62 +226,56 @@ class NMEAMessage(object):
         'payload',
         'fill_bits',
         'checksum',
-        'bit_array'
+        '_valid',
+        '_ais_id',
+        '_payload_int',
+        '_bit_length',
     )
 
     def __init__(self, raw: bytes) -> None:
         if not isinstance(raw, bytes):
             raise ValueError(f"'NMEAMessage' only accepts bytes, but got '{type(raw)}'")
 
-        validate_message(raw)
-
-        # Initial values
-        self.checksum: int = -1
-
         # Store raw data
         self.raw: bytes = raw
 
-        # An AIS NMEA message consists of seven, comma separated parts
-        values = raw.split(b",")
-
-        # Unpack NMEA message parts
+        # An AIS NMEA message consists of seven, comma separated parts.
+        # talker:       The talker is identified by the next 2 characters
+        # type:         The type of message is then identified by the next 3 characters
+        # frag_cnt:     Total number of fragments
+        # frag_num:     Current fragment index
+        # seq_id:       Optional message index for multiline messages
+        # channel:      Channel (A or B)
+        # payload:      Decoded message payload as byte string
+        # fill_bits:    Fill bits (0 to 5)
+        # checksum:     Message Checksum (hex value)
+        self.talker: TalkerID
+        self.type: str
+        self.frag_cnt: int
+        self.frag_num: int
+        self.seq_id: Optional[int]
+        self.channel: str
+        self.payload: bytes
+        self.fill_bits: int
+        self.checksum: int
         (
-            head,
-            message_fragments,
-            fragment_number,
-            message_id,
-            channel,
-            payload,
-            checksum
-        ) = values
-
-        # The talker is identified by the next 2 characters
-        talker: str = head[1:3].decode('ascii')
-        self.talker: TalkerID = TalkerID(talker)
-
-        # The type of message is then identified by the next 3 characters
-        self.type: str = head[3:].decode('ascii')
-
-        # Total number of fragments
-        self.frag_cnt: int = int(message_fragments)
-        # Current fragment index
-        self.frag_num: int = int(fragment_number)
-        # Optional message index for multiline messages
-        self.seq_id: Optional[int] = int(message_id) if message_id else None
-        # Channel (A or B)
-        self.channel: str = channel.decode('ascii')
-        # Decoded message payload as byte string
-        self.payload: bytes = payload
-
-        fill, check = chk_to_int(checksum)
-        # Fill bits (0 to 5)
-        self.fill_bits: int = fill
-        # Message Checksum (hex value)
-        self.checksum = check
-
-        # Finally decode bytes into bits
-        self.bit_array: bitarray = decode_into_bit_array(self.payload, self.fill_bits)
-        self.ais_id: int = get_int(self.bit_array, 0, 6)
+            self.talker,
+            self.type,
+            self.frag_cnt,
+            self.frag_num,
+            self.seq_id,
+            self.channel,
+            self.payload,
+            self.fill_bits,
+            self.checksum,
+        ) = parse_sentence(raw)
+
+        # The payload is decoded lazily on first access. See `ais_id` and `payload_int`.
+        # The same applies to the checksum. See `is_valid`.
+        self._valid: Optional[bool] = None
+        self._ais_id: Optional[int] = None
+        self._payload_int: Optional[int] = None
+        self._bit_length: int = 0
 
     def __str__(self) -> str:
         return str(self.raw)
@@ -246,7 +306,7 @@ class NMEAMessage(object):
             'payload': self.payload.decode('ascii'),  # str
             'fill_bits': self.fill_bits,  # int
             'checksum': self.checksum,  # int
-            'bit_array': self.bit_array.to01(),  # str
+            'bit_array': f'{self.payload_int:0{self.bit_length}b}' if self.bit_length else '',  # str
         }
 
     def decode_and_merge(self, enum_as_int: bool = False) -> Dict[str, Any]:
@@ -263,7 +323,8 @@ class NMEAMessage(object):
         return rlt
 
     def __eq__(self, other: object) -> bool:
-        return all([getattr(self, attr) == getattr(other, attr) for attr in self.__slots__])
+        # Private slots are lazily computed from the public ones
+        return all([getattr(self, attr) == getattr(other, attr) for attr in self.__slots__ if attr[0] != '_'])
 
     @classmethod
     def from_string(cls, nmea_str: str) -> "NMEAMessage":
@@ -282,23 +343,85 @@ class NMEAMessage(object):
         """
         raw = b''
         data = b''
-        bit_array = bitarray()
+        payload_int = 0
+        bit_length = 0
 
+        # The assembled message is valid, if the checksums of all parts are valid.
+        # Only checksums that were already computed, e.g. by a checksum policy, are combined.
+        # Otherwise the checksums are computed lazily from the raw data. See `is_valid`.
+        valid: Optional[bool] = True
         for i, msg in enumerate(sorted(messages, key=lambda m: m.frag_num)):
             if i > 0:
                 raw += b'\n'
             raw += msg.raw
+            if msg._valid is False:
+                valid = False
+            elif msg._valid is None and valid:
+                valid = None
             data += msg.payload
-            bit_array += msg.bit_array
+            payload_int = (payload_int << msg.bit_length) | msg.payload_int
+            bit_length += msg.bit_length
 
         messages[0].raw = raw
+        messages[0]._valid = valid
         messages[0].payload = data
-        messages[0].bit_array = bit_array
+        messages[0]._payload_int = payload_int
+        messages[0]._bit_length = bit_length
         return messages[0]
 
+    @property
+    def ais_id(self) -> int:
+        """The message type. Derived from the first armored character without decoding the whole payload."""
+        if self._ais_id is None:
+            ais_id = decode_armor_char(self.payload[0])
+            if len(self.payload) == 1:
+                # The only character may contain fill bits, which are treated as zeros
+                ais_id &= (0x3F << self.fill_bits) & 0x3F
+            self._ais_id = ais_id
+        return self._ais_id
+
+    @ais_id.setter
+    def ais_id(self, ais_id: int) -> None:
+        self._ais_id = ais_id
+
+    @property
+    def mmsi(self) -> typing.Optional[int]:
+        """The MMSI. Derived from the armored payload without decoding the whole payload. None if the payload is too short."""
+        return decode_mmsi(self.payload, self.fill_bits)
+
+    @property
+    def payload_int(self) -> int:
+        """The payload bits as a single integer. Decoded on first access."""
+        if self._payload_int is None:
+            self._payload_int, self._bit_length = decode_into_int(self.payload, self.fill_bits)
+        return self._payload_int
+
+    @property
+    def bit_length(self) -> int:
+        """The number of bits in the payload."""
+        if self._payload_int is None:
+            self._payload_int, self._bit_length = decode_into_int(self.payload, self.fill_bits)
+        return self._bit_length
+
+    @property
+    def bit_array(self) -> bitarray:
+        """The payload as a bitarray. Requires the bitarray package."""
+        return int_to_bitarray(self.payload_int, self.bit_length)
+
     @property
     def is_valid(self) -> bool:
-        return self.checksum == compute_checksum(self.raw)
+        """
+        True if the checksum matches. The checksum is computed on first access and cached.
+        An assembled multipart message is valid, if all of its parts are valid.
+        """
+        if self._valid is None:
+            lines = [line for line in self.raw.splitlines() if line]
+            if len(lines) > 1:
+                # An assembled message: the raw data of all parts separated by newlines
+                self._valid = all(chk_to_int(line.rsplit(b',', 1)[-1])[1] == compute_checksum(line) for line in lines)
+            else:
+                self._valid = self.checksum == compute_checksum(self.raw)
+        return self._valid
 
     @property
     def is_single(self) -> bool:
@@ -321,7 +444,7 @@ class NMEAMessage(object):
         MessageType18(msg_type=18, ...)
         """
         try:
-            return MSG_CLASS[self.ais_id].from_bitarray(self.bit_array)
+            return MSG_CLASS[self.ais_id].from_int(self.payload_int, self.bit_length)
         except KeyError as e:
             raise UnknownMessageException(f"The message {self} is not supported!") from e
 
@@ -365,42 +488,26 @@ class Payload(abc.ABC):
         """
         Convert a payload to binary.
         """
-        out = bitarray()
-        for field in self.fields():
-            width = field.metadata['width']
-            d_type = field.metadata['d_type']
-            converter = field.metadata['from_converter']
-            signed = field.metadata['signed']
-
-            val = getattr(self, field.name)
-            if val is None:
-                continue
+        return int_to_bitarray(*self.to_int())
 
-            val = converter(val) if converter is not None else val
-
-            if d_type in (bool, int):
-                bits = int_to_bin(val, width, signed=signed)
-            elif d_type == float:
-                val = int(val)
-                bits = int_to_bin(val, width, signed=signed)
-            elif d_type == str:
-                bits = str_to_bin(val, width)
-            elif d_type == bytes:
-                bits = bytes2bits(val, default=bitarray('0' * width))
-            else:
-                raise InvalidDataTypeException(d_type)
-
-            bits = bits[:width]
-            out += bits
-
-        return out
+    def to_int(self) -> typing.Tuple[int, int]:
+        """
+        Convert a payload to its integer representation. The inverse of `from_int`.
+        Fields that are None are omitted.
+        @return: The payload bits as a single integer and the number of bits
+        """
+        cls = type(self)
+        try:
+            encoder = _ENCODERS[cls]
+        except KeyError:
+            encoder = _ENCODERS[cls] = cls._compile_encoder()
+        return encoder(self)
 
     def encode(self) -> typing.Tuple[str, int]:
         """
         Encode a payload as an ASCII encoded bit vector. The second returned value is the number of fill bits.
         """
-        bit_arr = self.to_bitarray()
-        return encode_ascii_6(bit_arr)
+        return armor(*self.to_int())
 
     @classmethod
     def create(cls, **kwargs: NMEA_VALUE) -> "ANY_MESSAGE":
@@ -429,49 +536,254 @@ class Payload(abc.ABC):
 
     @classmethod
     def from_bitarray(cls, bit_arr: bitarray) -> "ANY_MESSAGE":
+        # The bitarray is padded with zeros to a multiple of 8 bits when converted to bytes
+        length = len(bit_arr)
+        return cls.from_int(from_bytes(bit_arr.tobytes()) >> (-length % 8), length)
+
+    @classmethod
+    def from_int(cls, val: int, length: int) -> "ANY_MESSAGE":
+        """
+        Decode a payload from its integer representation.
+        @param val:     The payload bits as a single integer
+        @param length:  The number of bits in `val`
+        """
+        try:
+            decoder = _DECODERS[cls]
+        except KeyError:
+            decoder = _DECODERS[cls] = cls._compile_decoder()
+        return decoder(val, length)
+
+    @classmethod
+    def _compile_decoder(cls) -> DECODER:
+        """
+        Generate a function that decodes the integer representation of a payload into an instance of `cls`.
+
+        The bit layout of a message is static. Offsets, shifts, masks and signedness of every field
+        are therefore computed once and baked into the generated source as constants.
+        The generated function handles messages that have at least as many bits as all fields combined.
+        Shorter messages are passed on to `_decode_partial`.
+        """
+        total = sum(field.metadata['width'] for field in cls.fields())
+        namespace: typing.Dict[str, typing.Any] = {
+            'cls': cls,
+            'partial': cls._decode_partial,
+            'ascii6': decode_int_as_ascii6,
+        }
+        lines = [
+            'def decode(val, n):',
+            f'    if n < {total}:',
+            '        return partial(val, n)',
+            f'    val >>= n - {total}',
+        ]
+
+        cur = 0
+        for i, field in enumerate(cls.fields()):
+            width = field.metadata['width']
+            lines.append(f'    f_{i} = {cls._field_source(i, total - cur - width, namespace)}')
+            cur += width
+
+        lines.append(f'    return cls({", ".join(f"f_{i}" for i in range(len(cls.fields())))})')
+        exec(compile('\n'.join(lines), f'<decoder {cls.__name__}>', 'exec'), namespace)
+        return typing.cast(DECODER, namespace['decode'])
+
+    @classmethod
+    def _compile_encoder(cls) -> ENCODER:
+        """
+        Generate a function that packs all fields of an instance of `cls` into a single integer.
+
+        This is the counterpart of `_compile_decoder`: widths, masks and value ranges are baked into
+        the generated source. Values that are too large are clamped to all ones and values that do not
+        fit are handed to `int_to_bin`, which raises. The result is the same as that of the former
+        bitarray based `to_bitarray`.
+        """
+        namespace: typing.Dict[str, typing.Any] = {
+            'str_to_int': str_to_int,
+            'from_bytes': from_bytes,
+            'int_to_bin': int_to_bin,
+        }
+        lines = [
+            'def encode(self):',
+            '    val = n = 0',
+        ]
+
+        for i, field in enumerate(cls.fields()):
+            width = field.metadata['width']
+            d_type = field.metadata['d_type']
+            converter = field.metadata['from_converter']
+            signed = field.metadata['signed']
+
+            lines += [
+                f'    v = self.{field.name}',
+                '    if v is not None:',
+            ]
+            if converter is not None:
+                namespace[f'conv_{i}'] = converter
+                lines.append(f'        v = conv_{i}(v)')
+
+            if d_type in (int, bool, float):
+                if d_type is float:
+                    lines.append('        v = int(v)')
+                mask = (1 << width) - 1
+                n_bits = (width + 7) // 8 * 8
+                low, high = (-(1 << (n_bits - 1)), (1 << (n_bits - 1)) - 1) if signed else (0, (1 << n_bits) - 1)
+                lines += [
+                    f'        if v >= {mask}:',
+                    f'            v = {mask}',
+                    f'        elif {low} <= v <= {high}:',
+                    f'            v &= {mask}',
+                    '        else:',
+                    f'            int_to_bin(v, {width}, signed={signed})',
+                    f'        val = (val << {width}) | v',
+                    f'        n += {width}',
+                ]
+            elif d_type == str:
+                lines += [
+                    f'        val = (val << {width // 6 * 6}) | str_to_int(v, {width})',
+                    f'        n += {width // 6 * 6}',
+                ]
+            elif d_type == bytes:
+                # Empty bytes are encoded as zeros. Longer values are truncated to the width.
+                lines += [
+                    '        w = len(v) * 8',
+                    '        if not w:',
+                    f'            val <<= {width}',
+                    f'            n += {width}',
+                    f'        elif w > {width}:',
+                    f'            val = (val << {width}) | (from_bytes(v) >> (w - {width}))',
+                    f'            n += {width}',
+                    '        else:',
+                    '            val = (val << w) | from_bytes(v)',
+                    '            n += w',
+                ]
+            else:
+                raise InvalidDataTypeException(d_type)
+
+        lines.append('    return val, n')
+        exec(compile('\n'.join(lines), f'<encoder {cls.__name__}>', 'exec'), namespace)
+        return typing.cast(ENCODER, namespace['encode'])
+
+    @classmethod
+    def _field_source(cls, i: int, shift: int, namespace: typing.Dict[str, typing.Any]) -> str:
+        """
+        Source code of an expression that decodes the i-th field from `val`,
+        where the last bit of the field is `shift` bits above the least significant bit of `val`.
+        Objects referenced by the expression are added to `namespace`.
+        """
+        field = cls.fields()[i]
+        width = field.metadata['width']
+        d_type = field.metadata['d_type']
+        converter = field.metadata['to_converter']
+        bits = f'(val >> {shift} & {(1 << width) - 1})'
+
+        if d_type in (int, bool, float):
+            if field.metadata['signed']:
+                sign = 1 << (width - 1)
+                bits = f'(({bits} ^ {sign}) - {sign})'
+            expr = bits if d_type is int else f'{d_type.__name__}({bits})'
+        elif d_type == str:
+            expr = f'ascii6({bits}, {width})'
+        elif d_type == bytes:
+            expr = f'({bits} << {-width % 8}).to_bytes({(width + 7) // 8}, "big")'
+        else:
+            raise InvalidDataTypeException(d_type)
+
+        if converter is not None:
+            namespace.update(fields=cls.fields(), force=cls.__force_type)
+            namespace[f'conv_{i}'] = converter
+            expr = f'force(fields[{i}], conv_{i}({expr}))'
+        return expr
+
+    @classmethod
+    def _compile_column_extractor(cls, names: Sequence[str], fills: Sequence[Any]) -> COLUMN_EXTRACTOR:
+        """
+        Generate a function that appends the values of the given fields to columns,
+        without creating an instance of `cls`. The values are the same as in `asdict(enum_as_int=True)`.
+
+        The generated function is called with the payload as integer, its length and two sequences of
+        append functions: one for the values and one for the validity masks. Fields that are None or that
+        `cls` does not have are appended as the corresponding fill value and marked as invalid (0).
+        If the message is too short for the requested fields nothing is appended and False is returned.
+        """
+        offsets: typing.Dict[str, typing.Tuple[int, int, typing.Any]] = {}
+        cur = 0
+        for i, field in enumerate(cls.fields()):
+            offsets[field.name] = (i, cur, field)
+            cur += field.metadata['width']
+
+        requested = [offsets[name] for name in names if name in offsets]
+        end = max((start + field.metadata['width'] for _, start, field in requested), default=0)
+
+        namespace: typing.Dict[str, typing.Any] = {'ascii6': decode_int_as_ascii6}
+        lines = [
+            'def extract(val, n, ap, mk):',
+            f'    if n < {end}:',
+            '        return False',
+            f'    val >>= n - {end}',
+        ]
+        for col, name in enumerate(names):
+            namespace[f'fill_{col}'] = fills[col]
+            if name not in offsets:
+                lines.append(f'    ap[{col}](fill_{col}); mk[{col}](0)')
+                continue
+
+            i, start, field = offsets[name]
+            lines.append(f'    v = {cls._field_source(i, end - start - field.metadata["width"], namespace)}')
+            if field.converter is not None:
+                # Converters of attrs are applied when an instance is created
+                namespace[f'cv_{i}'] = field.converter
+                lines.append(f'    v = None if v is None else cv_{i}(v)')
+            lines += [
+                '    if v is None:',
+                f'        ap[{col}](fill_{col}); mk[{col}](0)',
+                '    else:',
+                f'        ap[{col}](v); mk[{col}](1)',
+            ]
+        lines.append('    return True')
+
+        exec(compile('\n'.join(lines), f'<column extractor {cls.__name__}>', 'exec'), namespace)
+        return typing.cast(COLUMN_EXTRACTOR, namespace['extract'])
+
+    @classmethod
+    def _decode_partial(cls, val: int, length: int) -> "ANY_MESSAGE":
+        """
+        Decode a message that is shorter than the sum of its fields.
+        The last field may be truncated. All fields that did not fit into the message are None.
+        """
         cur: int = 0
-        end: int = 0
-        kwargs: typing.Dict[str, typing.Any] = {}
+        args: typing.List[typing.Any] = []
 
-        # Iterate over the bits until the last bit of the bitarray or all fields are fully decoded
         for field in cls.fields():
 
-            if end >= len(bit_arr):
+            if cur >= length:
                 # All fields that did not fit into the bit array are None
-                kwargs[field.name] = None
+                args.append(None)
                 continue
 
-            width = field.metadata['width']
             d_type = field.metadata['d_type']
             converter = field.metadata['to_converter']
 
-            end = min(len(bit_arr), cur + width)
-            bits = bit_arr[cur: end]
+            width = min(field.metadata['width'], length - cur)
+            bits = (val >> (length - cur - width)) & ((1 << width) - 1)
 
-            val: typing.Any
+            result: typing.Any
             # Get the correct data type and decoding function
             if d_type in (int, bool, float):
-                shift = (8 - ((end - cur) % 8)) % 8
-                if field.metadata['signed']:
-                    val = from_bytes_signed(bits) >> shift
-                else:
-                    val = from_bytes(bits) >> shift
-                val = d_type(val)
+                if field.metadata['signed'] and bits >> (width - 1):
+                    bits -= 1 << width
+                result = d_type(bits)
             elif d_type == str:
-                val = decode_bin_as_ascii6(bits)
+                result = decode_int_as_ascii6(bits, width)
             elif d_type == bytes:
-                val = bits2bytes(bits)
+                result = (bits << (-width % 8)).to_bytes((width + 7) // 8, 'big')
             else:
                 raise InvalidDataTypeException(d_type)
 
-            val = converter(val) if converter is not None else val
-
-            val = cls.__force_type(field, val)
-            kwargs[field.name] = val
+            result = converter(result) if converter is not None else result
+            args.append(cls.__force_type(field, result))
 
-            cur = end
+            cur += width
 
-        return cls(**kwargs)  # type:ignore
+        return cls(*args)  # type:ignore
 
     def asdict(self, enum_as_int: bool = False) -> typing.Dict[str, typing.Optional[NMEA_VALUE]]:
         """
@@ -1111,11 +1423,11 @@ class MessageType22(Payload):
             return MessageType22Broadcast.create(**kwargs)
 
     @classmethod
-    def from_bitarray(cls, bit_arr: bitarray) -> "ANY_MESSAGE":
-        if get_int(bit_arr, 139, 140):
-            return MessageType22Addressed.from_bitarray(bit_arr)
+    def from_int(cls, val: int, length: int) -> "ANY_MESSAGE":
+        if slice_int(val, length, 139, 140):
+            return MessageType22Addressed.from_int(val, length)
         else:
-            return MessageType22Broadcast.from_bitarray(bit_arr)
+            return MessageType22Broadcast.from_int(val, length)
 
 
 @attr.s(slots=True)
@@ -1201,12 +1513,12 @@ class MessageType24(Payload):
             raise UnknownPartNoException(f"Partno {partno} is not allowed!")
 
     @classmethod
-    def from_bitarray(cls, bit_arr: bitarray) -> "ANY_MESSAGE":
-        partno: int = get_int(bit_arr, 38, 40)
+    def from_int(cls, val: int, length: int) -> "ANY_MESSAGE":
+        partno: int = slice_int(val, length, 38, 40)
         if partno == 0:
-            return MessageType24PartA.from_bitarray(bit_arr)
+            return MessageType24PartA.from_int(val, length)
         elif partno == 1:
-            return MessageType24PartB.from_bitarray(bit_arr)
+            return MessageType24PartB.from_int(val, length)
         else:
             raise UnknownPartNoException(f"Partno {partno} is not allowed!")
 
@@ -1290,20 +1602,20 @@ class MessageType25(Payload):
                 return MessageType25BroadcastUnstructured.create(**kwargs)
 
     @classmethod
-    def from_bitarray(cls, bit_arr: bitarray) -> "ANY_MESSAGE":
-        addressed: int = get_int(bit_arr, 38, 39)
-        structured: int = get_int(bit_arr, 39, 40)
+    def from_int(cls, val: int, length: int) -> "ANY_MESSAGE":
+        addressed: int = slice_int(val, length, 38, 39)
+        structured: int = slice_int(val, length, 39, 40)
 
         if addressed:
             if structured:
-                return MessageType25AddressedStructured.from_bitarray(bit_arr)
+                return MessageType25AddressedStructured.from_int(val, length)
             else:
-                return MessageType25AddressedUnstructured.from_bitarray(bit_arr)
+                return MessageType25AddressedUnstructured.from_int(val, length)
         else:
             if structured:
-                return MessageType25BroadcastStructured.from_bitarray(bit_arr)
+                return MessageType25BroadcastStructured.from_int(val, length)
             else:
-                return MessageType25BroadcastUnstructured.from_bitarray(bit_arr)
+                return MessageType25BroadcastUnstructured.from_int(val, length)
 
 
 @attr.s(slots=True)
@@ -1390,20 +1702,20 @@ class MessageType26(Payload):
                 return MessageType26BroadcastUnstructured.create(**kwargs)
 
     @classmethod
-    def from_bitarray(cls, bit_arr: bitarray) -> "ANY_MESSAGE":
-        addressed: int = get_int(bit_arr, 38, 39)
-        structured: int = get_int(bit_arr, 39, 40)
+    def from_int(cls, val: int, length: int) -> "ANY_MESSAGE":
+        addressed: int = slice_int(val, length, 38, 39)
+        structured: int = slice_int(val, length, 39, 40)
 
         if addressed:
             if structured:
-                return MessageType26AddressedStructured.from_bitarray(bit_arr)
+                return MessageType26AddressedStructured.from_int(val, length)
             else:
-                return MessageType26BroadcastStructured.from_bitarray(bit_arr)
+                return MessageType26BroadcastStructured.from_int(val, length)
         else:
             if structured:
-                return MessageType26AddressedUnstructured.from_bitarray(bit_arr)
+                return MessageType26AddressedUnstructured.from_int(val, length)
             else:
-                return MessageType26BroadcastUnstructured.from_bitarray(bit_arr)
+                return MessageType26BroadcastUnstructured.from_int(val, length)
 
 
 @attr.s(slots=True)
@@ -1427,6 +1739,10 @@ class MessageType27(Payload):
     spare_1 = bit_field(1, bytes, default=b'')
 
 
+# Compiled decoders are created on first use. See `Payload._compile_decoder`.
+_DECODERS: typing.Dict[typing.Type[Payload], DECODER] = {}
+_ENCODERS: typing.Dict[typing.Type[Payload], ENCODER] = {}
+
 MSG_CLASS = {
     0: MessageType1,  # there are messages with a zero (0) as an id. these seem to be the same as type 1 messages
     1: MessageType1,
@@ -0,0 +1,144 @@
+import functools
+import os
+import typing
+from multiprocessing import Pool
+
+from pyais.exceptions import InvalidNMEAMessageException, UnknownMessageException, UnknownPartNoException
+from pyais.messages import ANY_MESSAGE
+from pyais.stream import DuplicateFilter, MmapFileStream
+
+# (filename, start, end, lookback, keyword arguments of the stream)
+SHARD = typing.Tuple[str, int, int, int, typing.Dict[str, typing.Any]]
+
+# Errors of messages that can not be decoded. These messages are skipped.
+DECODE_ERRORS = (InvalidNMEAMessageException, UnknownMessageException, UnknownPartNoException, ValueError)
+
+
+class ShardResult(typing.NamedTuple):
+    # The decoded messages
+    messages: typing.List[ANY_MESSAGE]
+    # (raw, exception) of every message that could not be decoded
+    errors: typing.List[typing.Tuple[bytes, Exception]]
+    # (payload, fill bits, is single) of every decoded message. Only collected for duplicate filters.
+    keys: typing.List[typing.Tuple[bytes, int, bool]]
+
+
+def _decode_shard(shard: SHARD, keys: bool = False) -> ShardResult:
+    """
+    Decode every message that is completed by a line within [start, end).
+
+    Reading starts up to `lookback` bytes before `start`, so that multipart messages
+    that straddle the shard boundary are assembled. Messages that are already completed
+    before `start` belong to the previous shard and are skipped.
+    """
+    filename, start, end, lookback, kwargs = shard
+    result = ShardResult([], [], [])
+
+    stream = MmapFileStream(filename, offset=max(0, start - lookback), **kwargs)
+    with stream:
+        for msg in stream:
+            # The offset is now at the end of the line that completed the message
+            position = stream.offset
+            if position <= start:
+                continue
+            if position > end:
+                break
+            try:
+                result.messages.append(msg.decode())
+            except DECODE_ERRORS as err:
+                result.errors.append((msg.raw, err))
+                continue
+            if keys:
+                result.keys.append((msg.payload, msg.fill_bits, msg.is_single))
+    return result
+
+
+class ParallelFileDecoder:
+    """
+    Decode a file in parallel using multiple worker processes.
+
+    The file is split into shards of roughly `shard_size` bytes that are aligned to line boundaries.
+    Every shard is decoded by a worker process. A message belongs to the shard that contains the line
+    that completes it. Multipart messages that straddle a shard boundary are assembled by reading up
+    to `lookback` bytes of the previous shard.
+
+    Messages that can not be decoded are skipped and collected in `errors`.
+    A `duplicate_filter` is applied in the current process to the merged results of all shards.
+
+    >>> for msg in ParallelFileDecoder("sample.ais", jobs=4):
+    ...     print(msg)
+    """
+
+    def __init__(self, filename: str, jobs: typing.Optional[int] = None, ordered: bool = True,
+                 shard_size: int = 4 << 20, lookback: int = 64 << 10, **kwargs: typing.Any) -> None:
+        """
+        @param filename:    Path to the file
+        @param jobs:        Number of worker processes. Defaults to the number of CPUs.
+                            A single job decodes the file in the current process.
+        @param ordered:     Yield messages in the same order as FileReaderStream.
+                            Otherwise the results of every shard are yielded as soon as they are ready.
+        @param shard_size:  Approximate number of bytes per shard
+        @param lookback:    Number of bytes before a shard that are read to assemble multipart messages
+        @param kwargs:      Keyword arguments of the streams, e.g. msg_types or checksum.
+                            Every worker creates its own stream, thus counters are not available.
+                            The counters of a duplicate_filter are available.
+        """
+        if not os.path.isfile(filename):
+            raise FileNotFoundError(f"Could not open file {filename}")
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+
+        self.filename: str = filename
+        self.jobs: int = jobs or os.cpu_count() or 1
+        self.ordered: bool = ordered
+        self.shard_size: int = shard_size
+        self.lookback: int = lookback
+        self.duplicate_filter: typing.Optional[DuplicateFilter] = kwargs.pop('duplicate_filter', None)
+        self.kwargs: typing.Dict[str, typing.Any] = kwargs
+        # (raw, exception) of every message that could not be decoded
+        self.errors: typing.List[typing.Tuple[bytes, Exception]] = []
+
+    def shards(self) -> typing.List[SHARD]:
+        """Split the file into shards whose boundaries are at the start of a line."""
+        shards: typing.List[SHARD] = []
+        with open(self.filename, "rb") as fd:
+            size = os.fstat(fd.fileno()).st_size
+            start = 0
+            while start < size:
+                fd.seek(min(start + self.shard_size, size))
+                # Move to the start of the next line
+                fd.readline()
+                end = min(fd.tell(), size)
+                shards.append((self.filename, start, end, self.lookback, self.kwargs))
+                start = end
+        return shards
+
+    def __iter__(self) -> typing.Generator[ANY_MESSAGE, None, None]:
+        shards = self.shards()
+        decode = functools.partial(_decode_shard, keys=self.duplicate_filter is not None)
+
+        if self.jobs == 1:
+            for shard in shards:
+                yield from self._merge(decode(shard))
+            return
+
+        with Pool(self.jobs) as pool:
+            if self.ordered:
+                results = pool.imap(decode, shards)
+            else:
+                results = pool.imap_unordered(decode, shards)
+            for result in results:
+                yield from self._merge(result)
+
+    def _merge(self, result: ShardResult) -> typing.Iterator[ANY_MESSAGE]:
+        """Yield the messages of a shard, that are not duplicates, and collect its errors."""
+        self.errors.extend(result.errors)
+        dedup = self.duplicate_filter
+        if dedup is None:
+            yield from result.messages
+            return
+
+        for msg, (payload, fill_bits, single) in zip(result.messages, result.keys):
+            if (single or dedup.multipart) and dedup.is_duplicate_payload(payload, fill_bits):
+                continue
+            yield msg
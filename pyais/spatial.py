@@ -0,0 +1,170 @@
+import math
+import typing
+
+from pyais.messages import ANY_MESSAGE
+
+# Mean earth radius in nautical miles
+EARTH_RADIUS_NM = 3440.065
+
+CELL = typing.Tuple[int, int]
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great circle distance between two points in nautical miles."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_NM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def valid_position(lat: typing.Optional[float], lon: typing.Optional[float]) -> bool:
+    """False if the position is not available (None, lat 91 or lon 181) or out of range."""
+    return lat is not None and lon is not None and -90 <= lat <= 90 and -180 <= lon <= 180
+
+
+class GridIndex:
+    """
+    Spatial index of positions keyed by MMSI. The positions are put into buckets of a regular grid
+    of `cell_size` degrees. Updates move a position between two buckets. Queries only visit the
+    buckets that intersect the queried area. Thus their cost depends on the number of positions
+    in the area and not on the total number of positions.
+
+    >>> index = GridIndex()
+    >>> index.update(227006760, 49.47, 0.13)
+    >>> index.within(49.48, 0.1, radius=20)
+    [227006760]
+
+    Distances are in nautical miles. Bounding boxes may cross the antimeridian.
+    """
+
+    def __init__(self, cell_size: float = 0.25) -> None:
+        """
+        @param cell_size: Size of a grid cell in degrees. Should be close to the radius of typical queries.
+        """
+        if not 0 < cell_size <= 90:
+            raise ValueError("cell_size must be in (0, 90]")
+
+        self.cell_size: float = cell_size
+        self._lon_cells: int = math.ceil(360 / cell_size)
+        self._positions: typing.Dict[int, typing.Tuple[float, float, CELL]] = {}
+        self._cells: typing.Dict[CELL, typing.Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, mmsi: object) -> bool:
+        return mmsi in self._positions
+
+    def get(self, mmsi: int) -> typing.Optional[typing.Tuple[float, float]]:
+        """The position (lat, lon) of `mmsi` or None."""
+        entry = self._positions.get(mmsi)
+        return entry[:2] if entry is not None else None
+
+    def _cell(self, lat: float, lon: float) -> CELL:
+        return math.floor(lat / self.cell_size), self._lon_cell(lon)
+
+    def _lon_cell(self, lon: float) -> int:
+        """
+        Column of a longitude. The longitude is normalized to [-180, 180) first, because the
+        last column is only partly used, if `cell_size` does not divide 360.
+        """
+        return min(math.floor(((lon + 180) % 360) / self.cell_size), self._lon_cells - 1)
+
+    def update(self, mmsi: int, lat: float, lon: float) -> None:
+        """Insert or move the position of `mmsi`."""
+        cell = self._cell(lat, lon)
+        old = self._positions.get(mmsi)
+        if old is None or old[2] != cell:
+            if old is not None:
+                self._discard(mmsi, old[2])
+            self._cells.setdefault(cell, set()).add(mmsi)
+        self._positions[mmsi] = (lat, lon, cell)
+
+    def update_from(self, msg: ANY_MESSAGE) -> bool:
+        """
+        Update the index from a decoded position report, e.g. message type 1, 18, 19, 9 or 27.
+        @return: False if the message has no available position
+        """
+        lat, lon = getattr(msg, 'lat', None), getattr(msg, 'lon', None)
+        if not valid_position(lat, lon):
+            return False
+        self.update(getattr(msg, 'mmsi'), typing.cast(float, lat), typing.cast(float, lon))
+        return True
+
+    def remove(self, mmsi: int) -> None:
+        """Remove the position of `mmsi`, if there is any."""
+        old = self._positions.pop(mmsi, None)
+        if old is not None:
+            self._discard(mmsi, old[2])
+
+    def _discard(self, mmsi: int, cell: CELL) -> None:
+        members = self._cells[cell]
+        members.discard(mmsi)
+        if not members:
+            del self._cells[cell]
+
+    def _lon_range(self, lon_min: float, lon_max: float) -> typing.Iterable[int]:
+        """Indices of the cells between two longitudes. Wraps around the antimeridian."""
+        first = self._lon_cell(lon_min)
+        count = (self._lon_cell(lon_max) - first) % self._lon_cells + 1
+        if lon_max - lon_min >= 360 - self.cell_size:
+            count = self._lon_cells
+        return [(first + i) % self._lon_cells for i in range(count)]
+
+    def _candidates(self, lat_min: float, lat_max: float,
+                    lon_cells: typing.Iterable[int]) -> typing.Iterator[typing.Tuple[int, float, float]]:
+        """Yields (mmsi, lat, lon) of all positions in the cells between two latitudes and in `lon_cells`."""
+        lat_cells = range(math.floor(lat_min / self.cell_size), math.floor(lat_max / self.cell_size) + 1)
+        lon_cells = list(lon_cells)
+        positions, cells = self._positions, self._cells
+
+        if len(lat_cells) * len(lon_cells) > len(cells):
+            # Fewer occupied cells than cells in the area
+            lon_set = set(lon_cells)
+            keys: typing.Iterable[CELL] = [key for key in cells if key[0] in lat_cells and key[1] in lon_set]
+        else:
+            keys = [(i, j) for i in lat_cells for j in lon_cells]
+
+        for key in keys:
+            for mmsi in cells.get(key, ()):
+                lat, lon, _ = positions[mmsi]
+                yield mmsi, lat, lon
+
+    def bbox(self, lat_min: float, lon_min: float, lat_max: float, lon_max: float) -> typing.List[int]:
+        """
+        MMSIs of all positions within a bounding box. If `lon_min` is greater than `lon_max`,
+        the box crosses the antimeridian.
+        """
+        crosses = lon_min > lon_max
+        lon_cells = self._lon_range(lon_min, lon_max if not crosses else lon_max + 360)
+        return [
+            mmsi for mmsi, lat, lon in self._candidates(lat_min, lat_max, lon_cells)
+            if lat_min <= lat <= lat_max and ((lon_min <= lon or lon <= lon_max) if crosses else lon_min <= lon <= lon_max)
+        ]
+
+    def within(self, lat: float, lon: float, radius: float) -> typing.List[int]:
+        """MMSIs of all positions within `radius` nautical miles of a point, ordered by distance."""
+        return [mmsi for mmsi, _ in self.nearby(lat, lon, radius)]
+
+    def nearby(self, lat: float, lon: float, radius: float) -> typing.List[typing.Tuple[int, float]]:
+        """(MMSI, distance) of all positions within `radius` nautical miles of a point, ordered by distance."""
+        angle = radius / EARTH_RADIUS_NM
+        d_lat = math.degrees(angle)
+        lat_min, lat_max = lat - d_lat, lat + d_lat
+
+        if lat_min <= -90 or lat_max >= 90 or angle >= math.pi / 2:
+            # The circle contains a pole: all longitudes
+            lon_cells: typing.Iterable[int] = range(self._lon_cells)
+        else:
+            # Longitude extent of a circle on the sphere
+            d_lon = math.degrees(math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(lat)))))
+            lon_cells = self._lon_range(lon - d_lon, lon + d_lon)
+
+        result = []
+        for mmsi, p_lat, p_lon in self._candidates(max(lat_min, -90.0), min(lat_max, 90.0), lon_cells):
+            distance = haversine(lat, lon, p_lat, p_lon)
+            if distance <= radius:
+                result.append((mmsi, distance))
+        result.sort(key=lambda item: item[1])
+        return result
@@ -1,8 +1,12 @@
+import asyncio
+import mmap
+import time
 import typing
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from socket import AF_INET, SOCK_DGRAM, SOCK_STREAM, socket
 from typing import (
-    BinaryIO, Generator, Generic, Iterable, List, TypeVar, cast
+    AsyncGenerator, BinaryIO, Generator, Generic, Iterable, List, Tuple, TypeVar, cast
 )
 
 from pyais.exceptions import InvalidNMEAMessageException
@@ -12,6 +16,12 @@ F = TypeVar("F", BinaryIO, socket, None)
 DOLLAR_SIGN = ord("$")
 EXCLAMATION_POINT = ord("!")
 
+# Checksum verification policies. See MessageAssembler.
+CHECKSUM_IGNORE = "ignore"
+CHECKSUM_DROP = "drop"
+CHECKSUM_FLAG = "flag"
+CHECKSUM_POLICIES = (CHECKSUM_IGNORE, CHECKSUM_DROP, CHECKSUM_FLAG)
+
 
 def should_parse(byte_str: bytes) -> bool:
     """Return True if a given byte string seems to be NMEA message.
@@ -22,12 +32,323 @@ def should_parse(byte_str: bytes) -> bool:
     return len(byte_str) > 0 and byte_str[0] in (DOLLAR_SIGN, EXCLAMATION_POINT) and byte_str.count(b",") == 6
 
 
-class AssembleMessages(ABC):
+class _FragmentGroup:
+    """The fragments of a single multipart message"""
+    __slots__ = ('parts', 'received', 'updated')
+
+    def __init__(self, fragment_count: int) -> None:
+        self.parts: List[typing.Optional[NMEAMessage]] = [None, ] * fragment_count
+        self.received: int = 0
+        self.updated: float = 0.0
+
+
+class FragmentBuffer:
+    """
+    Buffer that reassembles the fragments of multipart messages.
+
+    Fragments are grouped by their sequential message id and channel.
+    The number of open groups is limited by `max_groups`. If the buffer is full,
+    the least recently updated group is evicted. Groups that did not receive
+    a new fragment within `max_age` seconds are evicted as well.
+
+    Counters:
+        evicted:    Number of groups that were evicted, because the buffer was full or they were too old
+        incomplete: Number of groups that were discarded before all of their fragments were received.
+                    This includes evicted groups and groups that were replaced by a new message with
+                    the same sequential message id and channel.
+    """
+
+    def __init__(self, max_groups: int = 1024, max_age: typing.Optional[float] = 60.0) -> None:
+        """
+        @param max_groups:  The maximum number of multipart messages that are assembled at the same time
+        @param max_age:     Maximum number of seconds between two fragments of the same message. None to disable.
+        """
+        if max_groups < 1:
+            raise ValueError("max_groups must be at least 1")
+
+        self.max_groups: int = max_groups
+        self.max_age: typing.Optional[float] = max_age
+        self.evicted: int = 0
+        self.incomplete: int = 0
+        # Ordered from the least to the most recently updated group
+        self._groups: typing.OrderedDict[typing.Tuple[int, str], _FragmentGroup] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    @staticmethod
+    def slot(msg: NMEAMessage) -> typing.Tuple[int, str]:
+        """The fragments of a message are grouped by seq_id and channel. Instead of None -1 is used as a seq_id."""
+        seq_id = msg.seq_id
+        return (seq_id if seq_id is not None else -1), msg.channel
+
+    def discard(self, msg: NMEAMessage) -> None:
+        """Discard the fragments of the message that `msg` is a fragment of, if any were received."""
+        slot = self.slot(msg)
+        group = self._groups.get(slot)
+        if group is not None and len(group.parts) == msg.frag_cnt:
+            del self._groups[slot]
+
+    def _evict_oldest(self) -> None:
+        self._groups.popitem(last=False)
+        self.evicted += 1
+        self.incomplete += 1
+
+    def add(self, msg: NMEAMessage) -> typing.Optional[NMEAMessage]:
+        """
+        Add a fragment to the buffer.
+        @param msg: A fragment of a multipart message
+        @return: The assembled message, if this was the last missing fragment. None otherwise.
+        """
+        groups = self._groups
+        frag_cnt, frag_num = msg.frag_cnt, msg.frag_num
+
+        if not 0 < frag_num <= frag_cnt:
+            # The fragment can never be part of a complete message
+            return None
+
+        now = 0.0
+        if self.max_age is not None:
+            now = time.monotonic()
+            while groups and now - next(iter(groups.values())).updated > self.max_age:
+                self._evict_oldest()
+
+        # seq_id and channel make a unique stream
+        slot = self.slot(msg)
+        group = groups.get(slot)
+
+        if group is not None and len(group.parts) == frag_cnt:
+            groups.move_to_end(slot)
+        else:
+            if group is not None:
+                # A new message reuses the slot of an unfinished one
+                del groups[slot]
+                self.incomplete += 1
+            elif len(groups) >= self.max_groups:
+                self._evict_oldest()
+            group = groups[slot] = _FragmentGroup(frag_cnt)
+
+        if group.parts[frag_num - 1] is None:
+            group.received += 1
+        group.parts[frag_num - 1] = msg
+        group.updated = now
+
+        # Check if all fragments are found
+        if group.received == frag_cnt:
+            del groups[slot]
+            return NMEAMessage.assemble_from_iterable(typing.cast(List[NMEAMessage], group.parts))
+        return None
+
+
+class DuplicateFilter:
+    """
+    Detects messages that were already received within a sliding window, e.g. the same transmission
+    received by several stations with overlapping coverage.
+
+    Messages are compared by their (assembled) payload and fill bits. Talker, channel and
+    sequential message id are ignored, because they differ between receivers.
+    Only the hashes of the payloads are kept in a ring of `buckets` sets. A new set is started
+    every `window / buckets` seconds and whenever the newest set holds `max_entries / buckets`
+    hashes. The oldest set is dropped when the ring is full. Thus memory is bounded by `max_entries`
+    and a payload is remembered for at least `window - window / buckets` and at most `window` seconds,
+    unless more than `max_entries` distinct payloads are received within the window.
+
+    Counters:
+        received:   Number of messages that were checked
+        duplicates: Number of messages that were dropped as duplicates
+    """
+
+    def __init__(self, window: typing.Optional[float] = 2.0, max_entries: int = 65536, buckets: int = 4,
+                 multipart: bool = True) -> None:
+        """
+        @param window:      Number of seconds for which a payload is remembered. None for a count based window.
+        @param max_entries: Maximum number of remembered payloads
+        @param buckets:     Number of sets in the ring. More sets make the window more precise, but lookups slower.
+        @param multipart:   Also deduplicate assembled multipart messages
+        """
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        if max_entries < buckets:
+            raise ValueError("max_entries must be at least the number of buckets")
+
+        self.window: typing.Optional[float] = window
+        self.max_entries: int = max_entries
+        self.buckets: int = buckets
+        self.multipart: bool = multipart
+        self.received: int = 0
+        self.duplicates: int = 0
+        # Ordered from the oldest to the newest set
+        self._ring: typing.Deque[typing.Set[int]] = deque([set()], maxlen=buckets)
+        self._bucket_size: int = max_entries // buckets
+        self._bucket_age: typing.Optional[float] = window / buckets if window is not None else None
+        self._started: float = time.monotonic()
+
+    def __len__(self) -> int:
+        return sum(map(len, self._ring))
+
+    @property
+    def ratio(self) -> float:
+        """Share of received messages that were duplicates. 0.0 if no message was checked yet."""
+        return self.duplicates / self.received if self.received else 0.0
+
+    def is_duplicate(self, msg: NMEAMessage) -> bool:
+        """
+        Check if the payload of `msg` was received within the window and remember it.
+        Multipart messages must be assembled before.
+        """
+        if not self.multipart and not msg.is_single:
+            return False
+        return self.is_duplicate_payload(msg.payload, msg.fill_bits)
+
+    def is_duplicate_payload(self, payload: bytes, fill_bits: int) -> bool:
+        """
+        Same as `is_duplicate`, but for a payload and its fill bits, e.g. of a message that was
+        assembled in another process. The `multipart` option is not applied.
+        """
+        self.received += 1
+        key = hash((payload, fill_bits))
+        ring = self._ring
+
+        if self._bucket_age is not None:
+            elapsed = int((time.monotonic() - self._started) // self._bucket_age)
+            if elapsed:
+                # Start a new set for every elapsed period, so that no payload outlives the window
+                for _ in range(min(elapsed, self.buckets)):
+                    ring.append(set())
+                self._started += elapsed * self._bucket_age
+
+        for bucket in ring:
+            if key in bucket:
+                self.duplicates += 1
+                return True
+
+        newest = ring[-1]
+        if len(newest) >= self._bucket_size:
+            newest = set()
+            ring.append(newest)
+        newest.add(key)
+        return False
+
+
+class MessageAssembler:
+    """
+    Turns lines into NMEA messages and assembles multiline messages.
+    Shared by the blocking streams (AssembleMessages) and the asyncio streams (AsyncStream).
+
+    Checksum verification policies:
+        ignore: Checksums are not verified (default)
+        drop:   Sentences with an invalid checksum are discarded before they are assembled
+        flag:   Sentences with an invalid checksum are kept. Check `msg.is_valid` to detect them.
+                A multipart message is invalid, if any of its fragments is invalid.
+
+    Filters:
+        If `msg_types` is given, only messages of these types are yielded. If `mmsis` is given, only
+        messages of these MMSIs are yielded. Type and MMSI are read from the first armored characters
+        of the payload. Thus all other messages are neither decoded nor verified and the fragments of
+        other multipart messages are not buffered.
+
+    Duplicates:
+        If a `duplicate_filter` is given, messages with the same payload as a recently received
+        message are dropped after they are assembled. See DuplicateFilter.
+
+    Counters:
+        invalid_checksums: Number of sentences with an invalid checksum (drop and flag only)
+        filtered:          Number of sentences that were skipped, because of their message type or MMSI
+    """
+
+    def __init__(self, fragment_buffer: typing.Optional[FragmentBuffer] = None, checksum: str = CHECKSUM_IGNORE,
+                 msg_types: typing.Optional[Iterable[int]] = None, mmsis: typing.Optional[Iterable[int]] = None,
+                 duplicate_filter: typing.Optional[DuplicateFilter] = None) -> None:
+        """
+        @param fragment_buffer:  Buffer that reassembles multipart messages.
+                                 Pass a custom instance to change its limits or to read its counters.
+        @param checksum:         Checksum verification policy: 'ignore', 'drop' or 'flag'
+        @param msg_types:        Only yield messages of these types. None to yield all messages.
+        @param mmsis:            Only yield messages of these MMSIs, e.g. a watchlist. None to yield all messages.
+        @param duplicate_filter: Drop messages that were received recently. None to yield all messages.
+        """
+        if checksum not in CHECKSUM_POLICIES:
+            raise ValueError(f"checksum must be any of {list(CHECKSUM_POLICIES)}")
+
+        self.fragment_buffer: FragmentBuffer = fragment_buffer if fragment_buffer is not None else FragmentBuffer()
+        self.checksum: str = checksum
+        self.msg_types: typing.Optional[typing.FrozenSet[int]] = frozenset(msg_types) if msg_types is not None else None
+        self.mmsis: typing.Optional[typing.FrozenSet[int]] = frozenset(mmsis) if mmsis is not None else None
+        self.duplicate_filter: typing.Optional[DuplicateFilter] = duplicate_filter
+        self.invalid_checksums: int = 0
+        self.filtered: int = 0
+        # Slots of skipped multipart messages -> their fragment count
+        self._skipped_slots: typing.OrderedDict[typing.Tuple[int, str], int] = OrderedDict()
+
+    def _matches(self, msg: NMEAMessage) -> bool:
+        """Check type and MMSI of a message without decoding it."""
+        try:
+            if self.msg_types is not None and msg.ais_id not in self.msg_types:
+                return False
+            if self.mmsis is not None and msg.mmsi not in self.mmsis:
+                return False
+        except ValueError:
+            # Invalid armor character
+            return False
+        return True
+
+    def _accept(self, msg: NMEAMessage) -> bool:
+        """Apply the filters. Only the first fragment of a message carries the type and the MMSI."""
+        if msg.frag_num != 1:
+            # A later fragment of a multipart message. Skip it if the first fragment was skipped.
+            return self._skipped_slots.get(FragmentBuffer.slot(msg)) != msg.frag_cnt
+
+        accepted = self._matches(msg)
+
+        if msg.frag_cnt > 1:
+            slot = FragmentBuffer.slot(msg)
+            self._skipped_slots.pop(slot, None)
+            if not accepted:
+                # Fragments that arrived before the first one are discarded as well
+                self.fragment_buffer.discard(msg)
+                self._skipped_slots[slot] = msg.frag_cnt
+                if len(self._skipped_slots) > self.fragment_buffer.max_groups:
+                    self._skipped_slots.popitem(last=False)
+        return accepted
+
+    def _parse_line(self, line: bytes) -> typing.Optional[NMEAMessage]:
+        """Returns the message or None, if the line is invalid or rejected by the type filter or checksum policy."""
+        try:
+            msg: NMEAMessage = NMEAMessage(line)
+        except InvalidNMEAMessageException:
+            # Be gentle and just skip invalid messages
+            return None
+
+        if (self.msg_types is not None or self.mmsis is not None) and not self._accept(msg):
+            self.filtered += 1
+            return None
+
+        if self.checksum != CHECKSUM_IGNORE and not msg.is_valid:
+            self.invalid_checksums += 1
+            if self.checksum == CHECKSUM_DROP:
+                return None
+        return msg
+
+    def _assemble_line(self, line: bytes) -> typing.Optional[NMEAMessage]:
+        """Returns the (assembled) message or None, if the line is invalid or the message is still incomplete."""
+        msg = self._parse_line(line)
+        if msg is None:
+            return None
+        return self._assemble(msg)
+
+    def _assemble(self, msg: NMEAMessage) -> typing.Optional[NMEAMessage]:
+        assembled = msg if msg.is_single else self.fragment_buffer.add(msg)
+        if assembled is not None and self.duplicate_filter is not None and self.duplicate_filter.is_duplicate(assembled):
+            return None
+        return assembled
+
+
+class AssembleMessages(MessageAssembler, ABC):
     """
     Base class that assembles multiline messages.
     Offers a iterator like interface.
 
-    This class comes without a __init__ method, because it should never be instantiated!
+    This class should never be instantiated directly!
     """
 
     def __enter__(self) -> "AssembleMessages":
@@ -45,40 +366,11 @@ class AssembleMessages(ABC):
         return next(iter(self))
 
     def _assemble_messages(self) -> Generator[NMEAMessage, None, None]:
-        buffer: typing.Dict[typing.Tuple[int, str], typing.List[typing.Optional[NMEAMessage]]] = {}
-
-        messages = self._iter_messages()
-        for line in messages:
-
-            try:
-                msg: NMEAMessage = NMEAMessage(line)
-            except InvalidNMEAMessageException:
-                # Be gentle and just skip invalid messages
-                continue
-
-            if msg.is_single:
+        assemble = self._assemble_line
+        for line in self._iter_messages():
+            msg = assemble(line)
+            if msg is not None:
                 yield msg
-            else:
-                # Instead of None use -1 as a seq_id
-                seq_id = msg.seq_id
-                if seq_id is None:
-                    seq_id = -1
-
-                # seq_id and channel make a unique stream
-                slot = (seq_id, msg.channel)
-
-                if slot not in buffer:
-                    # Create a new array in the buffer that has enough space for all fragments
-                    buffer[slot] = [None, ] * max(msg.fragment_count, 0xff)
-
-                buffer[slot][msg.frag_num - 1] = msg
-                msg_parts = buffer[slot][0:msg.fragment_count]
-
-                # Check if all fragments are found
-                not_none_parts = [m for m in msg_parts if m is not None]
-                if len(not_none_parts) == msg.fragment_count:
-                    yield NMEAMessage.assemble_from_iterable(not_none_parts)
-                    del buffer[slot]
 
     @abstractmethod
     def _iter_messages(self) -> Generator[bytes, None, None]:
@@ -87,15 +379,16 @@ class AssembleMessages(ABC):
 
 class IterMessages(AssembleMessages):
 
-    def __init__(self, messages: Iterable[bytes]):
+    def __init__(self, messages: Iterable[bytes], **kwargs: typing.Any):
         # If the user passes a single byte string make it into a list
         if isinstance(messages, bytes):
             messages = [messages, ]
         self.messages: Iterable[bytes] = messages
+        super().__init__(**kwargs)
 
     @classmethod
     def from_strings(cls, messages: Iterable[str], ignore_encoding_errors: bool = False,
-                     encoding: str = "utf-8") -> "IterMessages":
+                     encoding: str = "utf-8", **kwargs: typing.Any) -> "IterMessages":
         # If the users passes a single message as string, make it a list
         if isinstance(messages, str):
             messages = [messages, ]
@@ -110,7 +403,7 @@ class IterMessages(AssembleMessages):
                     continue
                 raise e
 
-        return IterMessages(encoded)
+        return IterMessages(encoded, **kwargs)
 
     def _iter_messages(self) -> Generator[bytes, None, None]:
         # Transform self.messages into a generator
@@ -119,12 +412,14 @@ class IterMessages(AssembleMessages):
 
 class Stream(AssembleMessages, Generic[F], ABC):
 
-    def __init__(self, fobj: F) -> None:
+    def __init__(self, fobj: F, **kwargs: typing.Any) -> None:
         """
         Create a new Stream-like object.
         @param fobj: A file-like or socket object.
+        @param kwargs: Keyword arguments of AssembleMessages, e.g. fragment_buffer.
         """
         self._fobj: F = fobj
+        super().__init__(**kwargs)
 
     def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
         if self._fobj is not None:
@@ -140,13 +435,18 @@ class Stream(AssembleMessages, Generic[F], ABC):
 
 
 class BinaryIOStream(Stream[BinaryIO]):
-    """Read messages from a file-like object"""
+    """
+    Read messages from a file-like object.
+    Lines are read lazily one at a time, so that memory usage does not depend on the size of the file.
+    """
 
-    def __init__(self, file: BinaryIO) -> None:
-        super().__init__(file)
+    def __init__(self, file: BinaryIO, **kwargs: typing.Any) -> None:
+        super().__init__(file, **kwargs)
 
     def read(self) -> Generator[bytes, None, None]:
-        yield from self._fobj.readlines()
+        # readline() returns an empty bytes object only at EOF. Lines keep their trailing b"\n" or b"\r\n",
+        # just like readlines() did. NMEAMessage tolerates them.
+        yield from iter(self._fobj.readline, b"")
 
 
 class FileReaderStream(BinaryIOStream):
@@ -154,7 +454,7 @@ class FileReaderStream(BinaryIOStream):
     Read NMEA messages from file
     """
 
-    def __init__(self, filename: str, mode: str = "rb") -> None:
+    def __init__(self, filename: str, mode: str = "rb", **kwargs: typing.Any) -> None:
         self.filename: str = filename
         self.mode: str = mode
         # Try to open file
@@ -163,7 +463,109 @@ class FileReaderStream(BinaryIOStream):
             file = cast(BinaryIO, file)
         except Exception as e:
             raise FileNotFoundError(f"Could not open file {self.filename}") from e
-        super().__init__(file)
+        super().__init__(file, **kwargs)
+
+
+class MmapFileStream(Stream[BinaryIO]):
+    """
+    Read NMEA messages from a memory mapped file.
+
+    Sentence boundaries are found directly in the mapped memory and there is no intermediate read buffer.
+    Lines that do not start with $ or ! are skipped without being copied.
+
+    The stream can start at an arbitrary byte offset. Use `iter_with_offsets()` to get the
+    offset of every message, which can later be passed as `offset` to resume decoding.
+    """
+
+    def __init__(self, filename: str, offset: int = 0, **kwargs: typing.Any) -> None:
+        """
+        @param filename: Path to the file
+        @param offset:   Byte offset of the first line to read. Should be the start of a line.
+        @param kwargs:   Keyword arguments of AssembleMessages, e.g. fragment_buffer.
+        """
+        self.filename: str = filename
+        try:
+            file = cast(BinaryIO, open(self.filename, mode="rb"))
+        except Exception as e:
+            raise FileNotFoundError(f"Could not open file {self.filename}") from e
+
+        self._mmap: typing.Optional[mmap.mmap] = None
+        try:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can not be mapped
+            pass
+        # Byte offset of the next line to read
+        self.offset: int = offset
+        super().__init__(file, **kwargs)
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        super().__exit__(exc_type, exc_val, exc_tb)
+
+    def seek(self, offset: int) -> None:
+        """Continue reading at the given byte offset. Should be the start of a line."""
+        self.offset = offset
+
+    def _iter_lines(self) -> Generator[Tuple[int, bytes], None, None]:
+        """Yields every line that looks like a NMEA sentence together with its byte offset."""
+        mm = self._mmap
+        if mm is None:
+            return
+
+        size = len(mm)
+        find = mm.find
+        while self.offset < size:
+            start = self.offset
+            end = find(b"\n", start)
+            end = size if end == -1 else end + 1
+            self.offset = end
+
+            # Check the first byte in place, before the line is copied
+            if mm[start] not in (DOLLAR_SIGN, EXCLAMATION_POINT):
+                continue
+            # The remaining candidates are copied before the commas are counted. Neither mmap nor memoryview
+            # can count in place and counting with repeated mm.find() calls is about three times slower than
+            # a copy and bytes.count(). Almost all candidates are sentences that are yielded anyway.
+            line = mm[start:end]
+            if should_parse(line):
+                yield start, line
+
+    def read(self) -> Generator[bytes, None, None]:
+        for _, line in self._iter_lines():
+            yield line
+
+    def _iter_messages(self) -> Generator[bytes, None, None]:
+        # Lines are already filtered by _iter_lines()
+        return self.read()
+
+    def iter_with_offsets(self) -> Generator[Tuple[int, NMEAMessage], None, None]:
+        """
+        Yields (offset, message) pairs.
+        The offset is the byte offset of the line that contains the first fragment of the message.
+        Thus passing it as `offset` (or to `seek()`) yields the same message again.
+        """
+        # Offsets of the first fragments of the messages that are currently assembled
+        starts: typing.Dict[Tuple[int, str], int] = {}
+
+        for offset, line in self._iter_lines():
+            msg = self._parse_line(line)
+            if msg is None:
+                continue
+
+            if msg.is_single:
+                assembled = self._assemble(msg)
+                if assembled is not None:
+                    yield offset, assembled
+            else:
+                seq_id = msg.seq_id
+                slot = (seq_id if seq_id is not None else -1, msg.channel)
+                if msg.frag_num == 1:
+                    starts[slot] = offset
+                assembled = self._assemble(msg)
+                if assembled is not None:
+                    yield starts.pop(slot, offset), assembled
 
 
 class ByteStream(Stream[None]):
@@ -171,9 +573,9 @@ class ByteStream(Stream[None]):
     Takes a iterable that contains ais messages as bytes and assembles them.
     """
 
-    def __init__(self, iterable: Iterable[bytes]) -> None:
+    def __init__(self, iterable: Iterable[bytes], **kwargs: typing.Any) -> None:
         self.iterable: Iterable[bytes] = iterable
-        super().__init__(None)
+        super().__init__(None, **kwargs)
 
     def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
         return
@@ -182,6 +584,29 @@ class ByteStream(Stream[None]):
         yield from self.iterable
 
 
+class LineSplitter:
+    """
+    Splits chunks of received data into lines, that are terminated by \\r\\n.
+    Incomplete lines are kept until the rest of the line is received.
+    """
+    __slots__ = ('partial',)
+
+    def __init__(self) -> None:
+        self.partial: bytes = b''
+
+    def feed(self, body: bytes) -> List[bytes]:
+        """Returns all non empty lines, that are completed by body."""
+        lines = body.split(b'\r\n')
+        lines[0] = self.partial + lines[0]
+        self.partial = lines.pop()
+        return [line for line in lines if line]
+
+    def flush(self) -> List[bytes]:
+        """Returns the incomplete line, if any, as a complete line."""
+        partial, self.partial = self.partial, b''
+        return [partial] if partial else []
+
+
 class SocketStream(Stream[socket]):
     BUF_SIZE = 4096
 
@@ -189,7 +614,7 @@ class SocketStream(Stream[socket]):
         return b""
 
     def read(self) -> Generator[bytes, None, None]:
-        partial: bytes = b''
+        splitter = LineSplitter()
         while True:
             body = self.recv()
 
@@ -197,23 +622,15 @@ class SocketStream(Stream[socket]):
             if not body:
                 return None
 
-            lines = body.split(b'\r\n')
-
-            line = partial + lines[0]
-            if line:
-                yield line
-
-            yield from (line for line in lines[1:-1] if line)
-
-            partial = lines[-1]
+            yield from splitter.feed(body)
 
 
 class UDPReceiver(SocketStream):
 
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(self, host: str, port: int, **kwargs: typing.Any) -> None:
         sock: socket = socket(AF_INET, SOCK_DGRAM)
         sock.bind((host, port))
-        super().__init__(sock)
+        super().__init__(sock, **kwargs)
 
     def recv(self) -> bytes:
         return self._fobj.recvfrom(self.BUF_SIZE)[0]
@@ -228,11 +645,174 @@ class TCPConnection(SocketStream):
     def recv(self) -> bytes:
         return self._fobj.recv(self.BUF_SIZE)
 
-    def __init__(self, host: str, port: int = 80) -> None:
+    def __init__(self, host: str, port: int = 80, **kwargs: typing.Any) -> None:
         sock: socket = socket(AF_INET, SOCK_STREAM)
         try:
             sock.connect((host, port))
         except ConnectionRefusedError as e:
             sock.close()
             raise ConnectionRefusedError(f"Failed to connect to {host}:{port}") from e
-        super().__init__(sock)
+        super().__init__(sock, **kwargs)
+
+
+class AsyncStream(MessageAssembler, ABC):
+    """
+    Base class of the asyncio streams. Offers an async iterator like interface:
+
+    >>> async with AsyncTCPConnection(host, port) as stream:
+    ...     async for msg in stream:
+    ...         print(msg.decode())
+
+    Data is only received while the stream is consumed, so a slow consumer
+    applies backpressure to the underlying connection.
+    """
+    BUF_SIZE = 4096
+    # If True, every chunk of data is a datagram that ends with a complete line, even if the terminating
+    # \r\n is missing. Otherwise, incomplete lines are kept until the rest of the line is received.
+    DATAGRAMS = False
+
+    async def __aenter__(self) -> "AsyncStream":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        await self.close()
+
+    def __aiter__(self) -> AsyncGenerator[NMEAMessage, None]:
+        return self._assemble_messages()
+
+    async def _assemble_messages(self) -> AsyncGenerator[NMEAMessage, None]:
+        if not self.connected:
+            await self.connect()
+
+        splitter = LineSplitter()
+        assemble = self._assemble_line
+        while True:
+            body = await self.recv()
+
+            # Connection closed
+            if not body:
+                return
+
+            lines = splitter.feed(body)
+            if self.DATAGRAMS:
+                # Never join the tail of a datagram with the next datagram
+                lines += splitter.flush()
+
+            for line in lines:
+                if should_parse(line):
+                    msg = assemble(line)
+                    if msg is not None:
+                        yield msg
+
+    @property
+    @abstractmethod
+    def connected(self) -> bool:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def connect(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def recv(self) -> bytes:
+        """Returns the next chunk of data or an empty bytes object, if the connection was closed."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError()
+
+
+class AsyncTCPConnection(AsyncStream):
+    """
+    Read AIS data from a remote TCP server using asyncio streams.
+    """
+
+    def __init__(self, host: str, port: int = 80, **kwargs: typing.Any) -> None:
+        self.host: str = host
+        self.port: int = port
+        self._reader: typing.Optional[asyncio.StreamReader] = None
+        self._writer: typing.Optional[asyncio.StreamWriter] = None
+        super().__init__(**kwargs)
+
+    @property
+    def connected(self) -> bool:
+        return self._reader is not None
+
+    async def connect(self) -> None:
+        try:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        except ConnectionRefusedError as e:
+            raise ConnectionRefusedError(f"Failed to connect to {self.host}:{self.port}") from e
+
+    async def recv(self) -> bytes:
+        assert self._reader is not None
+        return await self._reader.read(self.BUF_SIZE)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+
+class _DatagramQueue(asyncio.DatagramProtocol):
+    """Puts received datagrams into a bounded queue. Datagrams are dropped, if the queue is full."""
+
+    def __init__(self, receiver: "AsyncUDPReceiver", queue: "asyncio.Queue[bytes]") -> None:
+        self.receiver = receiver
+        self.queue = queue
+
+    def datagram_received(self, data: bytes, addr: typing.Tuple[str, int]) -> None:
+        if self.queue.full():
+            self.receiver.dropped += 1
+        else:
+            self.queue.put_nowait(data)
+
+    def connection_lost(self, exc: typing.Optional[Exception]) -> None:
+        # Wake up the consumer. Make room for the marker, if necessary.
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.receiver.dropped += 1
+        self.queue.put_nowait(b'')
+
+
+class AsyncUDPReceiver(AsyncStream):
+    """
+    Receive AIS data over UDP using an asyncio datagram endpoint.
+
+    UDP has no flow control. Therefore received datagrams are kept in a queue of at most
+    `max_queue` datagrams. If the consumer falls behind, new datagrams are dropped and counted in `dropped`.
+    Every datagram must contain complete lines. Lines are never joined across datagrams.
+    """
+    DATAGRAMS = True
+
+    def __init__(self, host: str, port: int, max_queue: int = 4096, **kwargs: typing.Any) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.max_queue: int = max_queue
+        self.dropped: int = 0
+        self._transport: typing.Optional[asyncio.BaseTransport] = None
+        self._queue: typing.Optional["asyncio.Queue[bytes]"] = None
+        super().__init__(**kwargs)
+
+    @property
+    def connected(self) -> bool:
+        return self._transport is not None
+
+    async def connect(self) -> None:
+        # The queue is created here, so that it belongs to the running event loop
+        queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=self.max_queue)
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DatagramQueue(self, queue), local_addr=(self.host, self.port)
+        )
+        self._queue = queue
+
+    async def recv(self) -> bytes:
+        assert self._queue is not None
+        return await self._queue.get()
+
+    async def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
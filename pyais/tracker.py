@@ -0,0 +1,202 @@
+import time
+import typing
+from collections import OrderedDict
+
+from pyais.exceptions import InvalidNMEAMessageException, UnknownPartNoException
+from pyais.messages import ENUM_FIELDS, ANY_MESSAGE, NMEAMessage, Payload
+from pyais.spatial import GridIndex
+
+# Message types that report the position of a vessel or a SAR aircraft (9)
+POSITION_MSG_TYPES = frozenset((1, 2, 3, 9, 18, 19, 27))
+# Message types that report static and voyage related data
+STATIC_MSG_TYPES = frozenset((5, 24))
+
+POSITION_FIELDS = ('lat', 'lon', 'speed', 'course', 'heading', 'status', 'turn')
+STATIC_FIELDS = (
+    'shipname', 'callsign', 'imo', 'ship_type', 'to_bow', 'to_stern', 'to_port', 'to_starboard',
+    'destination', 'draught',
+)
+
+
+class Vessel:
+    """
+    The current state of a single vessel. Fields that were never reported are None.
+
+    last_seen:      Timestamp of the last message of the vessel
+    position_time:  Timestamp of the last position report
+    """
+    __slots__ = ('mmsi', 'last_seen', 'position_time') + POSITION_FIELDS + STATIC_FIELDS
+
+    def __init__(self, mmsi: int) -> None:
+        self.mmsi: int = mmsi
+        self.last_seen: float = 0.0
+        self.position_time: typing.Optional[float] = None
+        # Position
+        self.lat: typing.Optional[float] = None
+        self.lon: typing.Optional[float] = None
+        self.speed: typing.Optional[float] = None
+        self.course: typing.Optional[float] = None
+        self.heading: typing.Optional[int] = None
+        self.status: typing.Optional[int] = None
+        self.turn: typing.Optional[float] = None
+        # Static and voyage related data
+        self.shipname: typing.Optional[str] = None
+        self.callsign: typing.Optional[str] = None
+        self.imo: typing.Optional[int] = None
+        self.ship_type: typing.Optional[int] = None
+        self.to_bow: typing.Optional[int] = None
+        self.to_stern: typing.Optional[int] = None
+        self.to_port: typing.Optional[int] = None
+        self.to_starboard: typing.Optional[int] = None
+        self.destination: typing.Optional[str] = None
+        self.draught: typing.Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"Vessel(mmsi={self.mmsi}, lat={self.lat}, lon={self.lon})"
+
+    def asdict(self, enum_as_int: bool = False) -> typing.Dict[str, typing.Any]:
+        """
+        Convert the vessel to a dictionary.
+        @param enum_as_int: If set to True all Enum values will be returned as raw ints.
+        """
+        d = {name: getattr(self, name) for name in self.__slots__}
+        if enum_as_int:
+            for name in ENUM_FIELDS.intersection(d):
+                if d[name] is not None:
+                    d[name] = int(d[name])
+        return d
+
+
+# Payload class -> names of the fields that are copied into a Vessel
+_TRACKED_FIELDS: typing.Dict[typing.Type[Payload], typing.Tuple[str, ...]] = {}
+
+
+def _tracked_fields(cls: typing.Type[Payload]) -> typing.Tuple[str, ...]:
+    try:
+        return _TRACKED_FIELDS[cls]
+    except KeyError:
+        names = {field.name for field in cls.fields()}
+        fields = _TRACKED_FIELDS[cls] = tuple(name for name in POSITION_FIELDS + STATIC_FIELDS if name in names)
+        return fields
+
+
+class VesselTracker:
+    """
+    Keeps the current state of every vessel: the last position from message types 1, 2, 3, 9, 18, 19 and 27
+    merged with the static data from message types 5 and 24. Type 19 reports some static fields as well,
+    e.g. the ship name and type, which are merged, too. SAR aircraft (type 9) are tracked like vessels.
+
+    >>> tracker = VesselTracker(ttl=600)
+    >>> tracker.consume(stream)
+    >>> tracker[227006760].lat
+
+    Every vessel is a single `Vessel` record. Only the fields of a message that are part of the record
+    are copied. Vessels that did not send a message within `ttl` seconds are removed.
+    Timestamps passed to `update` must not decrease.
+
+    If an `index` is given, it is kept up to date with the last available position of every vessel:
+
+    >>> tracker = VesselTracker(index=GridIndex())
+    >>> tracker.index.within(49.48, 0.1, radius=20)
+    """
+
+    def __init__(self, ttl: typing.Optional[float] = 3600.0, index: typing.Optional[GridIndex] = None) -> None:
+        """
+        @param ttl:     Number of seconds after which a silent vessel is removed. None to keep all vessels.
+        @param index:   Spatial index of the positions of the vessels. None to disable.
+        """
+        self.ttl: typing.Optional[float] = ttl
+        self.index: typing.Optional[GridIndex] = index
+        self.expired: int = 0
+        # Ordered from the least to the most recently seen vessel
+        self._vessels: typing.OrderedDict[int, Vessel] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._vessels)
+
+    def __contains__(self, mmsi: object) -> bool:
+        return mmsi in self._vessels
+
+    def __getitem__(self, mmsi: int) -> Vessel:
+        return self._vessels[mmsi]
+
+    def __iter__(self) -> typing.Iterator[Vessel]:
+        return iter(list(self._vessels.values()))
+
+    def get(self, mmsi: int) -> typing.Optional[Vessel]:
+        return self._vessels.get(mmsi)
+
+    def update(self, msg: ANY_MESSAGE, timestamp: typing.Optional[float] = None) -> typing.Optional[Vessel]:
+        """
+        Merge a decoded message into the record of its vessel.
+        @param msg:         A decoded message
+        @param timestamp:   Time of reception in seconds since the epoch. Defaults to now.
+        @return:            The updated vessel or None, if the message type is not tracked
+        """
+        msg_type: int = getattr(msg, 'msg_type')
+        if msg_type not in POSITION_MSG_TYPES and msg_type not in STATIC_MSG_TYPES:
+            return None
+
+        now = time.time() if timestamp is None else timestamp
+        self.expire(now)
+
+        mmsi: int = getattr(msg, 'mmsi')
+        vessels = self._vessels
+        vessel = vessels.get(mmsi)
+        if vessel is None:
+            vessel = vessels[mmsi] = Vessel(mmsi)
+        else:
+            vessels.move_to_end(mmsi)
+
+        for name in _tracked_fields(type(msg)):
+            setattr(vessel, name, getattr(msg, name))
+        vessel.last_seen = now
+        if msg_type in POSITION_MSG_TYPES:
+            vessel.position_time = now
+            if self.index is not None and not self.index.update_from(msg):
+                # The position is not available
+                self.index.remove(mmsi)
+        return vessel
+
+    def consume(self, messages: typing.Iterable[NMEAMessage]) -> None:
+        """
+        Decode and track the messages of a stream. Messages of other types are skipped without being decoded.
+        Corrupted messages, that can not be decoded, are skipped as well.
+        """
+        update = self.update
+        for msg in messages:
+            try:
+                msg_type = msg.ais_id
+                if msg_type not in POSITION_MSG_TYPES and msg_type not in STATIC_MSG_TYPES:
+                    continue
+                decoded = msg.decode()
+            except (InvalidNMEAMessageException, UnknownPartNoException, ValueError):
+                continue
+            update(decoded)
+
+    def expire(self, now: typing.Optional[float] = None) -> int:
+        """
+        Remove all vessels that did not send a message within `ttl` seconds.
+        @param now: The current time in seconds since the epoch. Defaults to now.
+        @return:    The number of removed vessels
+        """
+        if self.ttl is None:
+            return 0
+
+        deadline = (time.time() if now is None else now) - self.ttl
+        vessels = self._vessels
+        removed = 0
+        while vessels and next(iter(vessels.values())).last_seen < deadline:
+            mmsi, _ = vessels.popitem(last=False)
+            if self.index is not None:
+                self.index.remove(mmsi)
+            removed += 1
+        self.expired += removed
+        return removed
+
+    def snapshot(self, enum_as_int: bool = False) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Export the state of all vessels as a list of dictionaries, e.g. to serialize it as JSON.
+        @param enum_as_int: If set to True all Enum values will be returned as raw ints.
+        """
+        return [vessel.asdict(enum_as_int) for vessel in self._vessels.values()]
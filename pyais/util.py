@@ -1,14 +1,24 @@
 import base64
 import typing
+from binascii import a2b_base64, b2a_base64
 from collections import OrderedDict
-from functools import partial, reduce
-from operator import xor
+from functools import partial
 from typing import Any, Generator, Hashable, TYPE_CHECKING, Union, Dict
 
-from bitarray import bitarray
-
 from pyais.constants import SyncState
 
+try:
+    from bitarray import bitarray as bitarray
+except ImportError:  # pragma: no cover
+    class bitarray:  # type: ignore
+        """
+        Placeholder if the bitarray package is not installed.
+        Decoding works without bitarray. Encoding and the bitarray based API require it.
+        """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            raise ImportError("This feature requires the bitarray package: pip install bitarray")
+
 if TYPE_CHECKING:
     BaseDict = OrderedDict[Hashable, Any]
 else:
@@ -20,6 +30,87 @@ from_bytes_signed = partial(int.from_bytes, byteorder="big", signed=True)
 T = typing.TypeVar('T')
 
 
+# Six-bit armor -> standard BASE64 alphabet. Every valid armor character maps to the BASE64 digit
+# that carries the same six bit value. This way the C implementation of `binascii.a2b_base64`
+# can unarmor a whole payload at once, instead of converting each character in Python.
+_B64_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+_ARMOR_CHARS = bytes(range(0x30, 0x78))
+_ARMOR_TO_B64 = bytes.maketrans(
+    _ARMOR_CHARS,
+    bytes(_B64_ALPHABET[(c - (0x30 if c < 0x60 else 0x38)) & 0x3F] for c in _ARMOR_CHARS)
+)
+
+
+# Armor character -> six bit value. Invalid characters map to -1.
+_ARMOR_VALUES = [(c - (0x30 if c < 0x60 else 0x38)) & 0x3F if c in _ARMOR_CHARS else -1 for c in range(256)]
+
+# BASE64 alphabet -> six-bit ASCII. Used to decode text fields.
+# The zero value is mapped to '@', which terminates a string.
+_B64_TO_ASCII6 = bytes.maketrans(_B64_ALPHABET, bytes(n + 0x40 if n < 0x20 else n for n in range(64)))
+
+# The inverse tables for encoding: BASE64 -> armor and six-bit ASCII -> BASE64.
+_B64_TO_ARMOR = bytes.maketrans(_B64_ALPHABET, bytes(n + 0x30 if n < 40 else n + 0x38 for n in range(64)))
+_ASCII6_CHARS = bytes(range(0x20, 0x60))
+_ASCII6_TO_B64 = bytes.maketrans(_ASCII6_CHARS, bytes(_B64_ALPHABET[c & 0x3F] for c in _ASCII6_CHARS))
+
+
+def unarmor(data: bytes) -> bytes:
+    """
+    Convert an armored payload into its binary representation.
+    The result is padded with zero bits to a multiple of 24 bits.
+    :param data:        Armored AIS payload in bytes
+    :return:            Binary representation of the payload
+    """
+    invalid = data.translate(None, _ARMOR_CHARS)
+    if invalid:
+        raise ValueError(f"Invalid character: {chr(invalid[0])}")
+
+    # Pad to a multiple of four characters (24 bits) with zeros, so that the BASE64 decoder accepts it
+    return a2b_base64(data.translate(_ARMOR_TO_B64) + b'A' * (-len(data) % 4))
+
+
+def armor(val: int, length: int) -> typing.Tuple[str, int]:
+    """
+    Convert the binary representation of a payload into its armored form. The inverse of `unarmor`.
+    :param val:         Non-negative integer holding the payload bits
+    :param length:      The number of bits in `val`
+    :return:            Armored payload and the number of fill bits required to pad it to a 6 bit boundary
+    """
+    fill_bits = -length % 6
+    n_chars = (length + fill_bits) // 6
+
+    # Pad to a multiple of 24 bits with zeros, encode as BASE64 and translate into the armor alphabet
+    pad = -n_chars % 4 * 6
+    raw = (val << (fill_bits + pad)).to_bytes((n_chars * 6 + pad) // 8, 'big')
+    return b2a_base64(raw, newline=False)[:n_chars].translate(_B64_TO_ARMOR).decode('ascii'), fill_bits
+
+
+def decode_armor_char(c: int) -> int:
+    """
+    Decode a single armored character into its six bit value.
+    :param c:   The armored character as an int, e.g. `payload[0]`
+    :return:    The six bit value
+    """
+    val = _ARMOR_VALUES[c]
+    if val < 0:
+        raise ValueError(f"Invalid character: {chr(c)}")
+    return val
+
+
+def decode_mmsi(data: bytes, fill_bits: int = 0) -> typing.Optional[int]:
+    """
+    Extract the MMSI from an armored payload without decoding the whole payload.
+    Every message type carries the MMSI at bits 8-38, i.e. in the second to seventh character.
+    :param data:        Raw AIS message in bytes
+    :param fill_bits:   Number of trailing fill bits to be ignored
+    :return:            The MMSI or None, if the payload is too short
+    """
+    if len(data) * 6 - fill_bits < 38:
+        return None
+    # The first 8 characters are 48 bits. The MMSI is followed by 10 other bits.
+    return (from_bytes(unarmor(data[:8])) >> 10) & 0x3FFFFFFF
+
+
 def decode_into_bit_array(data: bytes, fill_bits: int = 0) -> bitarray:
     """
     Decodes a raw AIS message into a bitarray.
@@ -28,25 +119,49 @@ def decode_into_bit_array(data: bytes, fill_bits: int = 0) -> bitarray:
     :return:
     """
     bit_arr = bitarray()
-    length = len(data)
-    for i, c in enumerate(data):
-        if c < 0x30 or c > 0x77 or 0x57 < c < 0x6:
-            raise ValueError(f"Invalid character: {chr(c)}")
-
-        # Convert 8 bit binary to 6 bit binary
-        c -= 0x30 if (c < 0x60) else 0x38
-        c &= 0x3F
-
-        if i == length - 1 and fill_bits:
-            # The last part be shorter than 6 bits and contain fill bits
-            c = c >> fill_bits
-            bit_arr += bitarray(f'{c:b}'.zfill(6 - fill_bits))
-        else:
-            bit_arr += bitarray(f'{c:06b}')
+    bit_arr.frombytes(unarmor(data))
+    del bit_arr[max(len(data) * 6 - fill_bits, 0):]
+    return bit_arr
+
+
+def decode_into_int(data: bytes, fill_bits: int = 0) -> typing.Tuple[int, int]:
+    """
+    Decodes a raw AIS message into a single integer.
+    :param data:        Raw AIS message in bytes
+    :param fill_bits:   Number of trailing fill bits to be ignored
+    :return:            Tuple of the integer and the number of bits it holds
+    """
+    raw = unarmor(data)
+    length = max(len(data) * 6 - fill_bits, 0)
+    return from_bytes(raw) >> (len(raw) * 8 - length), length
 
+
+def int_to_bitarray(val: int, length: int) -> bitarray:
+    """
+    Convert an integer that holds `length` bits into a bitarray.
+    :param val:         Non-negative integer
+    :param length:      The number of bits
+    :return:            Bitarray of exactly `length` bits
+    """
+    bit_arr = bitarray()
+    bit_arr.frombytes((val << (-length % 8)).to_bytes((length + 7) // 8, 'big'))
+    del bit_arr[length:]
     return bit_arr
 
 
+def slice_int(val: int, length: int, ix_low: int, ix_high: int) -> int:
+    """
+    Get the value of the bits [ix_low:ix_high] of an integer holding `length` bits.
+    Missing bits beyond `length` are treated as zeros.
+    """
+    width = ix_high - ix_low
+    if ix_high <= length:
+        return (val >> (length - ix_high)) & ((1 << width) - 1)
+    if ix_low >= length:
+        return 0
+    return (val & ((1 << (length - ix_low)) - 1)) << (ix_high - length)
+
+
 def chunks(sequence: typing.Sequence[T], n: int) -> Generator[typing.Sequence[T], None, None]:
     """Yield successive n-sized chunks from sequence."""
     return (sequence[i:i + n] for i in range(0, len(sequence), n))
@@ -79,6 +194,23 @@ def decode_bin_as_ascii6(bit_arr: bitarray) -> str:
     return string.strip()
 
 
+def decode_int_as_ascii6(val: int, width: int) -> str:
+    """
+    Decode the `width` lowest bits of an integer as 6 bit ASCII.
+    Behaves exactly like `decode_bin_as_ascii6` for a bitarray holding the same bits.
+    :param val:     integer holding the bits
+    :param width:   number of bits to decode
+    :return: ASCII String
+    """
+    # Pad to a multiple of 24 bits with zeros and translate each 6 bit group through a lookup table
+    pad = -width % 24
+    raw = (val << pad).to_bytes((width + pad) // 8, 'big')
+    text = b2a_base64(raw, newline=False).translate(_B64_TO_ASCII6)
+
+    # Break if there is an @
+    return text.partition(b'@')[0].decode('ascii').strip()
+
+
 def get_int(data: bitarray, ix_low: int, ix_high: int, signed: bool = False) -> int:
     """
     Cast a subarray of a bitarray into an integer.
@@ -102,7 +234,7 @@ def compute_checksum(msg: Union[str, bytes]) -> int:
     This method takes the **whole** message including the leading `!`.
 
     >>> compute_checksum(b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0")
-    91
+    92
 
     :param msg: message
     :return: int value of the checksum. Format as hex with `f'{checksum:02x}'`
@@ -110,8 +242,43 @@ def compute_checksum(msg: Union[str, bytes]) -> int:
     if isinstance(msg, str):
         msg = msg.encode()
 
-    msg = msg[1:].split(b'*', 1)[0]
-    return reduce(xor, msg)
+    end = msg.find(b'*', 1)
+    return xor_checksum(msg[1:end] if end >= 0 else msg[1:])
+
+
+def _fold_steps(length: int) -> typing.List[typing.Tuple[int, int]]:
+    """Shifts and masks that fold an integer of `length` bytes in halves down to a single byte."""
+    width = 8
+    while width < length * 8:
+        width *= 2
+
+    steps = []
+    while width > 8:
+        width //= 2
+        steps.append((width, (1 << width) - 1))
+    return steps
+
+
+# Precomputed fold steps for every length up to the longest possible sentence and a bit more
+_FOLD_STEPS = [_fold_steps(length) for length in range(256)]
+
+
+def xor_checksum(data: bytes) -> int:
+    """
+    XOR all bytes of `data` - the NMEA 0183 checksum of everything between `!` and `*`.
+
+    Instead of XORing byte by byte in Python, the data is converted into a single integer,
+    which is then folded in halves: the upper half is XORed onto the lower half until
+    a single byte remains. This needs only a handful of integer operations per sentence.
+
+    >>> xor_checksum(b"AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0")
+    92
+    """
+    val = int.from_bytes(data, 'little')
+    steps = _FOLD_STEPS[len(data)] if len(data) < 256 else _fold_steps(len(data))
+    for shift, mask in steps:
+        val = (val >> shift) ^ (val & mask)
+    return val
 
 
 # https://gpsd.gitlab.io/gpsd/AIVDM.html#_aivdmaivdo_payload_armoring
@@ -158,15 +325,8 @@ def encode_ascii_6(bits: bitarray) -> typing.Tuple[str, int]:
     @param bits: The bitarray to convert to an ASCII-encoded bit vector.
     @return: ASCII-encoded bit vector and the number of fill bits required to pad the data payload to a 6 bit boundary.
     """
-    out = ""
-    chunk: bitarray
-    padding = 0
-    for chunk in chunks(bits, 6):  # type:ignore
-        padding = 6 - len(chunk)
-        num = from_bytes(chunk.tobytes()) >> 2
-        armor = PAYLOAD_ARMOR[num]
-        out += armor
-    return out, padding
+    length = len(bits)
+    return armor(from_bytes(bits.tobytes()) >> (-length % 8), length)
 
 
 def int_to_bytes(val: typing.Union[int, bytes]) -> int:
@@ -254,23 +414,49 @@ def str_to_bin(val: str, width: int) -> bitarray:
     @param width:   The width of the full string. If the string has fewer characters than width, trailing '@' are added.
     @return:        The binary representation of value with exactly width bits. Type is bitarray.
     """
-    out = bitarray(endian='big')
+    return int_to_bitarray(str_to_int(val, width), int(width / 6) * 6)
+
+
+def str_to_int(val: str, width: int) -> int:
+    """
+    Convert a string value to an integer using six-bit ASCII encoding up to `width` chars.
+    The integer holds the same bits as `str_to_bin(val, width)`.
 
-    # Each char will be converted to a six-bit binary vector.
+    @param val:     The string to convert.
+    @param width:   The width of the full string. If the string has fewer characters than width, trailing '@' are added.
+    @return:        Integer holding exactly floor(width / 6) * 6 bits.
+    """
+    # Each char will be converted to a six-bit value.
     # Therefore, the total number of chars is floor(WIDTH / 6).
     num_chars = int(width / 6)
 
-    # Add trailing '@' if the string is shorter than `width`
-    for _ in range(num_chars - len(val)):
-        val += "@"
+    # Add trailing '@' if the string is shorter than `width` and encode AT MOST width characters
+    text = val[:num_chars].ljust(num_chars, '@')
 
-    # Encode AT MOST width characters
-    for char in val[:num_chars]:
-        # Covert each char to six-bit ASCII vector
-        txt = to_six_bit(char)
-        out += bitarray(txt)
+    if not text.isascii():
+        # Upper casing some non ASCII characters yields ASCII characters. Encode them one by one.
+        out = 0
+        for char in text:
+            out = (out << 6) | int(to_six_bit(char), 2)
+        return out
 
-    return out
+    # Translate to BASE64 and let the C implementation of `binascii.a2b_base64` do the rest
+    raw = text.upper().encode('ascii')
+    invalid = raw.translate(None, _ASCII6_CHARS)
+    if invalid:
+        raise ValueError(f"received char '{chr(invalid[0])}' that cant be encoded")
+
+    pad = -num_chars % 4
+    return from_bytes(a2b_base64(raw.translate(_ASCII6_TO_B64) + b'A' * pad)) >> (pad * 6)
+
+
+# Lookup tables for the numbers that commonly occur in NMEA sentences.
+# Parsing them with int() is considerably slower than a dict lookup.
+DECIMALS: Dict[bytes, int] = {str(i).encode(): i for i in range(256)}
+HEX_PAIRS: Dict[bytes, int] = {
+    **{f'{i:02x}'.encode(): i for i in range(256)},
+    **{f'{i:02X}'.encode(): i for i in range(256)},
+}
 
 
 def chk_to_int(chk_str: bytes) -> typing.Tuple[int, int]:
@@ -282,11 +468,16 @@ def chk_to_int(chk_str: bytes) -> typing.Tuple[int, int]:
     if not len(chk_str):
         return 0, -1
 
-    fill_bits: int = int(chr(chk_str[0]))
-    try:
-        checksum = int(chk_str[2:], 16)
-    except (IndexError, ValueError):
-        checksum = -1
+    fill_bits = DECIMALS.get(chk_str[:1])
+    if fill_bits is None:
+        fill_bits = int(chr(chk_str[0]))
+
+    checksum = HEX_PAIRS.get(chk_str[2:])
+    if checksum is None:
+        try:
+            checksum = int(chk_str[2:], 16)
+        except (IndexError, ValueError):
+            checksum = -1
     return fill_bits, checksum
 
 
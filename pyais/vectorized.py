@@ -0,0 +1,196 @@
+"""
+Vectorized decoding of many payloads at once using NumPy.
+
+Requires NumPy: pip install pyais[numpy]
+"""
+import typing
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("This feature requires the numpy package: pip install pyais[numpy]") from e
+
+from pyais.batch import DEFAULT_FIELDS, MSG_VARIANTS, column_types, payload_classes
+from pyais.messages import Payload, to_10th, to_lat_lon, to_lat_lon_600, to_speed, to_turn
+
+DEFAULT_MSG_TYPES = (1, 2, 3, 18, 19)
+
+# Armor character -> 6 bit value. Invalid characters are mapped to 0xFF.
+ARMOR_TABLE = np.full(256, 0xFF, dtype=np.uint8)
+ARMOR_TABLE[0x30:0x58] = np.arange(0, 40, dtype=np.uint8)
+ARMOR_TABLE[0x60:0x78] = np.arange(40, 64, dtype=np.uint8)
+
+# Fields wider than this can not be extracted into a 64 bit integer
+MAX_WIDTH = 57
+
+
+def _vectorized_turn(x: typing.Any) -> typing.Any:
+    x = x.astype(np.float64)
+    out = np.copysign(np.round(x / 4.733) ** 2, x)
+    out[x == 0] = 0.0
+    out[(np.abs(x) == 127) | (np.abs(x) == 128)] = np.nan
+    return out
+
+
+# Vectorized equivalents of the to_converters in pyais.messages. NaN marks None.
+VECTORIZED_CONVERTERS: typing.Dict[typing.Callable[[typing.Any], typing.Any], typing.Callable[[typing.Any], typing.Any]] = {
+    to_speed: lambda x: x / 10.0,
+    to_10th: lambda x: x / 10.0,
+    to_lat_lon: lambda x: np.round(x / 600000.0, 6),
+    to_lat_lon_600: lambda x: np.round(x / 600.0, 6),
+    to_turn: _vectorized_turn,
+}
+
+
+def unarmor(payloads: typing.Sequence[bytes]) -> typing.Tuple[typing.Any, typing.Any]:
+    """
+    Pack the payloads into a 2-D uint8 array of 6 bit values. Shorter payloads are padded with zeros.
+    @return: The array and a boolean array that is False for payloads with invalid characters
+    """
+    width = max((len(payload) for payload in payloads), default=0)
+    packed = b''.join(payload.ljust(width, b'0') for payload in payloads)
+    chars = np.frombuffer(packed, dtype=np.uint8).reshape(len(payloads), width)
+    values = ARMOR_TABLE[chars]
+    return values, ~(values == 0xFF).any(axis=1)
+
+
+def extract_bits(values: typing.Any, start: int, width: int, signed: bool = False) -> typing.Any:
+    """
+    Extract `width` bits starting at bit `start` from every row of 6 bit values.
+    The values must contain at least (start + width) bits per row.
+    """
+    if width > MAX_WIDTH:
+        raise ValueError(f"Fields wider than {MAX_WIDTH} bits can not be extracted")
+
+    first, last = start // 6, (start + width - 1) // 6
+    acc = np.zeros(values.shape[0], dtype=np.uint64)
+    for col in range(first, last + 1):
+        acc = (acc << np.uint64(6)) | values[:, col].astype(np.uint64)
+
+    # Drop the bits after the field and then the bits before the field
+    acc >>= np.uint64((last + 1) * 6 - start - width)
+    acc &= np.uint64((1 << width) - 1)
+
+    result = acc.astype(np.int64)
+    if signed:
+        sign = np.int64(1 << (width - 1))
+        result = (result ^ sign) - sign
+    return result
+
+
+def _convert(field: typing.Any, raw: typing.Any) -> typing.Tuple[typing.Any, typing.Any]:
+    """Apply the data type and the converter of a field. Returns the values and a boolean validity mask."""
+    d_type = field.metadata['d_type']
+    converter = field.metadata['to_converter']
+
+    if converter is None:
+        values = raw.astype(np.float64) if d_type is float else raw
+        return values, np.ones(raw.shape, dtype=bool)
+
+    if converter in VECTORIZED_CONVERTERS:
+        values = VECTORIZED_CONVERTERS[converter](raw.astype(np.float64) if d_type is float else raw)
+    elif d_type is int:
+        # Enum converters: the result equals asdict(enum_as_int=True), which is the raw value
+        return raw, np.ones(raw.shape, dtype=bool)
+    else:
+        # Unknown converter: fall back to calling it for every value
+        values = np.array([converter(d_type(v)) for v in raw.tolist()], dtype=object)
+        valid = values != None  # noqa: E711
+        values[~valid] = np.nan
+        return values.astype(np.float64), valid
+
+    if d_type is float:
+        return values, ~np.isnan(values)
+    return values, np.ones(raw.shape, dtype=bool)
+
+
+def decode_payloads(payloads: typing.Sequence[bytes],
+                    fill_bits: typing.Optional[typing.Sequence[int]] = None,
+                    msg_types: typing.Iterable[int] = DEFAULT_MSG_TYPES,
+                    fields: typing.Sequence[str] = DEFAULT_FIELDS) -> typing.Dict[str, typing.Any]:
+    """
+    Decode the numeric fields of many armored payloads at once.
+
+    The field layout is taken from the `bit_field` definitions of the message classes.
+    Payloads of other message types and payloads with invalid characters are skipped.
+    Unlike `decode_batch` fields that are truncated, because a payload is too short, are masked.
+
+    @param payloads:    The armored payloads, e.g. `NMEAMessage.payload`
+    @param fill_bits:   Number of fill bits of every payload. Defaults to 0.
+    @param msg_types:   Only messages of these types are decoded
+    @param fields:      Names of numeric fields
+    @return:            One NumPy masked array per field, the same as `decode_batch(...).to_numpy()`
+    """
+    names = ('msg_type',) + tuple(name for name in fields if name != 'msg_type')
+    classes = payload_classes(msg_types)
+    typecodes = column_types(list(classes.values()), names)
+
+    values, ok = unarmor(payloads)
+    if values.shape[1] == 0:
+        ok &= False
+    msg_type = np.where(ok, values[:, 0] if values.shape[1] else 0, 0).astype(np.int64)
+    ok &= np.isin(msg_type, [t for t, _ in classes])
+
+    lengths = np.fromiter((len(payload) for payload in payloads), dtype=np.int64, count=len(payloads)) * 6
+    if fill_bits is not None:
+        lengths -= np.asarray(fill_bits, dtype=np.int64)
+
+    rows = np.flatnonzero(ok)
+    values, lengths, msg_type = values[rows], lengths[rows], msg_type[rows]
+    variant = _variants(values, msg_type)
+
+    # Drop payloads of unknown variants, e.g. partno 2 of type 24
+    known = np.zeros(len(rows), dtype=bool)
+    for t, v in classes:
+        known |= (msg_type == t) & (variant == v)
+    values, lengths, msg_type, variant = values[known], lengths[known], msg_type[known], variant[known]
+
+    out = {}
+    for name, code in zip(names, typecodes):
+        data = np.zeros(len(values), dtype=code) if code != 'd' else np.full(len(values), np.nan)
+        valid = np.zeros(len(values), dtype=bool)
+
+        for (t, v), cls in classes.items():
+            _extract_field(cls, name, values, lengths, (msg_type == t) & (variant == v), data, valid)
+
+        out[name] = np.ma.MaskedArray(data, mask=~valid)
+    return out
+
+
+def _variants(values: typing.Any, msg_type: typing.Any) -> typing.Any:
+    """The variant of every row (see `pyais.batch.MSG_VARIANTS`). Missing bits are treated as zeros."""
+    variant = np.zeros(len(values), dtype=np.int64)
+    for t, (start, end, _) in MSG_VARIANTS.items():
+        rows = np.flatnonzero(msg_type == t)
+        if not len(rows):
+            continue
+        selected = values[rows]
+        missing = (end + 5) // 6 - selected.shape[1]
+        if missing > 0:
+            selected = np.pad(selected, ((0, 0), (0, missing)))
+        variant[rows] = extract_bits(selected, start, end - start)
+    return variant
+
+
+def _extract_field(cls: typing.Type[Payload], name: str, values: typing.Any, lengths: typing.Any,
+                   selected: typing.Any, data: typing.Any, valid: typing.Any) -> None:
+    """Extract the field `name` of all `selected` rows into `data` and `valid`."""
+    start = 0
+    for field in cls.fields():
+        width = field.metadata['width']
+        if field.name == name:
+            break
+        start += width
+    else:
+        # The message type has no such field
+        return
+
+    # Rows of this type, that are long enough to contain the whole field
+    rows = np.flatnonzero(selected & (lengths >= start + width))
+    if not len(rows):
+        return
+
+    raw = extract_bits(values[rows], start, width, field.metadata['signed'])
+    converted, ok = _convert(field, raw)
+    data[rows] = converted
+    valid[rows] = ok
@@ -41,7 +41,8 @@ setuptools.setup(
         "attrs"
     ],
     extras_require={
-        'dev': ['mypy', 'flake8', 'coverage', 'twine', 'sphinx', 'pytest', 'pytest-cov']
+        'dev': ['mypy', 'flake8', 'coverage', 'twine', 'sphinx', 'pytest', 'pytest-cov'],
+        'numpy': ['numpy'],
     },
     entry_points={
         "console_scripts": [
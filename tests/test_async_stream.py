@@ -0,0 +1,185 @@
+import asyncio
+import socket
+import unittest
+
+from pyais.stream import AsyncTCPConnection, AsyncUDPReceiver, LineSplitter
+
+MESSAGES = [
+    b'!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07',
+    b'!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29',
+    b'!AIVDM,2,2,1,A,F@V@00000000000,2*35',
+    b'!AIVDM,1,1,,A,15NPOOPP00o?b=bE`UNv4?w428D;,0*24',
+]
+
+
+def free_port(kind=socket.SOCK_STREAM):
+    with socket.socket(socket.AF_INET, kind) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestLineSplitter(unittest.TestCase):
+
+    def test_keeps_partial_lines(self):
+        splitter = LineSplitter()
+        self.assertEqual(splitter.feed(b"foo\r\nba"), [b"foo"])
+        self.assertEqual(splitter.feed(b"r"), [])
+        self.assertEqual(splitter.feed(b"\r\n\r\nbaz\r\n"), [b"bar", b"baz"])
+        self.assertEqual(splitter.partial, b"")
+
+    def test_flush(self):
+        splitter = LineSplitter()
+        self.assertEqual(splitter.feed(b"foo\r\nbar"), [b"foo"])
+        self.assertEqual(splitter.flush(), [b"bar"])
+        self.assertEqual(splitter.flush(), [])
+        self.assertEqual(splitter.feed(b"baz\r\n"), [b"baz"])
+
+
+class TestAsyncTCPConnection(unittest.TestCase):
+
+    def test_stream(self):
+        async def serve(reader, writer):
+            # Send the data in small chunks, so that lines are split
+            data = b"\r\n".join(MESSAGES) + b"\r\n"
+            for i in range(0, len(data), 7):
+                writer.write(data[i:i + 7])
+                await writer.drain()
+            writer.close()
+
+        async def run():
+            port = free_port()
+            server = await asyncio.start_server(serve, "127.0.0.1", port)
+            async with server:
+                async with AsyncTCPConnection("127.0.0.1", port) as stream:
+                    return [msg.decode() async for msg in stream]
+
+        decoded = asyncio.run(run())
+        self.assertEqual([msg.msg_type for msg in decoded], [18, 5, 1])
+        self.assertEqual(decoded[1].shipname, "NORDIC HAMBURG")
+
+    def test_checksum_policy(self):
+        async def serve(reader, writer):
+            writer.write(b"\r\n".join(MESSAGES[:3] + [MESSAGES[3][:-1] + b"5"]) + b"\r\n")
+            await writer.drain()
+            writer.close()
+
+        async def run():
+            port = free_port()
+            server = await asyncio.start_server(serve, "127.0.0.1", port)
+            async with server:
+                async with AsyncTCPConnection("127.0.0.1", port, checksum="drop") as stream:
+                    return [msg async for msg in stream], stream.invalid_checksums
+
+        messages, invalid = asyncio.run(run())
+        self.assertEqual([msg.ais_id for msg in messages], [18, 5])
+        self.assertEqual(invalid, 1)
+
+    def test_multiplex(self):
+        async def serve(reader, writer):
+            writer.write(b"\r\n".join(MESSAGES) + b"\r\n")
+            await writer.drain()
+            writer.close()
+
+        async def consume(port):
+            # Connects on first iteration
+            stream = AsyncTCPConnection("127.0.0.1", port)
+            try:
+                return [msg async for msg in stream]
+            finally:
+                await stream.close()
+
+        async def run():
+            ports = [free_port() for _ in range(2)]
+            servers = [await asyncio.start_server(serve, "127.0.0.1", port) for port in ports]
+            try:
+                return await asyncio.gather(*(consume(port) for port in ports))
+            finally:
+                for server in servers:
+                    server.close()
+
+        results = asyncio.run(run())
+        self.assertEqual([len(messages) for messages in results], [3, 3])
+
+    def test_close_waits_until_the_connection_is_closed(self):
+        async def serve(reader, writer):
+            writer.write(MESSAGES[3] + b"\r\n")
+            await writer.drain()
+            await reader.read()
+            writer.close()
+
+        async def run():
+            port = free_port()
+            server = await asyncio.start_server(serve, "127.0.0.1", port)
+            async with server:
+                async with AsyncTCPConnection("127.0.0.1", port) as stream:
+                    async for msg in stream:
+                        break
+                    sock = stream._writer.get_extra_info("socket")
+                # The socket is only closed by the event loop after the transport was closed
+                return sock.fileno()
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(run(), 2)), -1)
+
+    def test_invalid_endpoint(self):
+        async def run():
+            async with AsyncTCPConnection("127.0.0.1", free_port()):
+                pass
+
+        with self.assertRaises(ConnectionRefusedError):
+            asyncio.run(run())
+
+
+class TestAsyncUDPReceiver(unittest.TestCase):
+
+    def test_stream(self):
+        async def run():
+            port = free_port(socket.SOCK_DGRAM)
+            async with AsyncUDPReceiver("127.0.0.1", port) as stream:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                    for msg in MESSAGES:
+                        sock.sendto(msg + b"\r\n", ("127.0.0.1", port))
+
+                received = []
+                async for msg in stream:
+                    received.append(msg.decode())
+                    if len(received) == 3:
+                        break
+                return received
+
+        decoded = asyncio.run(asyncio.wait_for(run(), 2))
+        self.assertEqual([msg.msg_type for msg in decoded], [18, 5, 1])
+
+    def test_datagrams_are_complete(self):
+        async def run():
+            port = free_port(socket.SOCK_DGRAM)
+            async with AsyncUDPReceiver("127.0.0.1", port) as stream:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                    # The trailing \r\n is optional and lines are never joined across datagrams
+                    sock.sendto(MESSAGES[1], ("127.0.0.1", port))
+                    sock.sendto(MESSAGES[3], ("127.0.0.1", port))
+
+                received = []
+                async for msg in stream:
+                    received.append(msg.raw)
+                    if len(received) == 2:
+                        break
+                return received
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(run(), 2)), [MESSAGES[1], MESSAGES[3]])
+
+    def test_drops_if_queue_is_full(self):
+        async def run():
+            port = free_port(socket.SOCK_DGRAM)
+            stream = AsyncUDPReceiver("127.0.0.1", port, max_queue=1)
+            await stream.connect()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                for msg in MESSAGES:
+                    sock.sendto(msg + b"\r\n", ("127.0.0.1", port))
+            # Give the event loop the chance to receive the datagrams
+            await asyncio.sleep(0.1)
+            await stream.close()
+            return stream, [msg async for msg in stream]
+
+        stream, received = asyncio.run(asyncio.wait_for(run(), 2))
+        self.assertGreater(stream.dropped, 0)
+        self.assertLessEqual(len(received), 1)
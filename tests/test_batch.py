@@ -0,0 +1,132 @@
+import math
+import pathlib
+import unittest
+from array import array
+
+from pyais import decode, decode_batch
+from pyais.encode import encode_dict
+from pyais.messages import MessageType1
+from pyais.stream import FileReaderStream
+
+
+class TestDecodeBatch(unittest.TestCase):
+    SAMPLE = pathlib.Path(__file__).parent.joinpath("nmea_data_sample.txt")
+
+    def test_same_values_as_asdict(self):
+        fields = ('mmsi', 'lat', 'lon', 'speed', 'course', 'heading', 'status', 'turn', 'accuracy', 'second')
+        with open(self.SAMPLE, "rb") as fd:
+            batch = decode_batch(fd.read().splitlines(), fields=fields)
+
+        expected = [
+            msg.decode().asdict(enum_as_int=True)
+            for msg in FileReaderStream(str(self.SAMPLE)) if msg.ais_id in (1, 2, 3, 18)
+        ]
+        self.assertEqual(len(batch), len(expected))
+
+        for row, values in enumerate(expected):
+            for name in ('msg_type',) + fields:
+                value = values.get(name)
+                if value is None:
+                    self.assertEqual(batch.valid[name][row], 0)
+                else:
+                    self.assertEqual(batch.valid[name][row], 1)
+                    self.assertEqual(batch[name][row], value)
+
+    def test_column_types(self):
+        batch = decode_batch([b"!AIVDM,1,1,,A,15NPOOPP00o?b=bE`UNv4?w428D;,0*24"], fields=('mmsi', 'lat', 'accuracy'))
+
+        self.assertIsInstance(batch["mmsi"], array)
+        self.assertEqual(batch["msg_type"].typecode, "q")
+        self.assertEqual(batch["mmsi"].typecode, "q")
+        self.assertEqual(batch["lat"].typecode, "d")
+        self.assertEqual(batch["accuracy"].typecode, "B")
+        self.assertEqual(list(batch["mmsi"]), [367533950])
+        self.assertEqual(list(batch["lat"]), [37.808418])
+
+    def test_skips_other_message_types_and_invalid_sentences(self):
+        batch = decode_batch([
+            "!AIVDM,1,1,,A,15NPOOPP00o?b=bE`UNv4?w428D;,0*24",
+            "!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+            "!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07",
+            "!AIVDM,2,2,1,A,F@V@00000000000,2*35",
+            "!AIVDM,1,1,,A,1,0*24",
+            "garbage",
+        ], msg_types=(1,))
+
+        self.assertEqual(list(batch["msg_type"]), [1, 1])
+        self.assertEqual(list(batch["mmsi"]), [367533950, 0])
+        self.assertEqual(list(batch.valid["mmsi"]), [1, 0])
+        self.assertTrue(math.isnan(batch["lat"][1]))
+
+    def test_skips_corrupted_payloads(self):
+        batch = decode_batch([
+            "!AIVDM,1,1,,A,15NPOOPP00o?b=bE`UNv4?w428D;,0*24",
+            "!AIVDM,1,1,,A,13HOI:0P0000VO!LCnHQKwvL05Ip,0*23",
+            "!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23",
+        ], msg_types=(1,))
+
+        self.assertEqual(list(batch["mmsi"]), [367533950, 227006760])
+
+    def test_message_types_with_variants(self):
+        sentences = [
+            *encode_dict({'type': 24, 'mmsi': 123, 'partno': 0, 'shipname': 'SHIP'}),
+            "!AIVDM,1,1,,B,H52KMeDU653hhhi0000000000000,0*1A",
+            # partno 3
+            "!AIVDM,1,1,,B,H52KMeLU653hhhi0000000000000,0*11",
+            *encode_dict({'type': 22, 'mmsi': 456, 'addressed': 1, 'dest1': 789}),
+            *encode_dict({'type': 22, 'mmsi': 457, 'addressed': 0, 'ne_lon': 8.5}),
+        ]
+        batch = decode_batch(sentences, msg_types=(22, 24), fields=('mmsi', 'partno', 'ship_type', 'dest1', 'ne_lon'))
+        expected = [decode(sentence).asdict(enum_as_int=True) for sentence in sentences if 'LU653' not in sentence]
+
+        self.assertEqual(list(batch["msg_type"]), [24, 24, 22, 22])
+        for name in ('mmsi', 'partno', 'ship_type', 'dest1', 'ne_lon'):
+            self.assertEqual(
+                [value if ok else None for value, ok in zip(batch[name], batch.valid[name])],
+                [values.get(name) for values in expected],
+            )
+
+    def test_unsupported_message_types(self):
+        with self.assertRaises(ValueError) as err:
+            decode_batch([], msg_types=(1, 99))
+        self.assertIn("99", str(err.exception))
+
+    def test_missing_fields_are_invalid(self):
+        batch = decode_batch([
+            "!AIVDM,1,1,,A,15NPOOPP00o?b=bE`UNv4?w428D;,0*24",
+            "!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+        ], fields=('mmsi', 'status'))
+
+        # Type 18 has no status
+        self.assertEqual(list(batch.valid["status"]), [1, 0])
+        self.assertEqual(list(batch["mmsi"]), [367533950, 272016100])
+
+    def test_invalid_fields(self):
+        with self.assertRaises(ValueError):
+            decode_batch([], fields=('foo',))
+        with self.assertRaises(ValueError):
+            decode_batch([], msg_types=(5,), fields=('shipname',))
+
+    def test_no_instances_are_created(self):
+        original = MessageType1.from_int
+        calls = []
+        MessageType1.from_int = classmethod(lambda cls, *args: calls.append(args))
+        try:
+            decode_batch(["!AIVDM,1,1,,A,15NPOOPP00o?b=bE`UNv4?w428D;,0*24"])
+        finally:
+            MessageType1.from_int = original
+        self.assertEqual(calls, [])
+
+    def test_to_numpy(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy is not installed")
+
+        batch = decode_batch([
+            "!AIVDM,1,1,,A,15NPOOPP00o?b=bE`UNv4?w428D;,0*24",
+            "!AIVDM,1,1,,A,1,0*24",
+        ])
+        arrays = batch.to_numpy()
+        self.assertEqual(arrays["mmsi"].tolist(), [367533950, None])
+        self.assertEqual(arrays["lat"].dtype.name, "float64")
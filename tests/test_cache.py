@@ -0,0 +1,77 @@
+import pathlib
+import unittest
+
+from pyais import PayloadCache
+from pyais.exceptions import UnknownMessageException
+from pyais.messages import NMEAMessage
+from pyais.stream import FileReaderStream
+
+
+class TestPayloadCache(unittest.TestCase):
+    SAMPLE = str(pathlib.Path(__file__).parent.joinpath("nmea_data_sample.txt").absolute())
+
+    def test_same_messages_as_decode(self):
+        cache = PayloadCache()
+        messages = list(FileReaderStream(self.SAMPLE))
+        expected = [msg.decode() for msg in messages]
+
+        # The second pass is served from the cache
+        for _ in range(2):
+            self.assertEqual([cache.decode(msg) for msg in messages], expected)
+
+        self.assertEqual(cache.misses, len(cache))
+        self.assertEqual(cache.hits + cache.misses, 2 * len(messages))
+        self.assertGreater(cache.hit_ratio, 0.5)
+
+    def test_results_are_independent(self):
+        cache = PayloadCache()
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23")
+
+        first = cache.decode(msg)
+        first.mmsi = 1
+        second = cache.decode(msg)
+        self.assertEqual(second, msg.decode())
+        self.assertIsNot(second, cache.decode(msg))
+
+    def test_lru_eviction(self):
+        a = NMEAMessage(b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23")
+        b = NMEAMessage(b"!AIVDM,1,1,,A,133sVfPP00PD>hRMDH@jNOvN20S8,0*7F")
+        c = NMEAMessage(b"!AIVDM,1,1,,B,100h00PP0@PHFV`Mg5gTH?vNPUIp,0*3B")
+
+        cache = PayloadCache(maxsize=2)
+        cache.decode(a)
+        cache.decode(b)
+        cache.decode(a)
+        # b is the least recently used payload
+        cache.decode(c)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+        cache.decode(a)
+        cache.decode(b)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses, cache.hit_ratio), (0, 0, 0, 0.0))
+
+    def test_fill_bits_are_part_of_the_key(self):
+        cache = PayloadCache()
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23")
+        padded = NMEAMessage(b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,2*21")
+
+        cache.decode(msg)
+        cache.decode(padded)
+        self.assertEqual(cache.misses, 2)
+
+    def test_errors_are_not_cached(self):
+        cache = PayloadCache()
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,W3HOI:0P0000VOHLCnHQKwvL05Ip,0*45")
+
+        for _ in range(2):
+            with self.assertRaises(UnknownMessageException):
+                cache.decode(msg)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            PayloadCache(maxsize=0)
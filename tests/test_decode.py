@@ -26,7 +26,9 @@ from pyais.messages import (MSG_CLASS, MessageType5, MessageType6,
                             MessageType26BroadcastUnstructured, from_turn,
                             to_turn)
 from pyais.stream import ByteStream
-from pyais.util import b64encode_str, bits2bytes, bytes2bits
+from pyais.util import (b64encode_str, bits2bytes, bytes2bits, decode_bin_as_ascii6,
+                        decode_int_as_ascii6, decode_into_bit_array, decode_into_int,
+                        int_to_bitarray, slice_int)
 
 
 def ensure_type_for_msg_dict(msg_dict: typing.Dict[str, typing.Any]) -> None:
@@ -1059,6 +1061,24 @@ class TestAIS(unittest.TestCase):
 
         self.assertEqual(decoded.mmsi, 1)
 
+    def test_compiled_decoder_equals_partial_decoder(self):
+        """The generated decoder must yield the same values as the generic decoder used for short messages"""
+        for cls in set(MSG_CLASS.values()):
+            if not cls.fields():
+                continue
+            width = sum(field.metadata['width'] for field in cls.fields())
+            for val in (0, (1 << width) - 1, int('10' * width, 2) >> width):
+                compiled = cls._compile_decoder()(val, width)
+                partial = cls._decode_partial(val, width)
+                self.assertEqual(compiled, partial)
+                self.assertEqual([type(v) for v in compiled.asdict().values()],
+                                 [type(v) for v in partial.asdict().values()])
+
+    def test_compiled_decoder_ignores_trailing_bits(self):
+        msg = decode(b"!AIVDM,1,1,,A,13RlIW?04F1beOVEFLB9bRvH0L0L,0*6C")
+        bits = NMEAMessage(b"!AIVDM,1,1,,A,13RlIW?04F1beOVEFLB9bRvH0L0L,0*6C").bit_array
+        self.assertEqual(MSG_CLASS[1].from_bitarray(bits + bytes2bits(b'\xff')), msg)
+
     def test_types_for_messages(self):
         """Make sure that the types are consistent for all messages"""
         types = {}
@@ -1113,6 +1133,64 @@ class TestAIS(unittest.TestCase):
         self.assertEqual(bytes2bits(b'\xff\xff\xff\xff\xff\xff\xff\xff').to01(), '1' * 64)
         self.assertEqual(bytes2bits(b'\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa').to01(), '10' * 32)
 
+    def test_decode_into_bit_array(self):
+        self.assertEqual(decode_into_bit_array(b'').to01(), '')
+        self.assertEqual(decode_into_bit_array(b'0').to01(), '000000')
+        self.assertEqual(decode_into_bit_array(b'w').to01(), '111111')
+        self.assertEqual(decode_into_bit_array(b'W`').to01(), '100111101000')
+        self.assertEqual(decode_into_bit_array(b'15M67').to01(), '000001000101011101000110000111')
+
+    def test_decode_into_bit_array_fill_bits(self):
+        self.assertEqual(decode_into_bit_array(b'w', 2).to01(), '1111')
+        self.assertEqual(decode_into_bit_array(b'0w', 5).to01(), '0000001')
+        self.assertEqual(len(decode_into_bit_array(b'88888888880', 2)), 64)
+
+    def test_decode_into_bit_array_invalid_char(self):
+        with self.assertRaises(ValueError) as err:
+            decode_into_bit_array(b'15M!67')
+        self.assertEqual(str(err.exception), 'Invalid character: !')
+
+        with self.assertRaises(ValueError):
+            decode_into_bit_array(b'15Mx')
+
+    def test_decode_into_int(self):
+        self.assertEqual(decode_into_int(b''), (0, 0))
+        self.assertEqual(decode_into_int(b'w'), (0b111111, 6))
+        self.assertEqual(decode_into_int(b'w', 2), (0b1111, 4))
+        self.assertEqual(decode_into_int(b'W`'), (0b100111101000, 12))
+
+        for payload, fill_bits in ((b'15M67FC000G?ufbE`FepT@3n00Sa', 0), (b'88888888880', 2)):
+            val, length = decode_into_int(payload, fill_bits)
+            self.assertEqual(int_to_bitarray(val, length), decode_into_bit_array(payload, fill_bits))
+
+        with self.assertRaises(ValueError):
+            decode_into_int(b'15M!67')
+
+    def test_slice_int(self):
+        val, length = 0b101101, 6
+        self.assertEqual(slice_int(val, length, 0, 6), 0b101101)
+        self.assertEqual(slice_int(val, length, 0, 2), 0b10)
+        self.assertEqual(slice_int(val, length, 4, 6), 0b01)
+        # Bits beyond the end are zero
+        self.assertEqual(slice_int(val, length, 5, 7), 0b10)
+        self.assertEqual(slice_int(val, length, 6, 8), 0)
+
+    def test_decode_int_as_ascii6(self):
+        for text in (b'85<<?PG?B<4Q', b'w', b'1', b'000000', b'55?MbV02;H;s<HtKR20EHE:0@T4@Dn2'):
+            val, length = decode_into_int(text)
+            for width in range(length + 1):
+                bits = decode_into_bit_array(text)[:width]
+                self.assertEqual(
+                    decode_int_as_ascii6(val >> (length - width), width),
+                    decode_bin_as_ascii6(bits)
+                )
+
+    def test_nmea_payload_int(self):
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,13RlIW?04F1beOVEFLB9bRvH0L0L,0*6C")
+        self.assertEqual(msg.bit_length, 168)
+        self.assertEqual(msg.payload_int, decode_into_int(msg.payload)[0])
+        self.assertEqual(msg.bit_array, decode_into_bit_array(msg.payload))
+
     def test_b64encode_str(self):
         in_val = b'\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa'
         cipher = b64encode_str(in_val)
@@ -1,10 +1,11 @@
 import unittest
+from contextlib import nullcontext
 
 import bitarray
 
-from pyais import encode_dict, encode_msg
+from pyais import encode_dict, encode_msg, encode_many
 from pyais.decode import decode
-from pyais.encode import data_to_payload, get_ais_type
+from pyais.encode import ais_to_nmea_0183, data_to_payload, get_ais_type
 from pyais.exceptions import UnknownPartNoException
 from pyais.messages import MessageType1, MessageType26BroadcastUnstructured, MessageType26AddressedUnstructured, \
     MessageType26BroadcastStructured, MessageType26AddressedStructured, MessageType25BroadcastUnstructured, \
@@ -12,9 +13,9 @@ from pyais.messages import MessageType1, MessageType26BroadcastUnstructured, Mes
     MessageType24PartB, MessageType24PartA, MessageType22Broadcast, MessageType22Addressed, MessageType27, \
     MessageType23, MessageType21, MessageType20, MessageType19, MessageType18, MessageType17, MessageType16, \
     MessageType15, MessageType4, MessageType5, MessageType6, MessageType7, MessageType8, MessageType2, MessageType3, \
-    MSG_CLASS
+    MSG_CLASS, NMEAMessage
 from pyais.util import decode_bin_as_ascii6, decode_into_bit_array, str_to_bin, int_to_bin, to_six_bit, encode_ascii_6, \
-    int_to_bytes, bits2bytes
+    int_to_bytes, bits2bytes, armor, str_to_int
 
 
 def test_widths():
@@ -217,6 +218,21 @@ def test_str_to_bin():
     assert len(string) == 96
 
 
+def test_str_to_int():
+    assert str_to_int("Hello", 5 * 6) == 0b001000000101001100001100001111
+    assert str_to_int("Hello World", 5 * 6) == 0b001000000101001100001100001111
+    assert str_to_int("Hello", 96) == 0b001000000101001100001100001111 << 66
+    assert str_to_int("", 0) == 0
+
+    for val, width in (("Hello World!", 120), ("@ ?_", 24), ("ä", 12), ("ıſ", 12)):
+        with unittest.TestCase().assertRaises(ValueError) if val == "ä" else nullcontext():
+            assert str_to_int(val, width) == int(str_to_bin(val, width).to01() or "0", 2)
+
+    with unittest.TestCase().assertRaises(ValueError) as err:
+        str_to_int("a{", 12)
+    assert str(err.exception) == "received char '{' that cant be encoded"
+
+
 def test_int_to_bin():
     num = int_to_bin(0, 10).to01()
     assert num == "0000000000"
@@ -1054,3 +1070,73 @@ def test_encode_ascii_6_bit():
     bit_arr = decode_into_bit_array(ascii6.encode())
     assert bit_arr.to01() == input_val
     assert decode_bin_as_ascii6(bit_arr) == "HELLO WORLD!"
+
+
+def test_armor():
+    assert armor(0, 0) == ("", 0)
+    assert armor(0b111111, 6) == ("w", 0)
+    assert armor(0b1, 1) == ("P", 5)
+    assert armor(int('001000000101001100001100001111100000010111001111010010001100000100100001', 2), 72) == ("85<<?PG?B<4Q", 0)
+
+    for length in range(0, 200, 7):
+        bits = bitarray.bitarray(('1011001' * 30)[:length])
+        assert armor(int(bits.to01() or "0", 2), length) == encode_ascii_6(bits)
+
+
+def test_to_int():
+    msg = MessageType1.create(mmsi=367533950, lat=37.8, lon=-122.4, speed=12.3, course=220.1)
+    val, length = msg.to_int()
+
+    assert length == 168
+    decoded = MessageType1.from_int(val, length)
+    assert (decoded.mmsi, decoded.lat, decoded.lon, decoded.speed, decoded.course) == (367533950, 37.8, -122.4, 12.3, 220.1)
+    assert decoded.to_int() == (val, length)
+    assert msg.to_bitarray().to01() == f"{val:0168b}"
+
+    # Fields that are None are omitted and values that are too large are clamped
+    msg = MessageType5.create(mmsi=123, shipname="EVER GIVEN", to_bow=1000, destination=None)
+    val, length = msg.to_int()
+    assert length == 424 - 120
+    assert msg.to_bitarray()[240:249].to01() == "111111111"
+
+    with unittest.TestCase().assertRaises(OverflowError):
+        MessageType1.create(mmsi=-1).to_int()
+
+
+def test_encode_many():
+    data = [
+        {'type': 1, 'mmsi': 367533950, 'lat': 37.8, 'lon': -122.4},
+        MessageType5.create(mmsi=123456, shipname="RMS Titanic", callsign="MGY", destination="NEW YORK"),
+        {'type': 18, 'mmsi': 123, 'speed': 10.5},
+    ]
+    encoded = encode_many(data, talker_id="AIVDM", radio_channel="B")
+
+    # Sentences are yielded lazily
+    assert next(encoded) == encode_dict(data[0], talker_id="AIVDM", radio_channel="B")[0]
+    assert list(encoded) == encode_msg(data[1], talker_id="AIVDM", radio_channel="B") + \
+        encode_dict(data[2], talker_id="AIVDM", radio_channel="B")
+
+    assert all(NMEAMessage(sentence.encode()).is_valid for sentence in encode_many(data))
+
+
+def test_encode_many_validates_arguments_eagerly():
+    with unittest.TestCase().assertRaises(ValueError):
+        encode_many([], talker_id="FOO")
+
+    with unittest.TestCase().assertRaises(ValueError):
+        encode_many([], radio_channel="C")
+
+    with unittest.TestCase().assertRaises(ValueError):
+        list(encode_many([{'type': 99}]))
+
+
+def test_ais_to_nmea_0183_seq_id():
+    payload = "55?MbV02;H;s<HtKR20EHE:0@T4@Dn2222222216L961O5Gf0NSQEp6ClRp888888888880"
+    sentences = ais_to_nmea_0183(payload, "AIVDM", "B", 2, seq_id=7)
+    assert [NMEAMessage(sentence.encode()).seq_id for sentence in sentences] == [7, 7]
+    assert all(NMEAMessage(sentence.encode()).is_valid for sentence in sentences)
+
+    # The sequential message id is only set for multipart messages
+    assert ais_to_nmea_0183("15M67FC000G?ufbE`FepT@3n00Sa", "AIVDM", "B", 0, seq_id=7) == [
+        "!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C"
+    ]
@@ -1,11 +1,15 @@
 import pathlib
+import tempfile
 import time
 import unittest
+import unittest.mock
 from unittest.case import skip
 
 from pyais.exceptions import UnknownMessageException
 from pyais.messages import NMEAMessage
-from pyais.stream import FileReaderStream, should_parse, IterMessages
+from pyais.stream import (
+    DuplicateFilter, FileReaderStream, FragmentBuffer, MmapFileStream, should_parse, IterMessages
+)
 
 
 class TestFileReaderStream(unittest.TestCase):
@@ -130,6 +134,194 @@ class TestFileReaderStream(unittest.TestCase):
         msgs = [b"!AIVDM,256,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23", ]
         self.assertEqual(len(list(IterMessages(msgs))), 0)
 
+    def test_fragment_buffer_assembles(self):
+        buffer = FragmentBuffer()
+        first = b"!AIVDM,2,1,4,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*08"
+        second = b"!AIVDM,2,2,4,A,000000000000000,2*20"
+
+        self.assertIsNone(buffer.add(NMEAMessage(first)))
+        self.assertEqual(len(buffer), 1)
+        assembled = buffer.add(NMEAMessage(second))
+        self.assertIsNotNone(assembled)
+        self.assertEqual(assembled.raw, first + b"\n" + second)
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.incomplete, 0)
+
+    def test_fragment_buffer_evicts_least_recently_updated(self):
+        buffer = FragmentBuffer(max_groups=2, max_age=None)
+        msgs = IterMessages([
+            b"!AIVDM,2,1,1,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*0D",
+            b"!AIVDM,2,1,2,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*0E",
+            b"!AIVDM,2,1,3,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*0F",
+            b"!AIVDM,2,2,1,A,000000000000000,2*25",
+            b"!AIVDM,2,2,3,A,000000000000000,2*27",
+        ], fragment_buffer=buffer)
+
+        output = list(msgs)
+        self.assertEqual(len(output), 1)
+        self.assertEqual(output[0].seq_id, 3)
+        # The first message was evicted by the third and its last fragment then evicted the second
+        self.assertEqual(buffer.evicted, 2)
+        self.assertEqual(buffer.incomplete, 2)
+        self.assertEqual(len(buffer), 1)
+
+    def test_fragment_buffer_evicts_old_groups(self):
+        buffer = FragmentBuffer(max_age=0.0)
+        buffer.add(NMEAMessage(b"!AIVDM,2,1,1,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*0D"))
+        time.sleep(0.01)
+        result = buffer.add(NMEAMessage(b"!AIVDM,2,2,1,A,000000000000000,2*25"))
+
+        self.assertIsNone(result)
+        self.assertEqual(buffer.evicted, 1)
+        self.assertEqual(buffer.incomplete, 1)
+
+    def test_fragment_buffer_replaces_group_with_other_fragment_count(self):
+        buffer = FragmentBuffer()
+        buffer.add(NMEAMessage(b"!AIVDM,3,1,1,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*0C"))
+        buffer.add(NMEAMessage(b"!AIVDM,2,1,1,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*0D"))
+        result = buffer.add(NMEAMessage(b"!AIVDM,2,2,1,A,000000000000000,2*25"))
+
+        self.assertIsNotNone(result)
+        self.assertEqual(buffer.incomplete, 1)
+        self.assertEqual(buffer.evicted, 0)
+
+    def test_fragment_buffer_invalid_max_groups(self):
+        with self.assertRaises(ValueError):
+            FragmentBuffer(max_groups=0)
+
+    def test_checksum_policies(self):
+        msgs = [
+            b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C",
+            b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5D",  # invalid
+            b"!AIVDM,2,1,4,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*08",
+            b"!AIVDM,2,2,4,A,H@V@00000000000,2*3F",  # invalid
+            b"!AIVDM,2,1,5,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*09",
+            b"!AIVDM,2,2,5,A,H@V@00000000000,2*3F",
+        ]
+
+        stream = IterMessages(msgs)
+        self.assertEqual(len(list(stream)), 4)
+        self.assertEqual(stream.invalid_checksums, 0)
+
+        # Invalid fragments are dropped before they reach the fragment buffer
+        stream = IterMessages(msgs, checksum="drop")
+        output = list(stream)
+        self.assertEqual([msg.seq_id for msg in output], [None, 5])
+        self.assertTrue(all(msg.is_valid for msg in output))
+        self.assertEqual(stream.invalid_checksums, 2)
+        self.assertEqual(len(stream.fragment_buffer), 1)
+
+        stream = IterMessages(msgs, checksum="flag")
+        output = list(stream)
+        self.assertEqual([msg.is_valid for msg in output], [True, False, False, True])
+        self.assertEqual(stream.invalid_checksums, 2)
+
+        with self.assertRaises(ValueError):
+            IterMessages(msgs, checksum="foo")
+
+    def test_duplicate_filter(self):
+        msgs = [
+            b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C",
+            # The same transmission from another receiver
+            b"!BSVDM,1,1,,A,15M67FC000G?ufbE`FepT@3n00Sa,0*46",
+            b"!AIVDM,2,1,4,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*08",
+            b"!AIVDM,2,1,7,B,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*08",
+            b"!AIVDM,2,2,4,A,H@V@00000000000,2*3E",
+            b"!AIVDM,2,2,7,B,H@V@00000000000,2*3E",
+            # Other fill bits
+            b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,2*5E",
+        ]
+
+        dedup = DuplicateFilter()
+        stream = IterMessages(msgs, duplicate_filter=dedup)
+        self.assertEqual([msg.seq_id for msg in stream], [None, 4, None])
+        self.assertEqual((dedup.received, dedup.duplicates, len(dedup)), (5, 2, 3))
+        self.assertEqual(dedup.ratio, 0.4)
+
+        dedup = DuplicateFilter(multipart=False)
+        stream = IterMessages(msgs, duplicate_filter=dedup)
+        self.assertEqual([msg.seq_id for msg in stream], [None, 4, 7, None])
+        self.assertEqual(dedup.ratio, 1 / 3)
+
+    def test_duplicate_filter_windows(self):
+        first = NMEAMessage(b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C")
+        second = NMEAMessage(b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23")
+        third = NMEAMessage(b"!AIVDM,1,1,,A,133sVfPP00PD>hRMDH@jNOvN20S8,0*7F")
+
+        # Count based: two sets of one payload
+        dedup = DuplicateFilter(window=None, max_entries=2, buckets=2)
+        self.assertEqual([dedup.is_duplicate(msg) for msg in (first, second, first, third, first)],
+                         [False, False, True, False, False])
+        self.assertEqual(len(dedup), 2)
+
+        # Time based
+        with unittest.mock.patch("pyais.stream.time.monotonic", return_value=100.0):
+            dedup = DuplicateFilter(window=2.0, buckets=2)
+            self.assertFalse(dedup.is_duplicate(first))
+        with unittest.mock.patch("pyais.stream.time.monotonic", return_value=101.5):
+            self.assertTrue(dedup.is_duplicate(first))
+            self.assertFalse(dedup.is_duplicate(second))
+        with unittest.mock.patch("pyais.stream.time.monotonic", return_value=102.5):
+            # first was received in the previous but one period
+            self.assertFalse(dedup.is_duplicate(first))
+            self.assertTrue(dedup.is_duplicate(second))
+        with unittest.mock.patch("pyais.stream.time.monotonic", return_value=110.0):
+            self.assertFalse(dedup.is_duplicate(first))
+            self.assertEqual(len(dedup), 1)
+
+        with self.assertRaises(ValueError):
+            DuplicateFilter(buckets=0)
+        with self.assertRaises(ValueError):
+            DuplicateFilter(max_entries=2, buckets=4)
+
+    def test_msg_types(self):
+        expected = [msg for msg in FileReaderStream(self.FILENAME) if msg.ais_id in (5, 24)]
+
+        stream = FileReaderStream(self.FILENAME, msg_types=(5, 24))
+        output = list(stream)
+        self.assertEqual([msg.raw for msg in output], [msg.raw for msg in expected])
+        self.assertGreater(stream.filtered, 0)
+        self.assertEqual(len(stream.fragment_buffer), 0)
+
+    def test_msg_types_skip_multipart_messages_without_buffering(self):
+        msgs = [
+            b"!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07",
+            b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+            b"!AIVDM,2,2,1,A,F@V@00000000000,2*35",
+            # The second fragment arrives before the first
+            b"!AIVDM,2,2,9,A,F@V@00000000000,2*3D",
+            b"!AIVDM,2,1,9,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*0F",
+        ]
+        buffer = FragmentBuffer()
+        stream = IterMessages(msgs, fragment_buffer=buffer, msg_types=[18])
+        self.assertEqual([msg.ais_id for msg in stream], [18])
+        self.assertEqual(stream.filtered, 3)
+        self.assertEqual(len(buffer), 0)
+
+        stream = IterMessages(msgs, msg_types=[5])
+        self.assertEqual([msg.ais_id for msg in stream], [5, 5])
+        self.assertEqual(stream.filtered, 1)
+
+    def test_mmsis(self):
+        msgs = [
+            b"!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07",
+            b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+            b"!AIVDM,2,2,1,A,F@V@00000000000,2*35",
+        ]
+        buffer = FragmentBuffer()
+        stream = IterMessages(msgs, fragment_buffer=buffer, mmsis={272016100, 123})
+        self.assertEqual([msg.decode().mmsi for msg in stream], [272016100])
+        self.assertEqual(stream.filtered, 2)
+        self.assertEqual(len(buffer), 0)
+
+        stream = IterMessages(msgs, mmsis={210035000})
+        self.assertEqual([msg.decode().mmsi for msg in stream], [210035000])
+        self.assertEqual(stream.filtered, 1)
+
+        # Both filters must match
+        stream = IterMessages(msgs, msg_types=[18], mmsis={210035000, 272016100})
+        self.assertEqual([msg.decode().mmsi for msg in stream], [272016100])
+
     def test_reader(self):
         with FileReaderStream(self.FILENAME) as stream:
             messages = [msg for msg in stream]
@@ -209,3 +401,67 @@ class TestFileReaderStream(unittest.TestCase):
         par_dir = pathlib.Path(__file__).parent.absolute()
         mixed_content_file = par_dir.joinpath("messages.ais")
         self.assertEqual(len(list(iter(FileReaderStream(mixed_content_file)))), 6)
+
+
+class TestMmapFileStream(unittest.TestCase):
+    SAMPLE = str(pathlib.Path(__file__).parent.joinpath("nmea_data_sample.txt").absolute())
+    MIXED = str(pathlib.Path(__file__).parent.joinpath("messages.ais").absolute())
+
+    def test_same_messages_as_file_reader(self):
+        for filename in (self.SAMPLE, self.MIXED):
+            with FileReaderStream(filename) as stream:
+                expected = [msg.raw for msg in stream]
+            with MmapFileStream(filename) as stream:
+                actual = [msg.raw for msg in stream]
+            self.assertEqual(expected, actual)
+
+    def test_offsets(self):
+        with MmapFileStream(self.SAMPLE) as stream:
+            messages = list(stream.iter_with_offsets())
+
+        with open(self.SAMPLE, "rb") as fd:
+            content = fd.read()
+
+        for offset, msg in messages[:50]:
+            # The offset points to the start of the line of the first fragment
+            self.assertTrue(content[offset:].startswith(msg.raw.split(b"\n")[0]))
+
+        # Resume at some offset
+        offset, msg = messages[100]
+        with MmapFileStream(self.SAMPLE, offset=offset) as stream:
+            resumed = list(stream.iter_with_offsets())
+        self.assertEqual([(o, m.raw) for o, m in messages[100:]], [(o, m.raw) for o, m in resumed])
+
+    def test_seek(self):
+        with MmapFileStream(self.SAMPLE) as stream:
+            first = next(iter(stream))
+            self.assertGreater(stream.offset, 0)
+            stream.seek(0)
+            self.assertEqual(next(iter(stream)).raw, first.raw)
+
+    def test_line_endings_and_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = str(pathlib.Path(tmp).joinpath("crlf.nmea"))
+            content = (
+                b"!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07\r\n"
+                b"# Not a NMEA sentence\r\n"
+                b"!AIVDM,2,2,1,A,F@V@00000000000,2*35\r\n"
+                b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29"
+            )
+            with open(filename, "wb") as fd:
+                fd.write(content)
+            with MmapFileStream(filename) as stream:
+                messages = list(stream.iter_with_offsets())
+
+            self.assertEqual([offset for offset, _ in messages], [0, content.index(b"!AIVDM,1,1")])
+            self.assertEqual(messages[0][1].decode().shipname, "NORDIC HAMBURG")
+            self.assertEqual(messages[1][1].decode().mmsi, 272016100)
+
+            empty = str(pathlib.Path(tmp).joinpath("empty.nmea"))
+            open(empty, "wb").close()
+            with MmapFileStream(empty) as stream:
+                self.assertEqual(list(stream), [])
+
+    def test_invalid_filename(self):
+        with self.assertRaises(FileNotFoundError):
+            MmapFileStream("does not exist")
@@ -0,0 +1,113 @@
+import io
+import re
+import socket
+import threading
+import unittest
+from collections import Counter
+
+from pyais.generator import ARMOR_CHARS, CorpusGenerator, send_tcp, send_udp, write_file
+from pyais.messages import NMEAMessage
+from pyais.stream import DuplicateFilter, IterMessages
+
+
+class TestCorpusGenerator(unittest.TestCase):
+
+    def test_deterministic(self):
+        first = list(CorpusGenerator(vessels=50, seed=7, duplicates=0.1, corruption=0.1).sentences(500))
+        second = list(CorpusGenerator(vessels=50, seed=7, duplicates=0.1, corruption=0.1).sentences(500))
+        other = list(CorpusGenerator(vessels=50, seed=8, duplicates=0.1, corruption=0.1).sentences(500))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_valid_messages_in_the_right_mix(self):
+        sentences = [s.encode() for s in CorpusGenerator(vessels=200, seed=1).sentences(5000)]
+        stream = IterMessages(sentences, checksum="flag")
+        messages = list(stream)
+
+        self.assertEqual(len(messages), 5000)
+        self.assertEqual(stream.invalid_checksums, 0)
+        self.assertEqual(len(stream.fragment_buffer), 0)
+
+        types = Counter(msg.ais_id for msg in messages)
+        self.assertEqual(set(types), {1, 3, 5, 18, 21, 24})
+        self.assertGreater(types[1], types[3])
+
+        decoded = [msg.decode() for msg in messages]
+        self.assertTrue(all(-90 <= msg.lat <= 90 for msg in decoded if msg.msg_type in (1, 3, 18)))
+        # Type 5 is sent as two sentences on both channels with rotating sequential message ids
+        multipart = [msg for msg in messages if not msg.is_single]
+        self.assertEqual({msg.channel for msg in multipart}, {'A', 'B'})
+        self.assertGreater(len({msg.seq_id for msg in multipart}), 5)
+
+    def test_mix(self):
+        sentences = [s.encode() for s in CorpusGenerator(vessels=10, mix={18: 1, 24: 1}).sentences(200)]
+        self.assertEqual({msg.ais_id for msg in IterMessages(sentences)}, {18, 24})
+
+        with self.assertRaises(ValueError):
+            CorpusGenerator(mix={1: 1, 8: 1})
+        with self.assertRaises(ValueError):
+            CorpusGenerator(duplicates=1.5)
+        # A single vessel is of class A, thus no class B messages can be generated
+        with self.assertRaises(ValueError):
+            CorpusGenerator(vessels=1, mix={18: 1})
+
+    def test_duplicates_and_corruption(self):
+        sentences = [s.encode() for s in CorpusGenerator(vessels=500, seed=2, duplicates=0.2, corruption=0.05).sentences(2000)]
+        dedup = DuplicateFilter()
+        stream = IterMessages(sentences, checksum="drop", duplicate_filter=dedup)
+        list(stream)
+        self.assertGreater(dedup.ratio, 0.1)
+        self.assertGreater(stream.invalid_checksums, 0)
+
+    def test_corrupted_payloads_only_have_invalid_checksums(self):
+        replaced = [
+            NMEAMessage(s.encode()) for s in CorpusGenerator(vessels=50, seed=6, mix={1: 1, 18: 1}, corruption=1.0).sentences(500)
+            if re.fullmatch(r'!AIVDM,\d,\d,\d?,[AB],[^,]+,\d\*[0-9A-F]{2}', s)
+        ]
+        self.assertGreater(len(replaced), 100)
+        for msg in replaced:
+            self.assertFalse(msg.is_valid)
+            self.assertLessEqual(set(msg.payload.decode()), set(ARMOR_CHARS))
+
+    def test_write_file(self):
+        fobj = io.StringIO()
+        written = write_file(CorpusGenerator(seed=3).sentences(100), fobj)
+        content = fobj.getvalue()
+        self.assertEqual(written, len(content))
+        self.assertEqual(content.split('\r\n')[:-1], list(CorpusGenerator(seed=3).sentences(100)))
+
+    def test_send_udp(self):
+        expected = list(CorpusGenerator(seed=4).sentences(20))
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+            server.bind(('127.0.0.1', 0))
+            server.settimeout(5)
+            sent = send_udp(expected, *server.getsockname())
+
+            received = b''
+            while len(received) < sent:
+                received += server.recv(4096)
+        self.assertEqual(received.decode().split('\r\n')[:-1], expected)
+
+    def test_send_tcp(self):
+        expected = list(CorpusGenerator(seed=5).sentences(1000))
+        received = []
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(('127.0.0.1', 0))
+            server.listen(1)
+
+            def receive():
+                conn, _ = server.accept()
+                with conn:
+                    while True:
+                        chunk = conn.recv(65536)
+                        if not chunk:
+                            return
+                        received.append(chunk)
+
+            thread = threading.Thread(target=receive)
+            thread.start()
+            send_tcp(expected, *server.getsockname())
+            thread.join(5)
+
+        self.assertEqual(b''.join(received).decode().split('\r\n')[:-1], expected)
@@ -1,3 +1,4 @@
+import io
 import types
 import unittest
 from typing import List
@@ -63,6 +64,30 @@ class TestGenericStream(unittest.TestCase):
         for msg in BinaryIOStream(mock_file):
             self.assertIsNotNone(msg.decode())
 
+    def test_line_endings(self):
+        """Both \n and \r\n line endings are supported - also mixed within the same file."""
+        file = io.BytesIO(
+            b"!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07\r\n"
+            b"!AIVDM,2,2,1,A,F@V@00000000000,2*35\n"
+            b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29\r\n"
+            b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29"
+        )
+        decoded = [msg.decode() for msg in BinaryIOStream(file)]
+
+        self.assertEqual(3, len(decoded))
+        self.assertEqual(decoded[0].shipname, "NORDIC HAMBURG")
+        self.assertEqual(decoded[1].mmsi, 272016100)
+        self.assertEqual(decoded[2].mmsi, 272016100)
+
+    def test_reads_lazily(self):
+        """The stream must yield the first message before the rest of the file is read."""
+        valid: bytes = b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29"
+        mock_file = MockFile([valid, valid, valid])
+        stream = iter(BinaryIOStream(mock_file))
+
+        self.assertEqual(next(stream).raw, valid)
+        self.assertEqual(len(mock_file.buffer), 2)
+
 
 class TestIterMessages(unittest.TestCase):
 
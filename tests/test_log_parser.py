@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from ais_db.create_ais_db import create_tables
+from ais_db.log_parser import BulkLoader, decode_line, parse_ais_file, parse_ais_file_bulk
+
+LOG = [
+    "!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23",
+    "!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+    "# comment",
+    # Fragments of a multipart message can not be decoded on their own
+    "!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07",
+    "!AIVDM,2,2,1,A,F@V@00000000000,2*35",
+    # Malformed: empty payload, invalid character and too few fields
+    "!AIVDM,1,1,,A,,0*26",
+    "!AIVDM,1,1,,A,13HOI:0P0000VO!LCnHQKwvL05Ip,0*23",
+    "!AIVDM,garbage",
+    "!AIVDM,1,1,,B,H52KMeDU653hhhi0000000000000,0*1A",
+    "!AIVDM,1,1,,A,403OviQuMGCqWrRO9>E6fE700@GO,0*4D",
+]
+
+TABLES = ('rawData', 'rawFields', 'classAPositionReport', 'classBPositionReport', 'baseStationReport',
+          'staticDataReport', 'staticDataReportA', 'staticDataReportB')
+
+
+class TestLogParser(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.nmea')
+        with os.fdopen(fd, 'w') as file:
+            file.write('\n'.join(LOG) + '\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def load(self, parse, *args):
+        con = sqlite3.connect(':memory:')
+        create_tables(con)
+        parse(con, self.path, *args)
+        return {table: con.execute(f'select * from {table}').fetchall() for table in TABLES}
+
+    def test_decode_line(self):
+        self.assertEqual(decode_line(LOG[0])[:2], (1, 0))
+        self.assertEqual(decode_line(LOG[3]), (5, 1, None))
+        self.assertEqual(decode_line(LOG[5]), (0, 1, None))
+        self.assertEqual(decode_line(LOG[6]), (1, 1, None))
+        self.assertEqual(decode_line(LOG[7]), (0, 1, None))
+
+    def test_bulk_writes_the_same_rows(self):
+        rows = self.load(parse_ais_file)
+        self.assertEqual([(row[1], row[4]) for row in rows['rawData']], [
+            (1, 0), (18, 0), (5, 1), (0, 1), (0, 1), (1, 1), (0, 1), (24, 0), (4, 0)
+        ])
+        self.assertEqual(len(rows['classAPositionReport']), 1)
+        self.assertEqual(len(rows['staticDataReportB']), 1)
+
+        for batch_size in (1, 4, 100):
+            self.assertEqual(self.load(parse_ais_file_bulk, batch_size), rows)
+
+    def test_bulk_does_not_flush_again_after_an_sql_error(self):
+        con = sqlite3.connect(':memory:')
+        create_tables(con)
+        # The fields are only written by flush(), so the first flush fails
+        con.execute('drop table rawFields')
+        calls = []
+        original = BulkLoader.flush
+
+        def flush(loader):
+            calls.append(len(loader.rows))
+            original(loader)
+
+        BulkLoader.flush = flush
+        try:
+            with self.assertRaises(SystemExit) as err:
+                parse_ais_file_bulk(con, self.path)
+        finally:
+            BulkLoader.flush = original
+        self.assertIn('bulk insert', str(err.exception))
+        self.assertEqual(len(calls), 1)
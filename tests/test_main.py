@@ -1,7 +1,8 @@
+import io
 import sys
 import unittest
 
-from pyais.main import decode_single, decode_from_file, arg_parser, decode_from_socket
+from pyais.main import decode_single, decode_from_file, arg_parser, decode_from_socket, generate
 
 
 class TestMainApp(unittest.TestCase):
@@ -25,6 +26,20 @@ class TestMainApp(unittest.TestCase):
 
         assert decode_single(DemoNamespace()) == 0
 
+    def test_decode_single_with_msg_types(self):
+        class DemoNamespace:
+            messages = [
+                '!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07',
+                '!AIVDM,2,2,1,A,F@V@00000000000,2*35',
+                '!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29',
+            ]
+            out_file = io.StringIO()
+            msg_types = {18}
+
+        assert decode_single(DemoNamespace()) == 0
+        assert DemoNamespace.out_file.getvalue().startswith("MessageType18(")
+        assert DemoNamespace.out_file.getvalue().count("\n") == 1
+
     def test_decode_from_file(self):
         class DemoNamespace:
             in_file = open("tests/ais_test_messages", "rb")
@@ -32,6 +47,33 @@ class TestMainApp(unittest.TestCase):
 
         assert decode_from_file(DemoNamespace()) == 0
 
+    def test_decode_from_file_with_jobs(self):
+        class DemoNamespace:
+            in_file = open("tests/ais_test_messages", "rb")
+            out_file = None
+            jobs = 2
+
+        assert decode_from_file(DemoNamespace()) == 0
+        assert DemoNamespace.in_file.closed
+
+    def test_generate(self):
+        class DemoNamespace:
+            count = 100
+            vessels = 10
+            seed = 1
+            duplicates = 0.0
+            corruption = 0.0
+            destination = None
+            out_file = io.StringIO()
+
+        assert generate(DemoNamespace()) == 0
+        lines = DemoNamespace.out_file.getvalue().split("\r\n")[:-1]
+        assert len(lines) > 100
+        assert all(line.startswith("!AIVDM,") for line in lines)
+
+        DemoNamespace.vessels = 0
+        assert generate(DemoNamespace()) == 1
+
     def test_parser(self):
         parser = arg_parser()
 
@@ -46,6 +88,19 @@ class TestMainApp(unittest.TestCase):
         assert ns.in_file.name == "tests/ais_test_messages"
         ns.in_file.close()
 
+        # Files are decoded by a single process by default
+        assert ns.jobs == 1
+        ns = parser.parse_args(["-f", "tests/ais_test_messages", "--jobs", "4"])
+        assert ns.jobs == 4
+        ns.in_file.close()
+
+        # All message types are decoded by default
+        assert ns.msg_types is None
+        ns = parser.parse_args(["--msg-types", "1,2,3,18", "single", "A"])
+        assert ns.msg_types == {1, 2, 3, 18}
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--msg-types", "1,foo"])
+
         # If the file does not exist an error is thrown
         with self.assertRaises(SystemExit):
             parser.parse_args(["-f", "invalid"])
@@ -60,6 +115,13 @@ class TestMainApp(unittest.TestCase):
         assert ns.func == decode_single
         assert ns.messages == ["A", "B", "C", "and more"]
 
+        # Synthetic traffic is written to the output file by default
+        ns = parser.parse_args(["generate", "-n", "50", "--seed", "3"])
+        assert ns.func == generate
+        assert (ns.count, ns.seed, ns.vessels, ns.destination) == (50, 3, 1000, None)
+        ns = parser.parse_args(["generate", "--destination", "localhost", "--port", "12345", "-t", "tcp"])
+        assert (ns.destination, ns.port, ns.type) == ("localhost", 12345, "tcp")
+
         # But if the user passes no messages an error is thrown
         with self.assertRaises(SystemExit):
             parser.parse_args(["single"])
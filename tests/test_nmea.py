@@ -4,8 +4,9 @@ from pprint import pprint
 from bitarray import bitarray
 
 from pyais.exceptions import InvalidNMEAMessageException
-from pyais.messages import NMEAMessage
-from pyais.util import chk_to_int
+from pyais.constants import TalkerID
+from pyais.messages import NMEAMessage, parse_sentence
+from pyais.util import chk_to_int, compute_checksum, decode_mmsi, xor_checksum
 
 
 class TestNMEA(unittest.TestCase):
@@ -123,10 +124,14 @@ class TestNMEA(unittest.TestCase):
                 return o.to01()
             return o
 
+        keys = (
+            'ais_id', 'raw', 'talker', 'type', 'frag_cnt', 'frag_num', 'seq_id',
+            'channel', 'payload', 'fill_bits', 'checksum', 'bit_array',
+        )
         expected = dict(
             [
-                (slot, serializable(getattr(msg, slot)))
-                for slot in NMEAMessage.__slots__
+                (key, serializable(getattr(msg, key)))
+                for key in keys
             ]
         )
 
@@ -192,7 +197,156 @@ class TestNMEA(unittest.TestCase):
         self.assertEqual(chk_to_int(b"1"), (1, -1))
         self.assertEqual(chk_to_int(b"5*"), (5, -1))
 
+    def test_mmsi(self):
+        with open("tests/ais_test_messages", "rb") as fd:
+            for line in fd:
+                if not line.startswith(b"!"):
+                    continue
+                msg = NMEAMessage(line.strip())
+                if msg.is_single:
+                    self.assertEqual(msg.mmsi, msg.decode().mmsi)
+
+        self.assertEqual(decode_mmsi(b"B43JRq00LhTWc5VejDI>wwWUoP06"), 272016100)
+        # Too short
+        self.assertIsNone(decode_mmsi(b"B43JRq"))
+        self.assertIsNone(decode_mmsi(b"B43JRq0", fill_bits=5))
+        self.assertEqual(decode_mmsi(b"B43JRq0", fill_bits=4), 272016100)
+        with self.assertRaises(ValueError):
+            decode_mmsi(b"B43JRq \x00")
+
+    def test_xor_checksum(self):
+        self.assertEqual(xor_checksum(b""), 0)
+        self.assertEqual(xor_checksum(b"A"), 0x41)
+        self.assertEqual(xor_checksum(b"AA"), 0)
+        self.assertEqual(xor_checksum(b"AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0"), 0x5C)
+
+        # Every length, including those that are not covered by the precomputed fold steps
+        data = bytes(range(256)) * 2
+        for length in range(len(data) + 1):
+            expected = 0
+            for byte in data[:length]:
+                expected ^= byte
+            self.assertEqual(xor_checksum(data[:length]), expected)
+
+    def test_compute_checksum(self):
+        self.assertEqual(compute_checksum(b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0"), 0x5C)
+        self.assertEqual(compute_checksum(b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C"), 0x5C)
+        self.assertEqual(compute_checksum("!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C"), 0x5C)
+
+    def test_is_valid(self):
+        self.assertFalse(NMEAMessage(b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5B").is_valid)
+        self.assertTrue(NMEAMessage(b"!AIVDM,1,1,,B,15M67FC000G?ufbE`FepT@3n00Sa,0*5C").is_valid)
+        self.assertFalse(NMEAMessage(b"!AIVDM,1,1,,A,100u3FP04r28t0<WcshcQI<H0H79,0").is_valid)
+
+        # An assembled message is valid, if all of its parts are valid
+        first = b"!AIVDM,2,1,4,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*08"
+        parts = [NMEAMessage(b"!AIVDM,2,2,4,A,H@V@00000000000,2*3E"), NMEAMessage(first)]
+        self.assertTrue(NMEAMessage.assemble_from_iterable(parts).is_valid)
+
+        parts = [NMEAMessage(first), NMEAMessage(b"!AIVDM,2,2,4,A,H@V@00000000000,2*5D")]
+        self.assertFalse(NMEAMessage.assemble_from_iterable(parts).is_valid)
+
+    def test_checksum_of_assembled_message_is_lazy(self):
+        first = b"!AIVDM,2,1,4,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*08"
+        parts = [NMEAMessage(first), NMEAMessage(b"!AIVDM,2,2,4,A,H@V@00000000000,2*5D")]
+        msg = NMEAMessage.assemble_from_iterable(parts)
+        self.assertIsNone(msg._valid)
+        self.assertFalse(msg.is_valid)
+
+        # Checksums that are already known are combined
+        parts = [NMEAMessage(first), NMEAMessage(b"!AIVDM,2,2,4,A,H@V@00000000000,2*3E")]
+        self.assertTrue(parts[0].is_valid and parts[1].is_valid)
+        self.assertTrue(NMEAMessage.assemble_from_iterable(parts)._valid)
+
+        parts = [NMEAMessage(first), NMEAMessage(b"!AIVDM,2,2,4,A,H@V@00000000000,2*5D")]
+        self.assertFalse(parts[1].is_valid)
+        self.assertIs(NMEAMessage.assemble_from_iterable(parts)._valid, False)
+
     def test_chk_to_int_with_missing_fill_bits(self):
         self.assertEqual(chk_to_int(b""), (0, -1))
         with self.assertRaises(ValueError):
             self.assertEqual(chk_to_int(b"*1B"), (0, 24))
+
+    def test_payload_is_decoded_lazily(self):
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,13RlIW?04F1beOVEFLB9bRvH0L0L,0*6C")
+        self.assertIsNone(msg._payload_int)
+
+        # The message type is taken from the first character
+        self.assertEqual(msg.ais_id, 1)
+        self.assertIsNone(msg._payload_int)
+
+        self.assertEqual(msg.bit_length, 168)
+        self.assertIsNotNone(msg._payload_int)
+
+    def test_ais_id_of_single_character_payload_with_fill_bits(self):
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,w,2*00")
+        self.assertEqual(msg.ais_id, 0b111100)
+        self.assertEqual(msg.bit_array.to01(), '1111')
+
+    def test_invalid_payload_character_raises_on_access(self):
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,1!RlIW?04F1beOVEFLB9bRvH0L0L,0*6C")
+        self.assertEqual(msg.ais_id, 1)
+        with self.assertRaises(ValueError):
+            msg.decode()
+
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,!3RlIW?04F1beOVEFLB9bRvH0L0L,0*6C")
+        with self.assertRaises(ValueError):
+            _ = msg.ais_id
+
+    def test_lazy_message_assembling(self):
+        multi = NMEAMessage.assemble_from_iterable(messages=[
+            NMEAMessage(b"!AIVDM,2,1,4,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*08"),
+            NMEAMessage(b"!AIVDM,2,2,4,A,000000000000000,2*20")
+        ])
+        self.assertEqual(multi.ais_id, 5)
+        self.assertEqual(multi.bit_length, 424)
+        self.assertEqual(multi.decode().mmsi, 368060190)
+
+    def test_parse_sentence(self):
+        sentence = parse_sentence(b"!AIVDM,2,1,4,A,55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000,0*08")
+        self.assertEqual(sentence.talker, TalkerID.Mobile_Station)
+        self.assertEqual(sentence.type, "VDM")
+        self.assertEqual(sentence.frag_cnt, 2)
+        self.assertEqual(sentence.frag_num, 1)
+        self.assertEqual(sentence.seq_id, 4)
+        self.assertEqual(sentence.channel, "A")
+        self.assertEqual(sentence.payload, b"55O0W7`00001L@gCWGA2uItLth@DqtL5@F22220j1h742t0Ht0000000")
+        self.assertEqual(sentence.fill_bits, 0)
+        self.assertEqual(sentence.checksum, 8)
+
+        sentence = parse_sentence(b"!XXVDO,1,1,,,B>qc:003wk?8mP=18D3Q3wgTiT;T,2*13")
+        self.assertEqual(sentence.talker, TalkerID.UNDEFINED)
+        self.assertEqual(sentence.type, "VDO")
+        self.assertIsNone(sentence.seq_id)
+        self.assertEqual(sentence.channel, "")
+        self.assertEqual(sentence.fill_bits, 2)
+
+    def test_parse_sentence_equals_nmea_message(self):
+        raw = b"!AIVDM,1,1,,B,91b55wi;hbOS@OdQAC062Ch2089h,0*30"
+        msg = NMEAMessage(raw)
+        self.assertEqual(
+            tuple(parse_sentence(raw)),
+            (msg.talker, msg.type, msg.frag_cnt, msg.frag_num, msg.seq_id, msg.channel, msg.payload,
+             msg.fill_bits, msg.checksum)
+        )
+
+    def test_parse_sentence_errors(self):
+        cases = {
+            b"!AIVDM,1,1,,A,91b77=h3h00nHt0Q3r@@07000<0b": "A NMEA message needs to have exactly 7 comma separated entries.",
+            b",1,1,,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69": "The NMEA message type is empty!",
+            b"!AIVDM,,1,,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69": "Number of sentences is empty!",
+            b"!AIVDM,1,,,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69": "Sentence number is empty!",
+            b"!AIVDM,1,1,,A,,0*69": "The NMEA message body (payload) is empty.",
+            b"!AIVDM,1,1,,A,91b77=h3h00nHt0Q3r@@07000<0b,": "NMEA checksum (NMEA 0183 Standard CRC16) is empty.",
+            b"!AIVDM,X,1,,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69": "Invalid sentence number. No Number.",
+            b"!AIVDM,256,1,,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69": "Number of sentences exceeds limit of 9 total sentences.",
+            b"!AIVDM,1,X,,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69": "Invalid Sentence number. No Number.",
+            b"!AIVDM,1,256,,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69": " Sentence number exceeds limit of 9 total sentences.",
+            b"!AIVDM,1,1,X,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69": "Invalid  sequential message ID. No Number.",
+            b"!AIVDM,1,1,256,A,91b77=h3h00nHt0Q3r@@07000<0b,0*69":
+                "Number of sequential message ID exceeds limit of 9 total sentences.",
+        }
+        for raw, err_msg in cases.items():
+            with self.assertRaises(InvalidNMEAMessageException) as err:
+                parse_sentence(raw)
+            self.assertEqual(str(err.exception), err_msg)
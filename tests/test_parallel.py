@@ -0,0 +1,108 @@
+import pathlib
+import tempfile
+import unittest
+
+from pyais.exceptions import UnknownPartNoException
+from pyais.parallel import ParallelFileDecoder
+from pyais.stream import DuplicateFilter, FileReaderStream
+
+
+class TestParallelFileDecoder(unittest.TestCase):
+    SAMPLE = str(pathlib.Path(__file__).parent.joinpath("nmea_data_sample.txt").absolute())
+
+    def sequential(self, filename):
+        return [msg.decode() for msg in FileReaderStream(filename)]
+
+    def test_shards_are_aligned_to_lines(self):
+        decoder = ParallelFileDecoder(self.SAMPLE, shard_size=1000)
+        shards = decoder.shards()
+
+        with open(self.SAMPLE, "rb") as fd:
+            content = fd.read()
+
+        self.assertEqual(shards[0][1], 0)
+        self.assertEqual(shards[-1][2], len(content))
+        for (_, _, end, _, _), (_, start, _, _, _) in zip(shards, shards[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(content[start - 1:start], b"\n")
+
+    def test_same_messages_as_sequential(self):
+        expected = self.sequential(self.SAMPLE)
+
+        self.assertEqual(list(ParallelFileDecoder(self.SAMPLE, jobs=1, shard_size=1000)), expected)
+        self.assertEqual(list(ParallelFileDecoder(self.SAMPLE, jobs=2, shard_size=5000)), expected)
+
+        unordered = list(ParallelFileDecoder(self.SAMPLE, jobs=2, ordered=False, shard_size=5000))
+        self.assertEqual(sorted(map(repr, unordered)), sorted(map(repr, expected)))
+
+    def test_multipart_messages_across_shards(self):
+        lines = [
+            b"!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07",
+            b"!AIVDM,2,2,1,A,F@V@00000000000,2*35",
+            b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+            b"!AIVDM,2,1,9,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*0F",
+            b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+            b"!AIVDM,2,2,9,A,F@V@00000000000,2*3D",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = str(pathlib.Path(tmp).joinpath("multipart.nmea"))
+            with open(filename, "wb") as fd:
+                fd.write(b"\r\n".join(lines))
+
+            # Every line is a shard of its own
+            decoder = ParallelFileDecoder(filename, jobs=1, shard_size=1)
+            self.assertEqual(len(decoder.shards()), len(lines))
+
+            decoded = list(decoder)
+            self.assertEqual(decoded, self.sequential(filename))
+            self.assertEqual([msg.msg_type for msg in decoded], [5, 18, 18, 5])
+
+    def test_stream_kwargs(self):
+        expected = [msg for msg in self.sequential(self.SAMPLE) if msg.msg_type in (5, 24)]
+
+        decoded = list(ParallelFileDecoder(self.SAMPLE, jobs=2, shard_size=5000, msg_types=(5, 24)))
+        self.assertEqual(decoded, expected)
+
+    def test_messages_that_can_not_be_decoded_are_skipped(self):
+        lines = [
+            b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+            # Type 24 with partno 3
+            b"!AIVDM,1,1,,B,H52KMeLU653hhhi0000000000000,0*11",
+            b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = str(pathlib.Path(tmp).joinpath("corrupted.nmea"))
+            with open(filename, "wb") as fd:
+                fd.write(b"\n".join(lines))
+
+            for jobs in (1, 2):
+                decoder = ParallelFileDecoder(filename, jobs=jobs, shard_size=1)
+                self.assertEqual([msg.msg_type for msg in decoder], [18, 1])
+                self.assertEqual([raw.strip() for raw, _ in decoder.errors], [lines[1]])
+                self.assertIsInstance(decoder.errors[0][1], UnknownPartNoException)
+
+    def test_duplicates_across_shards(self):
+        lines = [
+            b"!AIVDM,1,1,,B,B43JRq00LhTWc5VejDI>wwWUoP06,0*29",
+            b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23",
+            b"!AIVDM,1,1,,A,B43JRq00LhTWc5VejDI>wwWUoP06,0*2A",
+            b"!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07",
+            b"!AIVDM,2,2,1,A,F@V@00000000000,2*35",
+            b"!AIVDM,2,1,2,B,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07",
+            b"!AIVDM,2,2,2,B,F@V@00000000000,2*35",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = str(pathlib.Path(tmp).joinpath("duplicates.nmea"))
+            with open(filename, "wb") as fd:
+                fd.write(b"\n".join(lines))
+
+            for jobs, multipart in ((1, True), (2, True), (2, False)):
+                dedup = DuplicateFilter(window=None, multipart=multipart)
+                decoder = ParallelFileDecoder(filename, jobs=jobs, shard_size=1, duplicate_filter=dedup)
+                expected = [18, 1, 5] if multipart else [18, 1, 5, 5]
+                self.assertEqual([msg.msg_type for msg in decoder], expected)
+                self.assertEqual(dedup.duplicates, 2 if multipart else 1)
+
+    def test_invalid_filename(self):
+        with self.assertRaises(FileNotFoundError):
+            ParallelFileDecoder("does not exist")
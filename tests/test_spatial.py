@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from pyais.messages import MessageType1, MessageType27
+from pyais.spatial import GridIndex, haversine
+
+
+class TestGridIndex(unittest.TestCase):
+
+    def random_index(self, count, cell_size=1.0):
+        rnd = random.Random(42)
+        index = GridIndex(cell_size=cell_size)
+        positions = {}
+        for mmsi in range(count):
+            lat, lon = rnd.uniform(-90, 90), rnd.uniform(-180, 180)
+            index.update(mmsi, lat, lon)
+            positions[mmsi] = (lat, lon)
+        return index, positions
+
+    def test_haversine(self):
+        self.assertAlmostEqual(haversine(0, 0, 1, 0), 60.04, places=2)
+        self.assertAlmostEqual(haversine(0, 179.5, 0, -179.5), 60.04, places=2)
+        self.assertAlmostEqual(haversine(53.5, 8.1, 53.5, 8.1), 0.0)
+
+    def test_bbox_same_as_brute_force(self):
+        index, positions = self.random_index(5000, cell_size=2.0)
+        boxes = [
+            (-10, -10, 10, 10),
+            (40, 100, 60, 140),
+            (-90, -180, 90, 180),
+            # Crosses the antimeridian
+            (-30, 170, 30, -170),
+            (80, 0, 90, 0.5),
+        ]
+        for lat_min, lon_min, lat_max, lon_max in boxes:
+            crosses = lon_min > lon_max
+            expected = sorted(
+                mmsi for mmsi, (lat, lon) in positions.items()
+                if lat_min <= lat <= lat_max and (
+                    (lon >= lon_min or lon <= lon_max) if crosses else lon_min <= lon <= lon_max
+                )
+            )
+            self.assertEqual(sorted(index.bbox(lat_min, lon_min, lat_max, lon_max)), expected)
+
+    def test_radius_same_as_brute_force(self):
+        index, positions = self.random_index(5000)
+        queries = [(0, 0, 300), (53.5, 8.1, 600), (0, 179.9, 500), (88, 45, 300), (-89.5, -100, 100), (10, 10, 12000)]
+        for lat, lon, radius in queries:
+            expected = sorted(
+                (haversine(lat, lon, p_lat, p_lon), mmsi) for mmsi, (p_lat, p_lon) in positions.items()
+                if haversine(lat, lon, p_lat, p_lon) <= radius
+            )
+            nearby = index.nearby(lat, lon, radius)
+            self.assertEqual([mmsi for mmsi, _ in nearby], [mmsi for _, mmsi in expected])
+            self.assertEqual(index.within(lat, lon, radius), [mmsi for _, mmsi in expected])
+
+    def test_antimeridian_with_partial_last_column(self):
+        # Neither cell size divides 360
+        for cell_size in (0.7, 7.3):
+            index = GridIndex(cell_size=cell_size)
+            index.update(1, 0, -179.9)
+            index.update(2, 0, 179.9)
+            index.update(3, 0, -170)
+            self.assertEqual(index.within(0, 179.9, 30), [2, 1])
+            self.assertEqual(index.within(0, -179.9, 30), [1, 2])
+            self.assertEqual(index.within(0, 178, 800), [2, 1, 3])
+            self.assertEqual(sorted(index.bbox(-5, 175, 5, -165)), [1, 2, 3])
+
+            index, positions = self.random_index(3000, cell_size=cell_size)
+            for lat, lon, radius in [(0, 179.9, 300), (0, -179.9, 300), (40, 178, 700), (-20, -175, 1000)]:
+                expected = sorted(
+                    mmsi for mmsi, (p_lat, p_lon) in positions.items() if haversine(lat, lon, p_lat, p_lon) <= radius
+                )
+                self.assertEqual(sorted(index.within(lat, lon, radius)), expected)
+
+    def test_updates_move_positions(self):
+        index = GridIndex()
+        index.update(1, 53.5, 8.1)
+        index.update(2, 53.6, 8.2)
+        self.assertEqual(index.within(53.5, 8.1, 20), [1, 2])
+
+        index.update(1, 10.0, 10.0)
+        self.assertEqual(index.within(53.5, 8.1, 20), [2])
+        self.assertEqual(index.within(10.0, 10.0, 1), [1])
+        self.assertEqual(index.get(1), (10.0, 10.0))
+
+        index.remove(1)
+        index.remove(1)
+        self.assertNotIn(1, index)
+        self.assertIsNone(index.get(1))
+        self.assertEqual(len(index), 1)
+        self.assertEqual(len(index._cells), 1)
+
+    def test_update_from(self):
+        index = GridIndex()
+        self.assertTrue(index.update_from(MessageType1.create(mmsi=123, lat=53.5, lon=8.1)))
+        self.assertTrue(index.update_from(MessageType27.create(mmsi=456, lat=53.5, lon=8.2)))
+        # Position not available
+        self.assertFalse(index.update_from(MessageType1.create(mmsi=789, lat=91, lon=181)))
+        self.assertEqual(sorted(index.bbox(53, 8, 54, 9)), [123, 456])
+
+    def test_invalid_cell_size(self):
+        with self.assertRaises(ValueError):
+            GridIndex(cell_size=0)
@@ -0,0 +1,124 @@
+import pathlib
+import unittest
+
+from pyais import VesselTracker
+from pyais.constants import NavigationStatus
+from pyais.messages import MessageType1, MessageType9, NMEAMessage
+from pyais.spatial import GridIndex
+from pyais.stream import FileReaderStream
+from pyais.tracker import Vessel
+
+
+class TestVesselTracker(unittest.TestCase):
+    SAMPLE = str(pathlib.Path(__file__).parent.joinpath("nmea_data_sample.txt").absolute())
+
+    def test_position_and_static_data_are_merged(self):
+        tracker = VesselTracker()
+        position = NMEAMessage(b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23").decode()
+
+        vessel = tracker.update(position, timestamp=10.0)
+        self.assertIs(tracker[position.mmsi], vessel)
+        self.assertEqual((vessel.lat, vessel.lon, vessel.speed), (position.lat, position.lon, position.speed))
+        self.assertEqual(vessel.status, position.status)
+        self.assertIsNone(vessel.shipname)
+        self.assertEqual((vessel.last_seen, vessel.position_time), (10.0, 10.0))
+
+        static = NMEAMessage.assemble_from_iterable([
+            NMEAMessage(b"!AIVDM,2,1,1,A,538CQ>02A;h?D9QC800pu8@T>0P4l9E8L0000017Ah:;;5r50Ahm5;C0,0*07"),
+            NMEAMessage(b"!AIVDM,2,2,1,A,F@V@00000000000,2*35"),
+        ]).decode()
+        vessel = tracker.update(static, timestamp=20.0)
+        self.assertEqual((vessel.mmsi, vessel.shipname, vessel.callsign), (static.mmsi, static.shipname, static.callsign))
+        self.assertEqual((vessel.last_seen, vessel.position_time), (20.0, None))
+        self.assertEqual(len(tracker), 2)
+
+    def test_consume_stream(self):
+        tracker = VesselTracker(ttl=None)
+        messages = list(FileReaderStream(self.SAMPLE))
+        tracker.consume(messages)
+
+        # The last position of every vessel wins
+        expected = {}
+        for msg in messages:
+            if msg.ais_id in (1, 2, 3, 9, 18, 19, 27):
+                decoded = msg.decode()
+                expected[decoded.mmsi] = (decoded.lat, decoded.lon)
+
+        self.assertGreater(len(expected), 0)
+        for mmsi, position in expected.items():
+            self.assertEqual((tracker[mmsi].lat, tracker[mmsi].lon), position)
+
+    def test_corrupted_messages_are_skipped(self):
+        tracker = VesselTracker(ttl=None)
+        tracker.consume(NMEAMessage(line) for line in [
+            b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23",
+            # Type 24 with partno 3
+            b"!AIVDM,1,1,,B,H52KMeLU653hhhi0000000000000,0*11",
+            # Invalid character
+            b"!AIVDM,1,1,,A,13HOI:0P0000VO!LCnHQKwvL05Ip,0*23",
+            b"!AIVDM,1,1,,A,133sVfPP00PD>hRMDH@jNOvN20S8,0*7F",
+        ])
+        self.assertEqual([vessel.mmsi for vessel in tracker], [227006760, 205448890])
+
+    def test_other_message_types_are_ignored(self):
+        tracker = VesselTracker()
+        base_station = NMEAMessage(b"!AIVDM,1,1,,A,403OviQuMGCqWrRO9>E6fE700@GO,0*4D").decode()
+        self.assertIsNone(tracker.update(base_station))
+        self.assertEqual(len(tracker), 0)
+
+    def test_ttl(self):
+        tracker = VesselTracker(ttl=60.0)
+        first = NMEAMessage(b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23").decode()
+        second = NMEAMessage(b"!AIVDM,1,1,,A,133sVfPP00PD>hRMDH@jNOvN20S8,0*7F").decode()
+
+        tracker.update(first, timestamp=0.0)
+        tracker.update(second, timestamp=30.0)
+        # first is seen again and is now the most recent vessel
+        tracker.update(first, timestamp=50.0)
+        self.assertEqual(tracker.expire(now=100.0), 1)
+        self.assertEqual([vessel.mmsi for vessel in tracker], [first.mmsi])
+
+        tracker.update(second, timestamp=200.0)
+        self.assertEqual([vessel.mmsi for vessel in tracker], [second.mmsi])
+        self.assertEqual(tracker.expired, 2)
+        self.assertNotIn(first.mmsi, tracker)
+        self.assertIsNone(tracker.get(first.mmsi))
+
+    def test_index(self):
+        tracker = VesselTracker(ttl=60.0, index=GridIndex())
+        tracker.update(MessageType1.create(mmsi=1, lat=53.5, lon=8.1), timestamp=0.0)
+        tracker.update(MessageType1.create(mmsi=2, lat=53.6, lon=8.2), timestamp=10.0)
+        tracker.update(MessageType1.create(mmsi=3, lat=53.6, lon=8.2), timestamp=10.0)
+        self.assertEqual(tracker.index.within(53.5, 8.1, 20), [1, 2, 3])
+
+        # The position of 3 is not available anymore
+        tracker.update(MessageType1.create(mmsi=3, lat=91, lon=181), timestamp=20.0)
+        self.assertEqual(tracker.index.within(53.5, 8.1, 20), [1, 2])
+
+        # 1 expires
+        tracker.update(MessageType1.create(mmsi=2, lat=53.5, lon=8.1), timestamp=61.0)
+        self.assertEqual(tracker.index.within(53.5, 8.1, 20), [2])
+        self.assertEqual(len(tracker.index), 1)
+
+    def test_sar_aircraft_are_indexed(self):
+        tracker = VesselTracker(index=GridIndex())
+        msg = MessageType9.create(mmsi=111232511, lat=53.5, lon=8.1, alt=300, speed=120)
+        vessel = tracker.update(msg, timestamp=0.0)
+
+        self.assertEqual((vessel.lat, vessel.lon, vessel.speed, vessel.position_time), (53.5, 8.1, 120, 0.0))
+        self.assertEqual(tracker.index.within(53.5, 8.1, 1), [111232511])
+
+    def test_snapshot(self):
+        tracker = VesselTracker()
+        msg = NMEAMessage(b"!AIVDM,1,1,,A,13HOI:0P0000VOHLCnHQKwvL05Ip,0*23").decode()
+        tracker.update(msg, timestamp=1.0)
+
+        snapshot = tracker.snapshot()
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot[0]['mmsi'], msg.mmsi)
+        self.assertEqual(snapshot[0]['lat'], msg.lat)
+        self.assertIsInstance(snapshot[0]['status'], NavigationStatus)
+        self.assertEqual(set(snapshot[0]), set(Vessel.__slots__))
+
+        snapshot = tracker.snapshot(enum_as_int=True)
+        self.assertIs(type(snapshot[0]['status']), int)
@@ -0,0 +1,100 @@
+import pathlib
+import unittest
+
+from pyais import decode_batch
+from pyais.encode import encode_dict
+from pyais.messages import NMEAMessage
+from pyais.stream import FileReaderStream
+
+try:
+    import numpy as np
+    from pyais.vectorized import decode_payloads, extract_bits, unarmor
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestVectorized(unittest.TestCase):
+    SAMPLE = pathlib.Path(__file__).parent.joinpath("nmea_data_sample.txt")
+
+    def test_unarmor(self):
+        values, ok = unarmor([b"0Ww", b"1", b"0!"])
+
+        self.assertEqual(values.shape, (3, 3))
+        self.assertEqual(values[0].tolist(), [0, 39, 63])
+        self.assertEqual(values[1].tolist(), [1, 0, 0])
+        self.assertEqual(ok.tolist(), [True, True, False])
+
+    def test_extract_bits(self):
+        values, _ = unarmor([b"15NPOOPP00o?b=bE`UNv4?w428D;", b"w"])
+
+        self.assertEqual(extract_bits(values[:1], 0, 6).tolist(), [1])
+        self.assertEqual(extract_bits(values[:1], 8, 30).tolist(), [367533950])
+        self.assertEqual(extract_bits(values[1:], 0, 6).tolist(), [63])
+        self.assertEqual(extract_bits(values[1:], 1, 3, signed=True).tolist(), [-1])
+
+        with self.assertRaises(ValueError):
+            extract_bits(values, 0, 58)
+
+    def test_same_values_as_decode_batch(self):
+        msg_types = (1, 2, 3, 18, 19)
+        fields = ('mmsi', 'lat', 'lon', 'speed', 'course', 'heading', 'status', 'turn', 'accuracy', 'second')
+        with open(self.SAMPLE, "rb") as fd:
+            expected = decode_batch(fd.read().splitlines(), msg_types=msg_types, fields=fields).to_numpy()
+
+        messages = list(FileReaderStream(str(self.SAMPLE)))
+        arrays = decode_payloads(
+            [msg.payload for msg in messages], [msg.fill_bits for msg in messages], msg_types, fields
+        )
+
+        self.assertEqual(arrays.keys(), expected.keys())
+        for name, column in expected.items():
+            self.assertEqual(arrays[name].dtype, column.dtype, name)
+            self.assertEqual(arrays[name].mask.tolist(), column.mask.tolist(), name)
+            self.assertEqual(arrays[name].compressed().tolist(), column.compressed().tolist(), name)
+
+    def test_skips_other_message_types_and_invalid_payloads(self):
+        arrays = decode_payloads([
+            b"15NPOOPP00o?b=bE`UNv4?w428D;",  # type 1
+            b"55?MbV02;H;s<HtKR20EHE:0@T4@Dn2222222216L961O5Gf0NSQEp6ClRp8",  # type 5
+            b"15NPOOPP00o?b=bE`UNv4?w428D!",  # invalid character
+            b"",
+        ])
+
+        self.assertEqual(arrays["msg_type"].tolist(), [1])
+        self.assertEqual(arrays["mmsi"].tolist(), [367533950])
+
+    def test_message_types_with_variants(self):
+        sentences = [
+            *encode_dict({'type': 24, 'mmsi': 123, 'partno': 0, 'shipname': 'SHIP'}),
+            "!AIVDM,1,1,,B,H52KMeDU653hhhi0000000000000,0*1A",
+            # partno 3
+            "!AIVDM,1,1,,B,H52KMeLU653hhhi0000000000000,0*11",
+            *encode_dict({'type': 22, 'mmsi': 456, 'addressed': 1, 'dest1': 789}),
+            *encode_dict({'type': 22, 'mmsi': 457, 'addressed': 0, 'ne_lon': 8.5}),
+        ]
+        fields = ('mmsi', 'partno', 'ship_type', 'dest1', 'ne_lon')
+        messages = [NMEAMessage(sentence.encode()) for sentence in sentences]
+        arrays = decode_payloads([msg.payload for msg in messages], [msg.fill_bits for msg in messages],
+                                 msg_types=(22, 24), fields=fields)
+        expected = decode_batch(sentences, msg_types=(22, 24), fields=fields).to_numpy()
+
+        self.assertEqual(arrays["msg_type"].tolist(), [24, 24, 22, 22])
+        for name in fields:
+            self.assertEqual(arrays[name].tolist(), expected[name].tolist())
+
+    def test_short_payloads(self):
+        # Only the first 40 bits: the MMSI is present, the position is missing
+        arrays = decode_payloads([b"15NPOOP"], [2], fields=('mmsi', 'lat'))
+
+        self.assertEqual(arrays["mmsi"].tolist(), [367533950])
+        self.assertTrue(arrays["lat"].mask[0])
+
+    def test_fill_bits(self):
+        # The MMSI ends at bit 38. With 4 fill bits only 38 bits remain.
+        self.assertFalse(decode_payloads([b"15NPOOP"], [4], fields=('mmsi',))["mmsi"].mask[0])
+        self.assertTrue(decode_payloads([b"15NPOOP"], [5], fields=('mmsi',))["mmsi"].mask[0])
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            decode_payloads([], fields=('foo',))